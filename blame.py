@@ -5,10 +5,25 @@ import sys
 import subprocess
 import json
 import re
+import hashlib
+import pickle
+import sqlite3
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Set
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Set, Iterable, Iterator, Tuple
+from concurrent.futures import ProcessPoolExecutor
 import multiprocessing
+from collections import Counter
+from functools import lru_cache
+
+try:
+    import pygit2  # optional: in-process blame without a git subprocess per file
+except ImportError:
+    pygit2 = None
+
+try:
+    import orjson  # optional: faster JSON parsing and encoding
+except ImportError:
+    orjson = None
 
 # -----------------------------
 # Argument parsing
@@ -57,7 +72,7 @@ def parse_args() -> argparse.Namespace:
         "--parallel",
         dest="parallel",
         action="store_true",
-        help="Enable parallel processing of repositories for improved performance",
+        help="Blame files in parallel using one worker pool shared by all repositories",
     )
     parser.add_argument(
         "--max-workers",
@@ -66,6 +81,18 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Maximum number of parallel workers (default: auto-detect based on CPU cores)",
     )
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Blame every file again instead of reusing stats/repos/<repo>/blame/.cache.sqlite from earlier runs",
+    )
+    parser.add_argument(
+        "--write-commit-graph",
+        dest="write_commit_graph",
+        action="store_true",
+        help="Write/refresh each repo's commit-graph (with changed-path filters) before blaming to speed up git blame",
+    )
     return parser.parse_args()
 
 
@@ -74,14 +101,41 @@ def parse_args() -> argparse.Namespace:
 # -----------------------------
 
 
+# One pass replaces every run of non [a-z0-9] characters (dashes included)
+# with a single dash, so no separate dash-collapsing pass is needed.
+SLUG_INVALID_RE = re.compile(r"[^a-z0-9]+")
+
+
 def slugify(text: str) -> str:
     """Make a filesystem-safe, lowercase slug from a string."""
-    text = (text or "").strip().lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = re.sub(r"-+", "-", text).strip("-")
+    text = SLUG_INVALID_RE.sub("-", (text or "").lower()).strip("-")
     return text or "unknown"
 
 
+def read_json_file(path: str) -> Any:
+    """Parse a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json_file(path: str, data: Any) -> None:
+    """
+    Write data as indented JSON, encoded by orjson when it is installed.
+
+    The document is encoded up front and handed to a single write(), rather
+    than streamed through json.dump's many small buffered writes.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
 def ensure_repo_blame_output_folder(output_root: str, repo_rel_path: str) -> str:
     """
     Create folder structure:
@@ -96,16 +150,31 @@ def discover_local_repos(root: str) -> List[str]:
     """
     Recursively find all directories under 'root' that contain a .git folder.
     Returns paths relative to root, like: 'owner/repo' or 'repo'.
+
+    Uses os.scandir and stops descending once a repo is found, so nothing
+    inside a repo (its .git objects or nested checkouts) is listed. Hidden
+    directories are skipped.
     """
     if not os.path.isdir(root):
         return []
 
     found: List[str] = []
-    for dirpath, dirnames, _filenames in os.walk(root):
-        if ".git" in dirnames:
+    pending = [root]
+    while pending:
+        dirpath = pending.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                subdirs = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            continue
+
+        if any(entry.name == ".git" for entry in subdirs):
             rel = os.path.relpath(dirpath, root)
             rel = rel.replace("\\", "/")  # Windows-safe path format
             found.append(rel)
+            continue
+
+        pending.extend(entry.path for entry in subdirs if not entry.name.startswith("."))
     return found
 
 
@@ -127,8 +196,7 @@ def load_aliases(alias_path: str = "configuration/alias.json") -> Dict[str, str]
         return {}
 
     try:
-        with open(alias_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json_file(alias_path)
     except Exception as e:
         print(f"WARNING: Failed to load alias file '{alias_path}': {e}", file=sys.stderr)
         return {}
@@ -219,8 +287,7 @@ def load_services_config(services_path: str) -> Dict[str, Dict[str, list]]:
         return {}
 
     try:
-        with open(services_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json_file(services_path)
     except Exception as e:
         print(f"WARNING: Failed to load services file '{services_path}': {e}", file=sys.stderr)
         return {}
@@ -255,11 +322,12 @@ def default_service_name_for_repo(repo_rel_path: str) -> str:
     return repo_rel_path.strip("/").split("/")[-1] or "unknown-service"
 
 
-def get_service_for_path(
-    repo_rel_path: str,
-    file_path: str,
-    services_config: Dict[str, Dict[str, list]],
-) -> str:
+def normalize_service_path(path: str) -> str:
+    """Normalize a file path or service prefix the same way for matching."""
+    return str(path).replace("\\", "/").lstrip("./")
+
+
+class ServiceResolver:
     """
     Decide which service a file belongs to, based on services_config.
 
@@ -271,46 +339,69 @@ def get_service_for_path(
       - If repo is NOT in services_config:
           * Treat the entire repo as a single service:
                 default_service_name_for_repo(repo_rel_path)
-    """
-    mapping = services_config.get(repo_rel_path)
-    norm = file_path.replace("\\", "/").lstrip("./")
-
-    if not mapping:
-        return default_service_name_for_repo(repo_rel_path)
 
-    best_service: Optional[str] = None
-    best_len = -1
+    The prefixes are normalized once per repo into a dict keyed by
+    "dir/" prefix, so a lookup only probes the parent directories of the
+    file. Files in the same directory share a service, so results are
+    memoized per directory.
+    """
 
-    for svc_name, prefixes in mapping.items():
-        for raw_prefix in prefixes:
-            pnorm = str(raw_prefix).replace("\\", "/").lstrip("./")
-            if pnorm in ("", "."):
-                # catch-all prefix
-                match = True
-                plen = 0
-            else:
-                if not pnorm.endswith("/"):
+    def __init__(self, repo_rel_path: str, services_config: Dict[str, Dict[str, list]]) -> None:
+        self.default_service = default_service_name_for_repo(repo_rel_path)
+        # normalized "dir/" prefix ("" for catch-all) -> service; first service wins ties
+        self.prefixes: Dict[str, str] = {}
+        for svc_name, prefixes in (services_config.get(repo_rel_path) or {}).items():
+            for raw_prefix in prefixes:
+                pnorm = normalize_service_path(raw_prefix)
+                if pnorm in ("", "."):
+                    pnorm = ""
+                elif not pnorm.endswith("/"):
                     pnorm = pnorm + "/"
-                if norm.startswith(pnorm):
-                    match = True
-                    plen = len(pnorm)
-                else:
-                    match = False
-
-            if match and plen > best_len:
-                best_len = plen
-                best_service = svc_name
-
-    if best_service is not None:
-        return best_service
-
-    # Fallback: single-service repo name
-    return default_service_name_for_repo(repo_rel_path)
-
-
+                self.prefixes.setdefault(pnorm, svc_name)
+        self._dir_cache: Dict[str, str] = {}
+
+        # Repo not configured, or configured with only a catch-all: every
+        # file maps to the same service and no lookup is needed.
+        self.singleton: Optional[str] = None
+        if not self.prefixes.keys() - {""}:
+            self.singleton = self.prefixes.get("", self.default_service)
+
+    def service_for(self, file_path: str) -> str:
+        if self.singleton is not None:
+            return self.singleton
+
+        norm = normalize_service_path(file_path)
+        end = norm.rfind("/") + 1
+        if end == 0:
+            # Top-level file: only the catch-all can match
+            return self.prefixes.get("", self.default_service)
+        directory = norm[:end]
+
+        service = self._dir_cache.get(directory)
+        if service is not None:
+            return service
+
+        service = self.default_service
+        # Probe "a/b/", then "a/", then the catch-all ""
+        while True:
+            match = self.prefixes.get(norm[:end])
+            if match is not None:
+                service = match
+                break
+            if end == 0:
+                break
+            end = norm.rfind("/", 0, end - 1) + 1
+
+        self._dir_cache[directory] = service
+        return service
+
+
+@lru_cache(maxsize=65536)
 def author_slug_from_name_email(name: str, email: str) -> str:
     """
     Build a base slug from author email (local-part) or name, then slugify.
+
+    Memoized: the same author shows up in many hunks and files.
     """
     if email:
         base = email.split("@")[0]
@@ -332,80 +423,21 @@ def canonical_slug_for_author(name: str, email: str, alias_map: Dict[str, str])
 # -----------------------------
 
 
-def ensure_service_entry(repo_data: Dict[str, Any], service_name: str) -> Dict[str, Any]:
-    """
-    Ensure the data structure for a given service exists inside repo_data.
+def new_repo_data(repo_rel_path: str) -> Dict[str, Any]:
     """
-    if "services" not in repo_data:
-        repo_data["services"] = {}
-    services = repo_data["services"]
-    if service_name not in services:
-        services[service_name] = {
-            "total_lines": 0,
-            "developers": {},
-        }
-    return services[service_name]
-
+    Create the accumulator for one repo.
 
-def ensure_service_dev(
-    svc_data: Dict[str, Any],
-    canonical_slug: str,
-    display_name: str,
-    email: str,
-) -> Dict[str, Any]:
-    """
-    Ensure a developer stats record within a service.
-    """
-    devs = svc_data.setdefault("developers", {})
-    if canonical_slug not in devs:
-        devs[canonical_slug] = {
-            "slug": canonical_slug,
-            "display_name": display_name,
-            "emails": set(),  # will turn into list later
-            "lines": 0,
-        }
-    dev = devs[canonical_slug]
-    if email:
-        dev["emails"].add(email)
-    if display_name and not dev.get("display_name"):
-        dev["display_name"] = display_name
-    return dev
-
-
-def ensure_repo_dev(
-    repo_data: Dict[str, Any],
-    canonical_slug: str,
-    display_name: str,
-    email: str,
-) -> Dict[str, Any]:
+    While blaming, ownership is tallied in a single flat counter keyed by
+    (service, slug); finalize_repo_data() derives the service totals and the
+    repo-level developers from it when building the nested structure that
+    ends up in blame.json.
     """
-    Ensure a developer stats record at the repo level.
-    """
-    devs = repo_data.setdefault("developers", {})
-    if canonical_slug not in devs:
-        devs[canonical_slug] = {
-            "slug": canonical_slug,
-            "display_name": display_name,
-            "emails": set(),
-            "lines": 0,
-            "services": {},  # service_name -> {"lines": ...}
-        }
-    dev = devs[canonical_slug]
-    if email:
-        dev["emails"].add(email)
-    if display_name and not dev.get("display_name"):
-        dev["display_name"] = display_name
-    return dev
-
-
-def ensure_repo_dev_service_entry(dev: Dict[str, Any], service_name: str) -> Dict[str, Any]:
-    """
-    Ensure that a repo-level dev has a per-service entry.
-    """
-    services = dev.setdefault("services", {})
-    if service_name not in services:
-        services[service_name] = {"lines": 0}
-    return services[service_name]
+    return {
+        "repo": repo_rel_path,
+        "total_lines": 0,
+        "svc_dev_lines": Counter(),  # (service, slug) -> lines
+        "dev_meta": {},  # (service, slug) -> (display_name, set of emails)
+    }
 
 
 def pick_top_developer_by_lines(devs: Dict[str, Any], total_lines: int) -> Optional[Dict[str, Any]]:
@@ -440,27 +472,60 @@ def pick_top_developer_by_lines(devs: Dict[str, Any], total_lines: int) -> Optio
 
 def finalize_repo_data(repo_data: Dict[str, Any]) -> None:
     """
-    Convert internal sets to lists and compute top_developer per service
-    and overall for the repo based on blame line counts.
-    """
-    # Per-service: finalize emails + top_developer
-    for svc_name, svc_data in repo_data.get("services", {}).items():
-        devs = svc_data.get("developers", {})
-        for d in devs.values():
-            if isinstance(d.get("emails"), set):
-                d["emails"] = sorted(d["emails"])
-        total_lines = svc_data.get("total_lines", 0)
-        top = pick_top_developer_by_lines(devs, total_lines)
+    Fold the (service, slug) counter into per-service and repo-level
+    developer records (emails as sorted lists) and compute top_developer per
+    service and overall for the repo based on blame line counts.
+
+    Service totals and repo-level developer lines are summed here in one
+    pass; first-seen order of services and developers is preserved.
+    """
+    svc_dev_lines = repo_data.pop("svc_dev_lines")
+    dev_meta = repo_data.pop("dev_meta")
+
+    services: Dict[str, Any] = {}
+    developers: Dict[str, Any] = {}
+
+    for (svc_name, slug), lines in svc_dev_lines.items():
+        display_name, emails = dev_meta[(svc_name, slug)]
+
+        svc_data = services.get(svc_name)
+        if svc_data is None:
+            svc_data = services[svc_name] = {"total_lines": 0, "developers": {}}
+        svc_data["total_lines"] += lines
+        svc_data["developers"][slug] = {
+            "slug": slug,
+            "display_name": display_name,
+            "emails": sorted(emails),
+            "lines": lines,
+        }
+
+        dev = developers.get(slug)
+        if dev is None:
+            dev = developers[slug] = {
+                "slug": slug,
+                "display_name": display_name,
+                "emails": set(),
+                "lines": 0,
+                "services": {},
+            }
+        dev["lines"] += lines
+        dev["emails"].update(emails)
+        dev["services"][svc_name] = {"lines": lines}
+
+    for dev in developers.values():
+        dev["emails"] = sorted(dev["emails"])
+
+    # Per-service top_developer
+    for svc_data in services.values():
+        top = pick_top_developer_by_lines(svc_data["developers"], svc_data["total_lines"])
         if top is not None:
             svc_data["top_developer"] = top
 
-    # Repo-level: finalize emails + per-service lines, plus top_developer
-    for dev in repo_data.get("developers", {}).values():
-        if isinstance(dev.get("emails"), set):
-            dev["emails"] = sorted(dev["emails"])
+    repo_data["services"] = services
+    repo_data["developers"] = developers
 
     total_repo_lines = repo_data.get("total_lines", 0)
-    repo_top = pick_top_developer_by_lines(repo_data.get("developers", {}), total_repo_lines)
+    repo_top = pick_top_developer_by_lines(developers, total_repo_lines)
     if repo_top is not None:
         repo_data["top_developer"] = repo_top
 
@@ -469,17 +534,27 @@ def finalize_repo_data(repo_data: Dict[str, Any]) -> None:
 # Core blame analysis
 # -----------------------------
 
+# Hunk header of `git blame --incremental`: <sha> <orig-line> <final-line> <count>
+INCREMENTAL_HUNK_RE = re.compile(rb"^([0-9a-f]{40,64}) \d+ \d+ (\d+)$")
+
 
 def get_tracked_files(repo_path: str) -> List[str]:
     """
-    Use `git ls-files` to get a list of tracked files in the repo.
+    Use `git ls-files -z` to get a list of tracked files in the repo.
+
+    NUL-separated output keeps names with spaces, newlines or non-ASCII
+    characters intact (git would otherwise quote them). Names are decoded
+    with os.fsdecode so they round-trip back to the same bytes.
+
+    Paths come straight from the index, so callers do not stat them again;
+    a file missing from the working tree simply yields no blame.
     """
-    cmd = ["git", "-C", repo_path, "ls-files"]
+    cmd = ["git", "-C", repo_path, "ls-files", "-z", "--cached", "--full-name"]
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
+            text=False,
             check=False,
         )
     except FileNotFoundError:
@@ -489,135 +564,531 @@ def get_tracked_files(repo_path: str) -> List[str]:
     if result.returncode != 0:
         print(f"    ! git ls-files failed in {repo_path}")
         if result.stderr:
-            print(f"      stderr: {result.stderr.strip()}")
+            print(f"      stderr: {result.stderr.decode('utf-8', errors='replace').strip()}")
         return []
 
-    files = [line.strip() for line in (result.stdout or "").splitlines() if line.strip()]
-    return files
+    return [os.fsdecode(name) for name in (result.stdout or b"").split(b"\x00") if name]
 
 
-def analyze_file_blame(
-    repo_rel_path: str,
-    repo_path: str,
-    file_path: str,
-    repo_data: Dict[str, Any],
-    alias_map: Dict[str, str],
-    services_config: Dict[str, Dict[str, list]],
-    ignored_slugs: Set[str],
-) -> None:
+def commit_graph_is_stale(repo_path: str) -> bool:
+    """
+    True when .git has no commit-graph or the refs moved after it was written
+    (judged by the mtimes of HEAD, the branch it points to, packed-refs and
+    FETCH_HEAD/ORIG_HEAD).
     """
-    Run git blame on a single file and update repo_data with line ownership.
+    git_dir = os.path.join(repo_path, ".git")
+    info_dir = os.path.join(git_dir, "objects", "info")
+    graph_mtime = None
+    for graph in (
+        os.path.join(info_dir, "commit-graph"),
+        os.path.join(info_dir, "commit-graphs", "commit-graph-chain"),
+    ):
+        try:
+            graph_mtime = max(graph_mtime or 0.0, os.stat(graph).st_mtime)
+        except OSError:
+            pass
+    if graph_mtime is None:
+        return True
+
+    ref_files = ["HEAD", "packed-refs", "FETCH_HEAD", "ORIG_HEAD"]
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "r", encoding="utf-8") as f:
+            head = f.read().strip()
+        if head.startswith("ref: "):
+            ref_files.append(head[len("ref: "):])
+    except OSError:
+        pass
+
+    for ref in ref_files:
+        try:
+            if os.stat(os.path.join(git_dir, ref)).st_mtime > graph_mtime:
+                return True
+        except OSError:
+            continue
+    return False
 
-    Uses git blame --line-porcelain and parses author / author-mail per block.
 
-    IMPORTANT: We run subprocess in binary mode and decode with 'utf-8' + errors='replace'
-    to avoid UnicodeDecodeError on non-UTF8 content.
+def ensure_commit_graph(repo_path: str) -> None:
+    """
+    Write the commit-graph with changed-path Bloom filters when missing or
+    stale. git blame then skips parsing commit headers and diffing trees
+    for commits that did not touch the blamed path.
     """
-    full_path = os.path.join(repo_path, file_path)
-    if not os.path.exists(full_path):
+    if not commit_graph_is_stale(repo_path):
         return
 
-    cmd = [
-        "git",
-        "-C",
-        repo_path,
-        "blame",
-        "--line-porcelain",
-        "--",
-        file_path,
-    ]
+    cmd = ["git", "-C", repo_path, "commit-graph", "write", "--reachable", "--changed-paths"]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        print("ERROR: git command not found. Make sure git is installed and in PATH.", file=sys.stderr)
+        sys.exit(1)
 
+    if result.returncode != 0:
+        print(f"    ! git commit-graph write failed in {repo_path}")
+        if result.stderr:
+            print(f"      stderr: {result.stderr.strip()}")
+    else:
+        print("     Wrote commit-graph")
+
+
+# Files whose blame says nothing about code ownership: binaries, media,
+# lock files and minified bundles. Matched case-insensitively on the suffix.
+SKIP_BLAME_SUFFIXES = (
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp", ".svg",
+    ".pdf", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".jar", ".war",
+    ".class", ".so", ".dll", ".dylib", ".exe", ".o", ".a", ".pyc",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot", ".mp3", ".mp4", ".mov",
+    ".lock", ".min.js", ".min.css", ".map",
+)
+SKIP_BLAME_FILENAMES = frozenset({
+    "package-lock.json", "yarn.lock", "pnpm-lock.yaml", "composer.lock", "go.sum",
+})
+# Directory names holding third-party or build output, at any depth
+SKIP_BLAME_DIRS = frozenset({"vendor", "node_modules", "third_party", "dist"})
+# .gitattributes that mark a file as not worth blaming
+SKIP_BLAME_ATTRIBUTES = ("linguist-generated", "linguist-vendored", "binary")
+
+
+def get_skip_attributes(repo_path: str, files: List[str]) -> Dict[str, bool]:
+    """
+    Read SKIP_BLAME_ATTRIBUTES for all files with one `git check-attr --stdin` call.
+
+    Returns path -> True when any attribute is set, False when one is
+    explicitly unset/false (which overrides the path heuristics), and no
+    entry when none is specified.
+    """
+    cmd = ["git", "-C", repo_path, "check-attr", "--stdin", "-z", *SKIP_BLAME_ATTRIBUTES]
     try:
         result = subprocess.run(
             cmd,
+            input=b"\x00".join(os.fsencode(f) for f in files) + b"\x00",
             capture_output=True,
-            text=False,  # binary mode
             check=False,
-            timeout=300  # 5 minute timeout for individual file blame
         )
-    except subprocess.TimeoutExpired:
-        print(f"WARNING: git blame timed out for {file_path}, skipping...", file=sys.stderr)
-        return
     except FileNotFoundError:
         print("ERROR: git command not found. Make sure git is installed and in PATH.", file=sys.stderr)
         sys.exit(1)
 
     if result.returncode != 0:
-        # Could be a binary file or something odd; skip it.
-        return
+        return {}
 
-    # Decode safely to avoid UnicodeDecodeError
-    try:
-        stdout = (result.stdout or b"").decode("utf-8", errors="replace")
-    except Exception:
-        # If decoding really fails, skip file
-        return
+    decisions: Dict[str, bool] = {}
+    fields = (result.stdout or b"").split(b"\x00")
+    # Output is "<path>\0<attribute>\0<value>\0" per file and attribute
+    for i in range(0, len(fields) - 2, 3):
+        value = fields[i + 2]
+        if value in (b"set", b"true"):
+            decisions[os.fsdecode(fields[i])] = True
+        elif value in (b"unset", b"false"):
+            decisions.setdefault(os.fsdecode(fields[i]), False)
+    return decisions
 
-    if not stdout.strip():
-        return
 
-    current_author_name: Optional[str] = None
-    current_author_email: Optional[str] = None
-    current_canonical_slug: Optional[str] = None
-    current_ignored: bool = False
+def filter_blame_files(repo_path: str, files: List[str]) -> List[str]:
+    """
+    Drop binary, vendored and generated files, which would only add noise
+    (and git blame calls) to the ownership numbers.
+    """
+    attributes = get_skip_attributes(repo_path, files)
+
+    kept: List[str] = []
+    for f in files:
+        decision = attributes.get(f)
+        if decision is not None:
+            if not decision:
+                kept.append(f)
+            continue
 
-    # Determine service once per file
-    service_name = get_service_for_path(repo_rel_path, file_path, services_config)
+        lower = f.lower()
+        parts = lower.split("/")
+        if lower.endswith(SKIP_BLAME_SUFFIXES) or parts[-1] in SKIP_BLAME_FILENAMES:
+            continue
+        if any(part in SKIP_BLAME_DIRS for part in parts[:-1]):
+            continue
+        kept.append(f)
+    return kept
+
+
+def get_head_blob_shas(repo_path: str) -> Dict[str, str]:
+    """
+    Use `git ls-tree -r -z HEAD` to map each file path in HEAD to its blob sha.
+    """
+    cmd = ["git", "-C", repo_path, "ls-tree", "-r", "-z", "--full-tree", "HEAD"]
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=False,
+            check=False,
+        )
+    except FileNotFoundError:
+        print("ERROR: git command not found. Make sure git is installed and in PATH.", file=sys.stderr)
+        sys.exit(1)
 
-    for line in stdout.splitlines():
-        # Porcelain blame metadata lines
-        if line.startswith("author "):
-            current_author_name = line[len("author "):].strip()
+    if result.returncode != 0:
+        return {}
+
+    blobs: Dict[str, str] = {}
+    for entry in (result.stdout or b"").split(b"\x00"):
+        # "<mode> <type> <sha>\t<path>"
+        meta, sep, path = entry.partition(b"\t")
+        if not sep:
             continue
+        parts = meta.split(b" ")
+        if len(parts) == 3 and parts[1] == b"blob":
+            blobs[os.fsdecode(path)] = parts[2].decode("ascii")
+    return blobs
+
 
-        if line.startswith("author-mail "):
-            mail = line[len("author-mail "):].strip()
-            if mail.startswith("<") and mail.endswith(">"):
-                mail = mail[1:-1]
-            current_author_email = mail
+def get_head_commit(repo_path: str) -> Optional[str]:
+    """Return the commit id HEAD points to, or None for an empty repo."""
+    cmd = ["git", "-C", repo_path, "rev-parse", "--verify", "-q", "HEAD^{commit}"]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        print("ERROR: git command not found. Make sure git is installed and in PATH.", file=sys.stderr)
+        sys.exit(1)
+
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def is_ancestor_commit(repo_path: str, ancestor: str, commit: str) -> bool:
+    """
+    True if ancestor is reachable from commit (`git merge-base --is-ancestor`).
+    An unknown ancestor, e.g. one dropped by a force push, counts as False.
+    """
+    cmd = ["git", "-C", repo_path, "merge-base", "--is-ancestor", ancestor, commit]
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=False)
+    except FileNotFoundError:
+        print("ERROR: git command not found. Make sure git is installed and in PATH.", file=sys.stderr)
+        sys.exit(1)
+    return result.returncode == 0
 
-            canonical = canonical_slug_for_author(
-                current_author_name or "",
-                current_author_email or "",
-                alias_map,
+
+class BlameCache:
+    """
+    Per-repo on-disk cache of analyze_file_blame results, kept next to
+    blame.json in .cache.sqlite and keyed by (file path, blob sha).
+
+    A file whose blob did not change since the last run is not blamed again.
+    Results depend on aliases, ignored users, the repo's services and its
+    .mailmap, so the whole cache is dropped when their fingerprint
+    (config_key) changes. The HEAD the entries were computed at is kept as
+    well: if it is no longer an ancestor of the current HEAD (force push,
+    rebase) the history behind an unchanged blob may differ, so the cache
+    is dropped too.
+    """
+
+    VERSION = "2"
+
+    def __init__(self, cache_path: str, config_key: str, repo_path: str, head_commit: Optional[str]) -> None:
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS blame (path TEXT PRIMARY KEY, blob TEXT, result BLOB)"
+        )
+        config_key = f"{self.VERSION}:{config_key}"
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        previous_head = meta.get("head")
+        if meta.get("config") != config_key:
+            self.conn.execute("DELETE FROM blame")
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('config', ?)", (config_key,))
+        elif (
+            previous_head is not None
+            and head_commit is not None
+            and previous_head != head_commit
+            and not is_ancestor_commit(repo_path, previous_head, head_commit)
+        ):
+            print("     History was rewritten since the last run, dropping cached blame")
+            self.conn.execute("DELETE FROM blame")
+        if head_commit is not None:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('head', ?)", (head_commit,))
+        self.entries: Dict[str, Tuple[str, bytes]] = {
+            path: (blob, result) for path, blob, result in self.conn.execute("SELECT path, blob, result FROM blame")
+        }
+
+    def get(self, file_path: str, blob_sha: Optional[str]) -> Optional[Tuple[str, Dict[str, Tuple[int, str, Set[str]]]]]:
+        entry = self.entries.get(file_path)
+        if entry is None or blob_sha is None or entry[0] != blob_sha:
+            return None
+        return pickle.loads(entry[1])
+
+    def put(
+        self,
+        file_path: str,
+        blob_sha: Optional[str],
+        file_result: Tuple[str, Dict[str, Tuple[int, str, Set[str]]]],
+    ) -> None:
+        if blob_sha is None:
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO blame (path, blob, result) VALUES (?, ?, ?)",
+            (file_path, blob_sha, pickle.dumps(file_result, protocol=pickle.HIGHEST_PROTOCOL)),
+        )
+
+    def close(self, tracked_files: List[str]) -> None:
+        """Drop entries of files that are no longer tracked and persist."""
+        stale = set(self.entries) - set(tracked_files)
+        self.conn.executemany("DELETE FROM blame WHERE path = ?", ((p,) for p in stale))
+        self.conn.commit()
+        self.conn.close()
+
+
+def blame_config_key(
+    repo_rel_path: str,
+    alias_map: Dict[str, str],
+    services_config: Dict[str, Dict[str, list]],
+    ignored_slugs: Set[str],
+    mailmap_blob: Optional[str] = None,
+) -> str:
+    """
+    Fingerprint of the configuration a repo's blame results depend on,
+    including the blob sha of the repo's .mailmap in HEAD.
+    """
+    payload = json.dumps(
+        [alias_map, sorted(ignored_slugs), services_config.get(repo_rel_path), mailmap_blob],
+        sort_keys=True,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class BlameBackend:
+    """
+    Blame files of a single repository.
+
+    When pygit2 is installed the repository is opened once and every file is
+    blamed in-process, so no git process is forked per file. Without pygit2 we
+    fall back to `git blame --incremental`, one call per file.
+
+    blame() yields (commit_sha, author_name, author_email, line_count) runs.
+    """
+
+    def __init__(self, repo_path: str) -> None:
+        self.repo_path = repo_path
+        self.repo = None
+        if pygit2 is not None:
+            try:
+                self.repo = pygit2.Repository(repo_path)
+            except Exception as e:
+                print(f"WARNING: pygit2 could not open {repo_path}, using git CLI: {e}", file=sys.stderr)
+                self.repo = None
+
+    def blame(self, file_path: str) -> Iterable[Tuple[str, str, str, int]]:
+        if self.repo is not None:
+            return self._blame_pygit2(file_path)
+        return self._blame_cli(file_path)
+
+    def _blame_pygit2(self, file_path: str) -> Iterator[Tuple[str, str, str, int]]:
+        try:
+            hunks = self.repo.blame(
+                file_path, flags=pygit2.GIT_BLAME_NORMAL | pygit2.GIT_BLAME_USE_MAILMAP
             )
-            current_canonical_slug = canonical
-            current_ignored = canonical in ignored_slugs
-            continue
+        except (KeyError, ValueError, pygit2.GitError):
+            # Not in HEAD (e.g. staged only) or otherwise unblamable; skip it.
+            return
+        for hunk in hunks:
+            # pygit2's final_committer wraps libgit2's final_signature, which is
+            # the (mailmapped) author of the last change to the hunk
+            sig = hunk.final_committer
+            if sig is None:
+                continue
+            yield str(hunk.final_commit_id), sig.name or "", sig.email or "", hunk.lines_in_hunk
+
+    def _blame_cli(self, file_path: str) -> List[Tuple[str, str, str, int]]:
+        """
+        Parse `git blame --incremental`: every hunk is a header line
+        "<sha> <orig-line> <final-line> <count>" followed by the commit
+        metadata (only the first time that commit shows up) and a closing
+        "filename" line. Source lines are never printed.
+
+        stdout is streamed and parsed line by line as git produces it, so
+        memory stays flat regardless of file size. The runs are only
+        returned once git exited successfully.
+
+        IMPORTANT: We run subprocess in binary mode and decode only the author
+        lines, with 'utf-8' + errors='replace' to avoid UnicodeDecodeError on
+        non-UTF8 author names.
+        """
+        cmd = [
+            "git",
+            "-C",
+            self.repo_path,
+            "blame",
+            "--incremental",
+            "--",
+            file_path,
+        ]
+
+        runs: List[Tuple[str, str, str, int]] = []
+        commit_authors: Dict[bytes, Tuple[str, str]] = {}
+        sha: Optional[bytes] = None
+        count = 0
+        author_name = ""
+        author_email = ""
+
+        try:
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=1 << 20,
+            ) as proc:
+                # Scan the raw bytes; only author lines are decoded
+                for line in proc.stdout:
+                    if sha is None:
+                        m = INCREMENTAL_HUNK_RE.match(line)
+                        if m:
+                            sha = m.group(1)
+                            count = int(m.group(2))
+                            author_name, author_email = commit_authors.get(sha, ("", ""))
+                        continue
+
+                    if line.startswith(b"author "):
+                        author_name = line[7:].decode("utf-8", errors="replace").strip()
+                    elif line.startswith(b"author-mail "):
+                        mail = line[12:].decode("utf-8", errors="replace").strip()
+                        if mail.startswith("<") and mail.endswith(">"):
+                            mail = mail[1:-1]
+                        author_email = mail
+                    elif line.startswith(b"filename "):
+                        # "filename" closes the hunk
+                        commit_authors[sha] = (author_name, author_email)
+                        runs.append((sha.decode("ascii"), author_name, author_email, count))
+                        sha = None
+        except FileNotFoundError:
+            print("ERROR: git command not found. Make sure git is installed and in PATH.", file=sys.stderr)
+            sys.exit(1)
+
+        if proc.returncode != 0:
+            # Could be a binary file or something odd; skip it.
+            return []
+
+        return runs
 
-        # Content lines start with a tab
-        if not line.startswith("\t"):
-            continue
 
-        if current_canonical_slug is None or current_ignored:
+def analyze_file_blame(
+    backend: BlameBackend,
+    resolver: ServiceResolver,
+    file_path: str,
+    alias_map: Dict[str, str],
+    ignored_slugs: Set[str],
+    author_cache: Dict[str, Tuple[str, str, str, bool]],
+) -> Tuple[str, Dict[str, Tuple[int, str, Set[str]]]]:
+    """
+    Blame a single file through `backend` and count line ownership.
+
+    No shared state besides author_cache (commit sha -> (canonical_slug,
+    display_name, email, ignored)), which is kept per repo: the same commits
+    recur across hunks and files, so their author is resolved only once.
+
+    Returns:
+      (service_name, {canonical_slug: (lines, display_name, emails)})
+    """
+    # Determine service once per file
+    service_name = resolver.service_for(file_path)
+    # canonical_slug -> [lines, display_name, emails, last email added]
+    file_acc: Dict[str, list] = {}
+
+    for sha, author_name, author_email, lines in backend.blame(file_path):
+        author = author_cache.get(sha)
+        if author is None:
+            canonical_slug = canonical_slug_for_author(author_name, author_email, alias_map)
+            author = author_cache[sha] = (
+                canonical_slug,
+                author_name or canonical_slug,
+                # interned, so runs of the same author share one email object
+                sys.intern(author_email),
+                canonical_slug in ignored_slugs,
+            )
+        canonical_slug, display_name, author_email, ignored = author
+        if ignored:
             continue
 
-        display_name = current_author_name or current_canonical_slug
+        entry = file_acc.get(canonical_slug)
+        if entry is None:
+            entry = file_acc[canonical_slug] = [0, display_name, set(), None]
+        entry[0] += lines
+        # Consecutive runs mostly share an author: skip the set insert on an identity match
+        if author_email is not entry[3]:
+            if author_email:
+                entry[2].add(author_email)
+            entry[3] = author_email
 
-        # repo totals
-        repo_data["total_lines"] = repo_data.get("total_lines", 0) + 1
+    file_devs = {slug: (entry[0], entry[1], entry[2]) for slug, entry in file_acc.items()}
+    return service_name, file_devs
 
-        # service-level
-        svc_data = ensure_service_entry(repo_data, service_name)
-        svc_data["total_lines"] = svc_data.get("total_lines", 0) + 1
-        svc_dev = ensure_service_dev(
-            svc_data,
-            current_canonical_slug,
-            display_name,
-            current_author_email or "",
-        )
-        svc_dev["lines"] += 1
-
-        # repo developer totals
-        repo_dev = ensure_repo_dev(
-            repo_data,
-            current_canonical_slug,
-            display_name,
-            current_author_email or "",
+
+def merge_file_blame(
+    repo_data: Dict[str, Any],
+    service_name: str,
+    file_devs: Dict[str, Tuple[int, str, Set[str]]],
+) -> None:
+    """
+    Fold the per-file result of analyze_file_blame into the repo counter.
+    """
+    svc_dev_lines = repo_data["svc_dev_lines"]
+    dev_meta = repo_data["dev_meta"]
+
+    for canonical_slug, (lines, display_name, emails) in file_devs.items():
+        key = (service_name, canonical_slug)
+        repo_data["total_lines"] += lines
+        svc_dev_lines[key] += lines
+
+        meta = dev_meta.get(key)
+        if meta is None:
+            dev_meta[key] = (display_name, set(emails))
+        else:
+            meta[1].update(emails)
+
+
+# -----------------------------
+# File-level worker pool
+# -----------------------------
+
+# Per-process state of the shared blame pool, set once by init_blame_worker()
+_worker_alias_map: Dict[str, str] = {}
+_worker_services_config: Dict[str, Dict[str, list]] = {}
+_worker_ignored_slugs: Set[str] = set()
+_worker_repos: Dict[str, Tuple[BlameBackend, ServiceResolver, Dict[str, Tuple[str, str, str, bool]]]] = {}
+
+
+def init_blame_worker(alias_file: str, services_file: str, ignore_file: str) -> None:
+    """
+    Pool initializer: each worker parses the configuration files itself
+    once, so only three paths are pickled to it.
+    """
+    global _worker_alias_map, _worker_services_config, _worker_ignored_slugs
+    _worker_alias_map = load_aliases(alias_file)
+    _worker_services_config = load_services_config(services_file)
+    _worker_ignored_slugs = load_ignored_users(ignore_file)
+
+
+def blame_file_worker(task: Tuple[str, str, str]) -> Tuple[str, Dict[str, Tuple[int, str, Set[str]]]]:
+    """Worker function blaming one (repo_rel, repo_path, file_path) in the shared pool"""
+    repo_rel_path, repo_path, file_path = task
+    repo_state = _worker_repos.get(repo_path)
+    if repo_state is None:
+        # Repos are blamed one after the other, so only keep the current one
+        # open instead of a backend and author cache for every repo seen
+        _worker_repos.clear()
+        repo_state = _worker_repos[repo_path] = (
+            BlameBackend(repo_path),
+            ServiceResolver(repo_rel_path, _worker_services_config),
+            {},
         )
-        repo_dev["lines"] += 1
-        per_svc = ensure_repo_dev_service_entry(repo_dev, service_name)
-        per_svc["lines"] += 1
+    backend, resolver, author_cache = repo_state
+    return analyze_file_blame(
+        backend,
+        resolver,
+        file_path,
+        _worker_alias_map,
+        _worker_ignored_slugs,
+        author_cache,
+    )
 
 
 def analyze_repo(
@@ -626,10 +1097,20 @@ def analyze_repo(
     alias_map: Dict[str, str],
     services_config: Dict[str, Dict[str, list]],
     ignored_slugs: Set[str],
+    executor: Optional[ProcessPoolExecutor] = None,
+    cache_path: Optional[str] = None,
+    write_commit_graph: bool = False,
 ) -> Optional[Dict[str, Any]]:
     """
     Analyze one repo using git blame on all tracked files.
 
+    With an executor (initialized via init_blame_worker), files are blamed in
+    the worker pool and the partial counts are merged here in file order.
+    With a cache_path, files whose blob is unchanged since the previous run
+    reuse the cached result instead of being blamed again (see BlameCache).
+    With write_commit_graph, the repo's commit-graph is refreshed first
+    (see ensure_commit_graph).
+
     Returns:
       repo_data dict or None if nothing was processed.
     """
@@ -642,34 +1123,69 @@ def analyze_repo(
         print(f"    ! Not a git repo (no .git directory): {repo_path}")
         return None
 
-    repo_data: Dict[str, Any] = {
-        "repo": repo_rel_path,
-        "total_lines": 0,
-        "services": {},
-        "developers": {},
-    }
+    repo_data = new_repo_data(repo_rel_path)
 
     files = get_tracked_files(repo_path)
     if not files:
         return None
 
+    tracked_files = len(files)
+    files = filter_blame_files(repo_path, files)
+    if not files:
+        return None
+
     total_files = len(files)
-    print(f"     Analyzing {total_files} files...")
-    
+    print(f"     Analyzing {total_files} files ({tracked_files - total_files} binary/vendored/generated skipped)...")
+
+    if write_commit_graph:
+        ensure_commit_graph(repo_path)
+
+    cache: Optional[BlameCache] = None
+    blob_shas: Dict[str, str] = {}
+    cached: Dict[str, Tuple[str, Dict[str, Tuple[int, str, Set[str]]]]] = {}
+    if cache_path is not None:
+        blob_shas = get_head_blob_shas(repo_path)
+        config_key = blame_config_key(
+            repo_rel_path, alias_map, services_config, ignored_slugs, blob_shas.get(".mailmap")
+        )
+        cache = BlameCache(cache_path, config_key, repo_path, get_head_commit(repo_path))
+        for f in files:
+            hit = cache.get(f, blob_shas.get(f))
+            if hit is not None:
+                cached[f] = hit
+        if cached:
+            print(f"     Reusing cached blame for {len(cached)}/{total_files} files")
+
+    to_blame = [f for f in files if f not in cached]
+    if executor is not None:
+        tasks = [(repo_rel_path, repo_path, f) for f in to_blame]
+        blamed = executor.map(blame_file_worker, tasks, chunksize=64)
+    else:
+        backend = BlameBackend(repo_path)
+        resolver = ServiceResolver(repo_rel_path, services_config)
+        author_cache: Dict[str, Tuple[str, str, str, bool]] = {}
+        blamed = (
+            analyze_file_blame(backend, resolver, f, alias_map, ignored_slugs, author_cache)
+            for f in to_blame
+        )
+    blamed = iter(blamed)
+
     for i, f in enumerate(files):
         if i > 0 and i % 100 == 0:  # Progress every 100 files
             print(f"     Progress: {i}/{total_files} files ({i/total_files*100:.1f}%)")
             sys.stdout.flush()
-            
-        analyze_file_blame(
-            repo_rel_path,
-            repo_path,
-            f,
-            repo_data,
-            alias_map,
-            services_config,
-            ignored_slugs,
-        )
+
+        file_result = cached.get(f)
+        if file_result is None:
+            file_result = next(blamed)
+            if cache is not None:
+                cache.put(f, blob_shas.get(f), file_result)
+
+        service_name, file_devs = file_result
+        merge_file_blame(repo_data, service_name, file_devs)
+
+    if cache is not None:
+        cache.close(files)
 
     if repo_data.get("total_lines", 0) == 0:
         return None
@@ -677,12 +1193,8 @@ def analyze_repo(
     return repo_data
 
 
-# -----------------------------
-# Worker function for parallel processing
-# -----------------------------
-
-def blame_repo_worker(repo_data):
-    """Worker function for processing a single repository in parallel mode"""
+def blame_repo_worker(repo_data, executor: Optional[ProcessPoolExecutor] = None):
+    """Analyze, finalize and write blame.json for a single repository"""
     repo_rel = repo_data["repo_rel"]
     repo_path = repo_data["repo_path"]
     alias_map = repo_data["alias_map"]
@@ -690,20 +1202,26 @@ def blame_repo_worker(repo_data):
     ignored_slugs = repo_data["ignored_slugs"]
     output_root = repo_data["output_root"]
     repos_root = repo_data["repos_root"]
-    
+    use_cache = repo_data["use_cache"]
+    write_commit_graph = repo_data["write_commit_graph"]
+
+    out_folder = ensure_repo_blame_output_folder(output_root, repo_rel)
+
     repo_result = analyze_repo(
         repo_rel,
         repo_path,
         alias_map,
         services_config,
         ignored_slugs,
+        executor,
+        os.path.join(out_folder, ".cache.sqlite") if use_cache else None,
+        write_commit_graph,
     )
     if not repo_result:
         return (repo_rel, None, "no blame data")
 
     finalize_repo_data(repo_result)
 
-    out_folder = ensure_repo_blame_output_folder(output_root, repo_rel)
     out_path = os.path.join(out_folder, "blame.json")
 
     summary = {
@@ -716,8 +1234,7 @@ def blame_repo_worker(repo_data):
         "repos_root": os.path.abspath(repos_root),
     }
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    write_json_file(out_path, summary)
 
     return (repo_rel, out_path, "success")
 
@@ -737,6 +1254,8 @@ def main() -> None:
     alias_file = args.alias_file
     parallel = args.parallel
     max_workers = args.max_workers
+    use_cache = not args.no_cache
+    write_commit_graph = args.write_commit_graph
 
     print("Analyzing LOCAL git repos for blame-based ownership...")
     print(f"Repos root: {repos_root}")
@@ -746,16 +1265,13 @@ def main() -> None:
         print(f"No git repos found under '{repos_root}'. Nothing to do.")
         sys.exit(0)
 
-    # Determine number of workers
+    # Determine number of workers: files of every repo share one pool sized to the cores
     if max_workers is None:
-        available_cores = multiprocessing.cpu_count()
-        # Increase cap to 6 for systems with more cores, as blame analysis is often I/O bound  
-        worker_cap = 6 if available_cores >= 8 else 4
-        max_workers = min(available_cores, len(repo_list), worker_cap)
+        max_workers = multiprocessing.cpu_count()
 
     print(f"Discovered {len(repo_list)} repos:")
-    if parallel and len(repo_list) > 1:
-        print(f"🚀 Processing repositories in parallel (max workers: {max_workers})")
+    if parallel:
+        print(f"🚀 Blaming files in parallel (max workers: {max_workers})")
     else:
         print("📊 Processing repositories sequentially")
 
@@ -774,91 +1290,61 @@ def main() -> None:
     repo_list = sorted(repo_list)
     total_repos = len(repo_list)
 
-    if parallel and len(repo_list) > 1:
-        # Parallel processing
-        # Prepare repo tasks with all necessary data
-        repo_tasks = []
-        for repo_rel in repo_list:
+    executor: Optional[ProcessPoolExecutor] = None
+    if parallel:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_blame_worker,
+            initargs=(alias_file, services_file, ignore_file),
+        )
+
+    completed_repos = 0
+    failed_repos = 0
+
+    try:
+        for repo_index, repo_rel in enumerate(repo_list, 1):
             repo_path = os.path.join(repos_root, repo_rel)
-            repo_tasks.append({
+            print(f"  -> {repo_rel} ({repo_index}/{total_repos})")
+            sys.stdout.flush()  # Ensure immediate output
+
+            task = {
                 "repo_rel": repo_rel,
                 "repo_path": repo_path,
                 "alias_map": alias_map,
                 "services_config": services_config,
                 "ignored_slugs": ignored_slugs,
                 "output_root": output_root,
-                "repos_root": repos_root
-            })
-
-        # Execute repo processing in parallel
-        completed_repos = 0
-        failed_repos = 0
-        
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            future_to_repo = {executor.submit(blame_repo_worker, task): task["repo_rel"] for task in repo_tasks}
-            
-            for future in as_completed(future_to_repo):
-                repo_rel = future_to_repo[future]
-                try:
-                    repo_rel, out_path, status = future.result()
-                    completed_repos += 1
-                    print(f"  ✅ {repo_rel} ({completed_repos}/{total_repos})")
-                    if status == "success":
-                        print(f"     -> blame stats written to {out_path}")
-                    elif status == "no blame data":
-                        print(f"     (no blame data)")
-                    sys.stdout.flush()
-                except Exception as e:
-                    failed_repos += 1
-                    print(f"  ❌ {repo_rel} ({completed_repos + failed_repos}/{total_repos}): {e}")
-                    
+                "repos_root": repos_root,
+                "use_cache": use_cache,
+                "write_commit_graph": write_commit_graph,
+            }
+            try:
+                repo_rel, out_path, status = blame_repo_worker(task, executor)
+            except Exception as e:
+                if executor is None:
+                    raise
+                failed_repos += 1
+                print(f"  ❌ {repo_rel} ({repo_index}/{total_repos}): {e}")
+                continue
+
+            completed_repos += 1
+            if status == "success":
+                print(f"     -> blame stats written to {out_path}")
+            elif status == "no blame data":
+                print("     (no blame data)")
+            sys.stdout.flush()  # Ensure immediate output
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if parallel:
         if failed_repos > 0:
             print(f"\n⚠️  Completed with {failed_repos} failures out of {total_repos} repositories")
         else:
             print(f"\n✅ All {completed_repos} repositories processed successfully in parallel!")
-            
-    else:
-        # Sequential processing (original behavior)
-        for repo_index, repo_rel in enumerate(repo_list, 1):
-            repo_path = os.path.join(repos_root, repo_rel)
-            print(f"  -> {repo_rel} ({repo_index}/{total_repos})")
-            sys.stdout.flush()  # Ensure immediate output
-            
-            repo_data = analyze_repo(
-                repo_rel,
-                repo_path,
-                alias_map,
-                services_config,
-                ignored_slugs,
-            )
-            if not repo_data:
-                print("     (no blame data)")
-                continue
-
-            finalize_repo_data(repo_data)
-
-            out_folder = ensure_repo_blame_output_folder(output_root, repo_rel)
-            out_path = os.path.join(out_folder, "blame.json")
-
-            summary = {
-                "repo": repo_data["repo"],
-                "services": repo_data["services"],
-                "developers": repo_data["developers"],
-                "top_developer": repo_data.get("top_developer"),
-                "total_lines": repo_data.get("total_lines", 0),
-                "generated_at": datetime.utcnow().isoformat() + "Z",
-                "repos_root": os.path.abspath(repos_root),
-            }
-
-            with open(out_path, "w", encoding="utf-8") as f:
-                json.dump(summary, f, indent=2)
-
-            print(f"     -> blame stats written to {out_path}")
-            sys.stdout.flush()  # Ensure immediate output
 
     print("\n=== Done ===")
 
 
 if __name__ == "__main__":
     main()
-
@@ -1,4 +1,7 @@
 #!/usr/bin/env python3
+import atexit
+import calendar
+import codecs
 import os
 import json
 import queue
@@ -6,44 +9,165 @@ import threading
 import time
 import sys
 import argparse
+import heapq
+import mmap
+import re
+import selectors
 import subprocess
+import tempfile
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Any, List, Tuple, Optional
 
 from flask import Flask, jsonify, send_from_directory, render_template, abort, request, Response
 
+try:
+    import orjson  # optional: faster parsing of the stats JSON files
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress  # optional: gzip/brotli compression of responses
+except ImportError:
+    Compress = None
+
 # Configuration
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 STATS_ROOT = os.path.join(BASE_DIR, "stats")
 
 app = Flask(__name__, template_folder="templates", static_folder="static")
 
+if orjson is not None:
+    try:
+        from flask.json.provider import DefaultJSONProvider
+    except ImportError:  # Flask < 2.2 has no pluggable JSON provider
+        DefaultJSONProvider = None
+
+    if DefaultJSONProvider is not None:
+        class OrjsonJSONProvider(DefaultJSONProvider):
+            """
+            Encode jsonify() responses with orjson. Keys stay sorted and datetimes go
+            through Flask's default() fallback, so responses look as they did before.
+            """
+            def dumps(self, obj: Any, **kwargs: Any) -> str:
+                option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                if self.sort_keys:
+                    option |= orjson.OPT_SORT_KEYS
+                if kwargs.get("indent"):
+                    option |= orjson.OPT_INDENT_2
+                return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+            def loads(self, s: Any, **kwargs: Any) -> Any:
+                return orjson.loads(s)
+
+        app.json = OrjsonJSONProvider(app)
+
+if Compress is not None:
+    # text/event-stream is left out on purpose: the compressor only emits output once
+    # it has buffered enough data, which would hold back live update progress events
+    app.config["COMPRESS_MIMETYPES"] = [
+        "application/json",
+        "text/html",
+        "text/css",
+        "text/javascript",
+        "application/javascript",
+    ]
+    app.config["COMPRESS_LEVEL"] = 5
+    app.config["COMPRESS_MIN_SIZE"] = 1024
+    Compress(app)
+
 # Global storage for clone progress
 clone_operations = {}
 
-# Global queue for update progress messages
-update_progress_queue = queue.Queue()
+# Parsed stats JSON keyed by (path, st_mtime_ns, st_size); see load_json_cached()
+_parsed_json_cache: Dict[Tuple[str, int, int], Any] = {}
+_parsed_json_cache_lock = threading.Lock()
+PARSED_JSON_CACHE_SIZE = 512
+
+# Last analyze_developer_badges() result as (inputs fingerprint, badges)
+_badge_cache = None
+
+# Last detect_dead_subsystems() result as (inputs fingerprint, status)
+_dead_subsystems_cache = None
+
+# Last /api/developers/total-ownership result as (inputs fingerprint, developers)
+_total_ownership_cache = None
+
+# Last compute_subsystem_size_rankings() result as (inputs fingerprint, rankings)
+_size_rankings_cache = None
+
+# Threads used to read and parse many stats files at once (blame files, languages.json)
+STATS_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Threads used to run short git queries (one process each) across many repositories
+GIT_QUERY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Global queue for update progress messages; update_progress_event is set whenever
+# a message is appended so the SSE stream can wait without polling
+update_progress_queue = deque()
+update_progress_event = threading.Event()
 update_process_active = False
 
-# Update log file
+# Update log file, written through one long-lived buffered handle
 UPDATE_LOG_FILE = os.path.join(BASE_DIR, "update_logs.txt")
+UPDATE_LOG_FLUSH_EVERY = 64       # messages
+UPDATE_LOG_FLUSH_SECONDS = 1.0
+_update_log_file = None
+_update_log_lock = threading.Lock()
+_update_log_pending = 0
+_update_log_last_flush = 0.0
+_update_log_timestamp = (None, "")  # (epoch second, formatted timestamp)
+
+def update_log_timestamp():
+    """Current time as "%Y-%m-%d %H:%M:%S", formatted at most once per second."""
+    global _update_log_timestamp
+    second = int(time.time())
+    if _update_log_timestamp[0] != second:
+        _update_log_timestamp = (second, datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S"))
+    return _update_log_timestamp[1]
+
+def write_update_log(data):
+    """Append UTF-8 encoded bytes to the update log; it is flushed every few messages or every second."""
+    global _update_log_file, _update_log_pending, _update_log_last_flush
+    with _update_log_lock:
+        if _update_log_file is None:
+            _update_log_file = open(UPDATE_LOG_FILE, 'ab', buffering=1 << 16)
+        _update_log_file.write(data)
+        _update_log_pending += 1
+        now = time.monotonic()
+        if _update_log_pending >= UPDATE_LOG_FLUSH_EVERY or now - _update_log_last_flush >= UPDATE_LOG_FLUSH_SECONDS:
+            _update_log_file.flush()
+            _update_log_pending = 0
+            _update_log_last_flush = now
+
+def flush_update_log():
+    """Write any buffered update log lines to disk, e.g. before the log file is read."""
+    global _update_log_pending, _update_log_last_flush
+    with _update_log_lock:
+        if _update_log_file is not None:
+            _update_log_file.flush()
+            _update_log_pending = 0
+            _update_log_last_flush = time.monotonic()
+
+atexit.register(flush_update_log)
 
 def log_update_message(message_dict):
     """Log update messages to both queue and persistent file."""
     # Add to queue for SSE streaming
-    update_progress_queue.put(message_dict)
+    update_progress_queue.append(message_dict)
+    update_progress_event.set()
     
     # Also write to log file with timestamp
     try:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = update_log_timestamp()
         msg_type = message_dict.get('type', 'info').upper()
         message = message_dict.get('message', '')
         progress = message_dict.get('progress', 0)
         
-        log_entry = f"[{timestamp}] [{msg_type}] [{progress:.1f}%] {message}\n"
-        
-        with open(UPDATE_LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+        write_update_log(f"[{timestamp}] [{msg_type}] [{progress:.1f}%] {message}\n".encode('utf-8'))
     except Exception as e:
         print(f"Error writing to update log: {e}")
 
@@ -55,26 +179,32 @@ def reset_update_state():
     update_process_active = False
     
     # Clear any remaining messages in the queue
-    queue_cleared = 0
-    while not update_progress_queue.empty():
-        try:
-            update_progress_queue.get_nowait()
-            queue_cleared += 1
-        except queue.Empty:
-            break
+    queue_cleared = len(update_progress_queue)
+    update_progress_queue.clear()
     
     if queue_cleared > 0:
         print(f"🧹 Cleared {queue_cleared} messages from update queue")
+    
+    _parsed_json_cache.clear()
+    invalidate_badge_cache()
+    invalidate_dead_subsystems_cache()
+
+def invalidate_badge_cache():
+    """Make the next analyze_developer_badges() call recompute the badges."""
+    global _badge_cache
+    _badge_cache = None
+
+def invalidate_dead_subsystems_cache():
+    """Make the next detect_dead_subsystems() call rescan the subsystem summaries."""
+    global _dead_subsystems_cache
+    _dead_subsystems_cache = None
 
 def start_new_update_log():
     """Start a new section in the update log."""
     try:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = update_log_timestamp()
         separator = "=" * 80
-        with open(UPDATE_LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(f"\n{separator}\n")
-            f.write(f"UPDATE SESSION STARTED: {timestamp}\n")
-            f.write(f"{separator}\n\n")
+        write_update_log(f"\n{separator}\nUPDATE SESSION STARTED: {timestamp}\n{separator}\n\n".encode('utf-8'))
     except Exception as e:
         print(f"Error starting update log: {e}")
 
@@ -87,6 +217,119 @@ print("✅ Update state reset on startup")
 # Helper functions
 # ---------------------------
 
+# Path tails appended to scanned folder paths; plain concatenation is cheaper than
+# os.path.join() in loops that run once per repo or period folder
+BLAME_FILE_SUFFIX = os.sep + "blame" + os.sep + "blame.json"
+SUMMARY_FILE_SUFFIX = os.sep + "summary.json"
+
+# Period folder names: "YYYY-MM-DD_YYYY-MM-DD" and, for users, "YYYY-MM"
+PERIOD_FOLDER_RE = re.compile(r"([0-9]{4})-([0-9]{2}-[0-9]{2})_([0-9]{4})-([0-9]{2}-[0-9]{2})")
+MONTH_FOLDER_RE = re.compile(r"([0-9]{4})-([0-9]{2})")
+
+
+@lru_cache(maxsize=32)
+def month_bounds(year: int, month: int) -> Tuple[str, str]:
+    """First and last day of a month as "YYYY-MM-DD" strings."""
+    last_day = calendar.monthrange(year, month)[1]
+    return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{last_day:02d}"
+
+
+def conditional_jsonify(payload: Any) -> Response:
+    """
+    jsonify() with a weak ETag, answering 304 Not Modified when the client already
+    has this exact response. The tag is weak so it survives response compression.
+    """
+    response = jsonify(payload)
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
+
+
+def _stats_dir_signature(root: str) -> Optional[Tuple]:
+    """
+    Cheap change marker for a stats directory: its own mtime plus the mtime of
+    each immediate subdirectory. Returns None if the directory does not exist.
+    """
+    try:
+        with os.scandir(root) as it:
+            children = tuple(sorted((entry.name, entry.stat().st_mtime_ns) for entry in it if entry.is_dir()))
+        return (os.stat(root).st_mtime_ns, children)
+    except OSError:
+        return None
+
+
+def clear_stats_listing_cache():
+    """Forget cached stats directory listings, e.g. after an update has written new stats."""
+    _scan_user_months.cache_clear()
+    _scan_repos_with_blame.cache_clear()
+    _scan_service_months.cache_clear()
+    _scan_repo_blame_files.cache_clear()
+    _scan_subsystem_summary_folders.cache_clear()
+    invalidate_badge_cache()
+    invalidate_dead_subsystems_cache()
+
+
+# Stats listings and badge analysis snapshots are rebuilt at least this often, so
+# files written into existing folders are picked up even between updates
+STATS_SNAPSHOT_TTL_SECONDS = 30
+
+
+def _stats_snapshot_key(root: str) -> Optional[Tuple]:
+    """Directory signature of root plus the current TTL window; None if root does not exist."""
+    signature = _stats_dir_signature(root)
+    if signature is None:
+        return None
+    return (signature, int(time.monotonic() // STATS_SNAPSHOT_TTL_SECONDS))
+
+
+def list_repo_blame_files() -> Tuple[Tuple[str, str, str], ...]:
+    """
+    Return (repo_name, repo_full_name, blame_file) for every repo under stats/repos,
+    handling both the flat and the nested (org/repo) layout. The dashboard routes
+    and the badge analysis share this snapshot, and load_json_cached() keeps the
+    parsed blame files, so a request only re-reads the files that changed.
+    """
+    repos_root = os.path.join(STATS_ROOT, "repos")
+    key = _stats_snapshot_key(repos_root)
+    if key is None:
+        return ()
+    return _scan_repo_blame_files(repos_root, key)
+
+
+@lru_cache(maxsize=4)
+def _scan_repo_blame_files(repos_root: str, key: Tuple) -> Tuple[Tuple[str, str, str], ...]:
+    return tuple(
+        (repo_rel.rsplit("/", 1)[-1], repo_rel, blame_file)
+        for repo_rel, blame_file in iter_blame_files(repos_root)
+    )
+
+
+def list_subsystem_summary_folders() -> Dict[str, Tuple[str, ...]]:
+    """
+    Map each subsystem under stats/subsystems to its period folders that contain a
+    summary.json. The mapping is shared between callers; treat it as read-only.
+    """
+    subsystems_root = os.path.join(STATS_ROOT, "subsystems")
+    key = _stats_snapshot_key(subsystems_root)
+    if key is None:
+        return {}
+    return _scan_subsystem_summary_folders(subsystems_root, key)
+
+
+@lru_cache(maxsize=4)
+def _scan_subsystem_summary_folders(subsystems_root: str, key: Tuple) -> Dict[str, Tuple[str, ...]]:
+    result: Dict[str, Tuple[str, ...]] = {}
+    with os.scandir(subsystems_root) as subsystem_entries:
+        for subsystem in subsystem_entries:
+            if not subsystem.is_dir():
+                continue
+            with os.scandir(subsystem.path) as period_entries:
+                result[subsystem.name] = tuple(
+                    period.name for period in period_entries
+                    if period.is_dir() and os.path.isfile(period.path + SUMMARY_FILE_SUFFIX)
+                )
+    return result
+
+
 def list_user_months() -> Dict[str, List[Dict[str, Any]]]:
     """
     Scan stats/users and return:
@@ -98,12 +341,19 @@ def list_user_months() -> Dict[str, List[Dict[str, Any]]]:
       ],
       ...
     }
+    The listing is rebuilt when the directory signature changes or the snapshot
+    TTL runs out, so files added deeper in the tree show up; treat it as read-only.
     """
     users_root = os.path.join(STATS_ROOT, "users")
-    result: Dict[str, List[Dict[str, Any]]] = {}
+    key = _stats_snapshot_key(users_root)
+    if key is None:
+        return {}
+    return _scan_user_months(users_root, key)
 
-    if not os.path.isdir(users_root):
-        return result
+
+@lru_cache(maxsize=4)
+def _scan_user_months(users_root: str, key: Tuple) -> Dict[str, List[Dict[str, Any]]]:
+    result: Dict[str, List[Dict[str, Any]]] = {}
 
     for user_slug in sorted(os.listdir(users_root)):
         user_path = os.path.join(users_root, user_slug)
@@ -140,26 +390,29 @@ def list_user_months() -> Dict[str, List[Dict[str, Any]]]:
                 continue
             
             # Support both formats: "YYYY-MM-DD_YYYY-MM-DD" and "YYYY-MM" and "YYYY"
-            if "_" in entry:
+            period_match = PERIOD_FOLDER_RE.fullmatch(entry)
+            month_match = None if period_match else MONTH_FOLDER_RE.fullmatch(entry)
+            if period_match:
                 # Old format: "YYYY-MM-DD_YYYY-MM-DD"
-                date_from, date_to = entry.split("_", 1)
+                year_from, month_day_from, year_to, month_day_to = period_match.groups()
+                date_from = f"{year_from}-{month_day_from}"
+                date_to = f"{year_to}-{month_day_to}"
                 # Check if this is a yearly summary (e.g., "2025-01-01_2025-12-31")
-                is_yearly = (date_from.endswith("-01-01") and date_to.endswith("-12-31") and 
-                            date_from[:4] == date_to[:4])
+                is_yearly = month_day_from == "01-01" and month_day_to == "12-31" and year_from == year_to
                 if is_yearly:
-                    label = date_from[:4]  # Just the year
+                    label = year_from  # Just the year
                 else:
-                    label = date_from[:7] if len(date_from) >= 7 else entry  # YYYY-MM
+                    label = date_from[:7]  # YYYY-MM
             elif len(entry) == 4 and entry.isdigit():
                 # New format: "YYYY" (yearly)
                 label = entry
                 date_from = f"{entry}-01-01"
                 date_to = f"{entry}-12-31"
                 is_yearly = True
-            elif len(entry) == 7 and entry[4] == '-':
+            elif month_match:
                 # New format: "YYYY-MM" (monthly)
                 label = entry
-                year, month = entry.split('-')
+                year, month = month_match.groups()
                 date_from = f"{year}-{month}-01"
                 # Approximate end date (last day of month)
                 if month == '12':
@@ -191,20 +444,43 @@ def list_repos_with_blame() -> List[str]:
     This is kept for badge analysis only.
     """
     repos_root = os.path.join(STATS_ROOT, "repos")
-    if not os.path.isdir(repos_root):
+    key = _stats_snapshot_key(repos_root)
+    if key is None:
         return []
+    return list(_scan_repos_with_blame(repos_root, key))
+
+
+@lru_cache(maxsize=4)
+def _scan_repos_with_blame(repos_root: str, key: Tuple) -> Tuple[str, ...]:
+    return tuple(sorted(repo_rel for repo_rel, _ in iter_blame_files(repos_root)))
 
-    repos_with_blame: List[str] = []
-    for root, dirs, files in os.walk(repos_root):
-        if "blame.json" in files:
-            rel_path = os.path.relpath(root, repos_root)
-            # Expect rel_path like "<repo>/blame"
-            parts = rel_path.split(os.sep)
-            if len(parts) >= 2 and parts[-1] == "blame":
-                repo_rel = os.path.join(*parts[:-1]).replace(os.sep, "/")
-                repos_with_blame.append(repo_rel)
 
-    return sorted(set(repos_with_blame))
+def iter_blame_files(repos_root: str):
+    """
+    Yield (repo_rel, blame_file) for each blame.json under stats/repos, one at a time.
+    Only the two known layouts are checked instead of walking every period folder:
+    repos/<repo>/blame/blame.json and repos/<org>/<repo>/blame/blame.json
+    """
+    try:
+        top_entries = os.scandir(repos_root)
+    except OSError:
+        return
+    with top_entries:
+        for top in top_entries:
+            if not top.is_dir(follow_symlinks=False):
+                continue
+            blame_file = top.path + BLAME_FILE_SUFFIX
+            if os.path.isfile(blame_file):
+                # A flat repo's subfolders are its period folders, no need to look inside
+                yield top.name, blame_file
+                continue
+            with os.scandir(top.path) as nested_entries:
+                for nested in nested_entries:
+                    if not nested.is_dir(follow_symlinks=False):
+                        continue
+                    blame_file = nested.path + BLAME_FILE_SUFFIX
+                    if os.path.isfile(blame_file):
+                        yield f"{top.name}/{nested.name}", blame_file
 
 
 def list_service_months() -> Dict[str, List[Dict[str, Any]]]:
@@ -218,12 +494,19 @@ def list_service_months() -> Dict[str, List[Dict[str, Any]]]:
       ],
       ...
     }
+    The listing is rebuilt when the directory signature changes or the snapshot
+    TTL runs out, so files added deeper in the tree show up; treat it as read-only.
     """
     subsystems_root = os.path.join(STATS_ROOT, "subsystems")
-    result: Dict[str, List[Dict[str, Any]]] = {}
+    key = _stats_snapshot_key(subsystems_root)
+    if key is None:
+        return {}
+    return _scan_service_months(subsystems_root, key)
 
-    if not os.path.isdir(subsystems_root):
-        return result
+
+@lru_cache(maxsize=4)
+def _scan_service_months(subsystems_root: str, key: Tuple) -> Dict[str, List[Dict[str, Any]]]:
+    result: Dict[str, List[Dict[str, Any]]] = {}
 
     for service_name in sorted(os.listdir(subsystems_root)):
         service_path = os.path.join(subsystems_root, service_name)
@@ -235,18 +518,20 @@ def list_service_months() -> Dict[str, List[Dict[str, Any]]]:
             if not os.path.isdir(subdir):
                 continue
             # We expect directories like "YYYY-MM-DD_YYYY-MM-DD"
-            if "_" not in entry:
+            period_match = PERIOD_FOLDER_RE.fullmatch(entry)
+            if not period_match:
                 continue
-            date_from, date_to = entry.split("_", 1)
+            year_from, month_day_from, year_to, month_day_to = period_match.groups()
+            date_from = f"{year_from}-{month_day_from}"
+            date_to = f"{year_to}-{month_day_to}"
             
             # Check if this is a yearly summary (e.g., "2025-01-01_2025-12-31")
-            is_yearly = (date_from.endswith("-01-01") and date_to.endswith("-12-31") and 
-                        date_from[:4] == date_to[:4])
+            is_yearly = month_day_from == "01-01" and month_day_to == "12-31" and year_from == year_to
             
             if is_yearly:
-                label = date_from[:4]  # Just the year
+                label = year_from  # Just the year
             else:
-                label = date_from[:7] if len(date_from) >= 7 else entry  # YYYY-MM
+                label = date_from[:7]  # YYYY-MM
                 
             summary_path = os.path.join(subdir, "summary.json")
             if not os.path.isfile(summary_path):
@@ -265,21 +550,159 @@ def list_service_months() -> Dict[str, List[Dict[str, Any]]]:
     return result
 
 
+# Stats files at least this large are mapped into memory instead of read
+MMAP_JSON_MIN_BYTES = 32 * 1024 * 1024
+
+_JSON_LOADS = orjson.loads if orjson is not None else None
+
+
 def load_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Parse a stats JSON file, with orjson when it is installed."""
+    if _JSON_LOADS is None:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_JSON_MIN_BYTES:
+            return _JSON_LOADS(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return _JSON_LOADS(view)
+
+
+def parse_json(content) -> Any:
+    """Parse JSON text or bytes, with orjson when it is installed."""
+    if _JSON_LOADS is None:
+        return json.loads(content)
+    return _JSON_LOADS(content)
+
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """
+    Replace path with data in one step: write a temporary file next to it, flush it
+    to disk and rename it over path, so readers never see a half-written file.
+    The existing file's permissions are kept.
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_file(path: str, data: Any) -> None:
+    """
+    Atomically write data as indented JSON, encoded by orjson when it is installed.
+    Non-ASCII text is written as UTF-8 either way.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    write_file_atomic(path, payload)
+
+
+def load_json_cached(path: str, normalize=None) -> Any:
+    """
+    Like load_json, but reuse the parsed data while the file is unchanged.
+    normalize, if given, is applied once to freshly parsed data before it is cached.
+    The result is shared between callers and must be treated as read-only.
+    """
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    data = _parsed_json_cache.get(key)
+    if data is None:
+        data = load_json(path)
+        if normalize is not None:
+            data = normalize(data)
+        with _parsed_json_cache_lock:
+            if len(_parsed_json_cache) >= PARSED_JSON_CACHE_SIZE:
+                # Drop the oldest entry (dicts keep insertion order)
+                _parsed_json_cache.pop(next(iter(_parsed_json_cache)), None)
+            _parsed_json_cache[key] = data
+    return data
+
+
+def normalize_blame_data(blame_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn developer entries that are a bare line count (older blame files) into the
+    {"lines": n} dicts blame.py writes, for the repo and for each service, so the
+    readers of a blame file only ever see dict entries.
+    """
+    sections = [blame_data]
+    sections.extend(service for service in blame_data.get("services", {}).values() if isinstance(service, dict))
+    for section in sections:
+        developers = section.get("developers")
+        if not isinstance(developers, dict):
+            continue
+        for dev_slug, dev_data in developers.items():
+            if not isinstance(dev_data, dict):
+                developers[dev_slug] = {"lines": dev_data if isinstance(dev_data, int) else 0}
+    return blame_data
+
+
+def load_blame_json_cached(blame_file: str) -> Dict[str, Any]:
+    """load_json_cached() for blame.json files, with developer entries normalized."""
+    return load_json_cached(blame_file, normalize=normalize_blame_data)
+
+
+def _blame_files_fingerprint() -> Tuple:
+    """(blame_file, mtime, size) for every blame file in the current snapshot."""
+    blame_stats = []
+    for _, _, blame_file in list_repo_blame_files():
+        try:
+            st = os.stat(blame_file)
+            blame_stats.append((blame_file, st.st_mtime_ns, st.st_size))
+        except OSError:
+            blame_stats.append((blame_file, None, None))
+    return tuple(blame_stats)
+
+
+def _badge_inputs_fingerprint() -> Tuple:
+    """
+    Cheap fingerprint of everything analyze_developer_badges() reads: the blame files
+    (by mtime and size), the subsystem summary snapshot and today's date, which moves
+    the 3-month maintainer window and the productivity year.
+    """
+    return (
+        STATS_ROOT,
+        datetime.now().strftime("%Y-%m-%d"),
+        _stats_snapshot_key(os.path.join(STATS_ROOT, "subsystems")),
+        _blame_files_fingerprint(),
+    )
 
 
 def analyze_developer_badges() -> Dict[str, List[Dict[str, Any]]]:
     """
     Analyze blame data to determine which subsystems/repositories each developer is the top contributor for.
     Returns a dictionary mapping developer slugs to their badges.
+    The result is reused until the underlying stats change; treat it as read-only.
     """
-    badges = {}
+    global _badge_cache
+    badges = defaultdict(list)
     
     try:
-        # Get ownership badges from blame data (top owner of subsystems/repos)
-        ownership_badges = analyze_ownership_badges()
+        fingerprint = _badge_inputs_fingerprint()
+        cached = _badge_cache
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        # Get ownership badges (top owner of subsystems/repos) and 10%+ ownership
+        # badges from a single pass over the blame data
+        ownership_badges, ownership_percentage_badges = analyze_blame_badges()
         
         # Get maintainer badges from recent commit activity (last 3 months)
         maintainer_badges = analyze_maintainer_badges()
@@ -287,122 +710,116 @@ def analyze_developer_badges() -> Dict[str, List[Dict[str, Any]]]:
         # Get most productive developer badge (only one developer gets this)
         productive_badge = analyze_most_productive_badge()
         
-        # Get 10%+ ownership badges 
-        ownership_percentage_badges = analyze_ownership_percentage_badges()
-        
         # Merge all types of badges
-        for dev_slug in ownership_badges:
-            if dev_slug not in badges:
-                badges[dev_slug] = []
-            badges[dev_slug].extend(ownership_badges[dev_slug])
-        
-        for dev_slug in maintainer_badges:
-            if dev_slug not in badges:
-                badges[dev_slug] = []
-            badges[dev_slug].extend(maintainer_badges[dev_slug])
-        
-        for dev_slug in ownership_percentage_badges:
-            if dev_slug not in badges:
-                badges[dev_slug] = []
-            badges[dev_slug].extend(ownership_percentage_badges[dev_slug])
+        for source in (ownership_badges, maintainer_badges, ownership_percentage_badges):
+            for dev_slug, dev_badges in source.items():
+                badges[dev_slug].extend(dev_badges)
         
         if productive_badge:
             dev_slug, badge = productive_badge
-            if dev_slug not in badges:
-                badges[dev_slug] = []
             badges[dev_slug].append(badge)
         
         # Sort badges by type and then by metric value (ownership % or commits)
-        for dev_slug in badges:
-            badges[dev_slug].sort(key=lambda b: (b["type"], -b.get("share", b.get("commits", b.get("lines_added", 0)))))
+        for dev_badges in badges.values():
+            dev_badges.sort(key=lambda b: (b["type"], -b.get("share", b.get("commits", b.get("lines_added", 0)))))
         
+        badges = dict(badges)
+        _badge_cache = (fingerprint, badges)
         return badges
         
-    except Exception as e:
-        print(f"Error in analyze_developer_badges: {e}")
+    except Exception:
+        app.logger.exception("Error in analyze_developer_badges")
         return {}
 
 
-def _process_blame_file_for_ownership_percentage(blame_file: str, repo_name: str, repo_full_name: str, badges: Dict[str, List[Dict[str, Any]]]):
-    """Helper function to process a single blame file for ownership percentage badges."""
+def badge_for_response(badge: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the badge as sent to the dashboard. Ownership badges only carry their raw
+    lines/share; their subtitle is formatted here, for the badges actually requested,
+    instead of for every developer and repository while the badges are computed.
+    """
+    if "subtitle" in badge:
+        return badge
+    lines = badge.get("lines", 0)
+    share = badge.get("share", 0)
+    if badge.get("type") == "ownership_percentage":
+        subtitle = f"{share*100:.1f}% ownership ({lines:,} lines)"
+    else:
+        subtitle = f"{lines:,} lines ({share*100:.1f}%)"
+    return {**badge, "subtitle": subtitle}
+
+
+def _process_blame_data_for_ownership_percentage(blame_data: Dict[str, Any], repo_name: str, repo_full_name: str, badges: Dict[str, List[Dict[str, Any]]]):
+    """Helper function to process a single repo's blame data for ownership percentage badges."""
     try:
-        blame_data = load_json(blame_file)
-        
         # Check individual developers in the blame data
         developers = blame_data.get("developers", {})
         total_lines = blame_data.get("total_lines", 0)
         
         if total_lines > 0:  # Prevent division by zero
+            # Only create badge if developer owns >10% of the subsystem
+            threshold = total_lines * 0.10
             for dev_slug, dev_data in developers.items():
                 dev_lines = dev_data.get("lines", 0)
-                ownership_share = dev_lines / total_lines
+                if dev_lines <= threshold:
+                    continue
                 
-                # Only create badge if developer owns >10% of the subsystem
-                if ownership_share > 0.10:  # More than 10%
-                    if dev_slug not in badges:
-                        badges[dev_slug] = []
-                    
-                    badges[dev_slug].append({
-                        "type": "ownership_percentage",
-                        "badge_type": "significant_owner",
-                        "title": f"Significant Owner: {repo_name}",
-                        "subtitle": f"{ownership_share*100:.1f}% ownership ({dev_lines:,} lines)",
-                        "subsystem": repo_name,
-                        "repo_path": repo_full_name,
-                        "lines": dev_lines,
-                        "share": ownership_share
-                    })
+                ownership_share = dev_lines / total_lines
+                badges[dev_slug].append({
+                    "type": "ownership_percentage",
+                    "badge_type": "significant_owner",
+                    "title": f"Significant Owner: {repo_name}",
+                    "subsystem": repo_name,
+                    "repo_path": repo_full_name,
+                    "lines": dev_lines,
+                    "share": ownership_share
+                })
         
         # Check per-service ownership percentages as well  
         services = blame_data.get("services", {})
         for service_name, service_data in services.items():
+            # Avoid duplicating if service name same as repo name
+            if service_name == repo_name:
+                continue
+            
             service_developers = service_data.get("developers", {})
             service_total_lines = service_data.get("total_lines", 0)
+            if service_total_lines <= 0:  # Prevent division by zero
+                continue
             
-            if service_total_lines > 0:  # Prevent division by zero
-                for dev_slug, dev_data in service_developers.items():
-                    dev_lines = dev_data.get("lines", 0)
-                    ownership_share = dev_lines / service_total_lines
-                    
-                    # Only create badge if developer owns >10% of the service
-                    if ownership_share > 0.10:
-                        if dev_slug not in badges:
-                            badges[dev_slug] = []
-                        
-                        # Avoid duplicating if service name same as repo name
-                        if service_name != repo_name:
-                            badges[dev_slug].append({
-                                "type": "ownership_percentage", 
-                                "badge_type": "significant_service_owner",
-                                "title": f"Significant Owner: {service_name}",
-                                "subtitle": f"{ownership_share*100:.1f}% ownership ({dev_lines:,} lines)",
-                                "subsystem": service_name,
-                                "repo_path": repo_full_name,
-                                "lines": dev_lines,
-                                "share": ownership_share
-                            })
+            # Only create badge if developer owns >10% of the service
+            threshold = service_total_lines * 0.10
+            for dev_slug, dev_data in service_developers.items():
+                dev_lines = dev_data.get("lines", 0)
+                if dev_lines <= threshold:
+                    continue
+                
+                ownership_share = dev_lines / service_total_lines
+                badges[dev_slug].append({
+                    "type": "ownership_percentage", 
+                    "badge_type": "significant_service_owner",
+                    "title": f"Significant Owner: {service_name}",
+                    "subsystem": service_name,
+                    "repo_path": repo_full_name,
+                    "lines": dev_lines,
+                    "share": ownership_share
+                })
     
     except Exception as e:
-        print(f"Error processing blame file {blame_file} for ownership percentages: {e}")
+        app.logger.warning("Error processing blame data of %s for ownership percentages: %s", repo_full_name, e)
 
 
-def _process_blame_file_for_ownership(blame_file: str, repo_name: str, repo_full_name: str, badges: Dict[str, List[Dict[str, Any]]]):
-    """Helper function to process a single blame file for ownership badges."""
+def _process_blame_data_for_ownership(blame_data: Dict[str, Any], repo_name: str, repo_full_name: str, badges: Dict[str, List[Dict[str, Any]]]):
+    """Helper function to process a single repo's blame data for ownership badges."""
     try:
-        blame_data = load_json(blame_file)
-        
         # Check overall repository top developer
         repo_top_dev = blame_data.get("top_developer")
         if repo_top_dev and repo_top_dev.get("slug"):
             dev_slug = repo_top_dev["slug"]
-            if dev_slug not in badges:
-                badges[dev_slug] = []
-            
             badges[dev_slug].append({
                 "type": "ownership",
                 "badge_type": "repository_owner",
                 "title": f"Top Owner: {repo_name}",
-                "subtitle": f"{repo_top_dev.get('lines', 0):,} lines ({repo_top_dev.get('share', 0)*100:.1f}%)",
                 "subsystem": repo_name,
                 "repo_path": repo_full_name,
                 "lines": repo_top_dev.get("lines", 0),
@@ -415,9 +832,6 @@ def _process_blame_file_for_ownership(blame_file: str, repo_name: str, repo_full
             service_top_dev = service_data.get("top_developer")
             if service_top_dev and service_top_dev.get("slug"):
                 dev_slug = service_top_dev["slug"]
-                if dev_slug not in badges:
-                    badges[dev_slug] = []
-                
                 # Skip if it's the same as repo owner and service name matches repo name
                 if service_name == repo_name and repo_top_dev and repo_top_dev.get("slug") == dev_slug:
                     continue
@@ -426,7 +840,6 @@ def _process_blame_file_for_ownership(blame_file: str, repo_name: str, repo_full
                     "type": "ownership",
                     "badge_type": "service_owner", 
                     "title": f"Top Owner: {service_name}",
-                    "subtitle": f"{service_top_dev.get('lines', 0):,} lines ({service_top_dev.get('share', 0)*100:.1f}%)",
                     "subsystem": service_name,
                     "repo_path": repo_full_name,
                     "lines": service_top_dev.get("lines", 0),
@@ -434,103 +847,90 @@ def _process_blame_file_for_ownership(blame_file: str, repo_name: str, repo_full
                 })
     
     except Exception as e:
-        print(f"Error processing blame file {blame_file}: {e}")
+        app.logger.warning("Error processing blame data of %s: %s", repo_full_name, e)
 
 
-def analyze_ownership_badges() -> Dict[str, List[Dict[str, Any]]]:
+def _scan_repos_blame():
     """
-    Analyze blame data for ownership badges.
+    Yield (repo_name, repo_full_name, blame_file, blame_data) for every repo under
+    stats/repos, handling both the flat and the nested (org/repo) layout. The files
+    are read and parsed on a thread pool; files that fail to load are skipped.
     """
-    badges = {}
-    
-    # Check blame files in the repos structure - handle both flat and nested structures
-    repos_path = os.path.join(STATS_ROOT, "repos")
-    if os.path.exists(repos_path):
-        # First, try flat structure (repos/repo_name/blame/blame.json)
-        for repo_name in os.listdir(repos_path):
-            repo_path = os.path.join(repos_path, repo_name)
-            if not os.path.isdir(repo_path):
-                continue
-            
-            blame_file = os.path.join(repo_path, "blame", "blame.json")
-            if os.path.exists(blame_file):
-                # Found blame file in flat structure
-                repo_full_name = repo_name
-                _process_blame_file_for_ownership(blame_file, repo_name, repo_full_name, badges)
-            else:
-                # Try nested structure (repos/org_name/repo_name/blame/blame.json)
-                if os.path.isdir(repo_path):
-                    for nested_repo_name in os.listdir(repo_path):
-                        nested_repo_path = os.path.join(repo_path, nested_repo_name)
-                        if not os.path.isdir(nested_repo_path):
-                            continue
-                        
-                        nested_blame_file = os.path.join(nested_repo_path, "blame", "blame.json")
-                        if os.path.exists(nested_blame_file):
-                            # Found blame file in nested structure
-                            repo_full_name = f"{repo_name}/{nested_repo_name}"
-                            _process_blame_file_for_ownership(nested_blame_file, nested_repo_name, repo_full_name, badges)
+    candidates = list_repo_blame_files()
+    
+    def load_blame(blame_file):
+        try:
+            return load_blame_json_cached(blame_file)
+        except Exception as e:
+            app.logger.warning("Error processing blame file %s: %s", blame_file, e)
+            return None
+    
+    blame_files = [blame_file for _, _, blame_file in candidates]
+    if len(blame_files) > 1:
+        # Reading and parsing is independent per file; map() keeps the repo order
+        with ThreadPoolExecutor(max_workers=min(STATS_READ_WORKERS, len(blame_files))) as executor:
+            parsed = list(executor.map(load_blame, blame_files))
+    else:
+        parsed = [load_blame(blame_file) for blame_file in blame_files]
+    
+    for (repo_name, repo_full_name, blame_file), blame_data in zip(candidates, parsed):
+        if blame_data is not None:
+            yield repo_name, repo_full_name, blame_file, blame_data
+
+
+def analyze_blame_badges() -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]:
+    """
+    Analyze blame data for ownership badges (top owner) and ownership percentage
+    badges (developers who own >10% of a subsystem) in one pass.
+    Returns (ownership_badges, ownership_percentage_badges).
+    """
+    ownership_badges = defaultdict(list)
+    ownership_percentage_badges = defaultdict(list)
     
-    return badges
+    for repo_name, repo_full_name, _, blame_data in _scan_repos_blame():
+        _process_blame_data_for_ownership(blame_data, repo_name, repo_full_name, ownership_badges)
+        _process_blame_data_for_ownership_percentage(blame_data, repo_name, repo_full_name, ownership_percentage_badges)
+    
+    return dict(ownership_badges), dict(ownership_percentage_badges)
 
 
 def analyze_maintainer_badges() -> Dict[str, List[Dict[str, Any]]]:
     """
     Analyze recent commit activity (last 3 months) to determine top maintainers.
     """
-    badges = {}
+    badges = defaultdict(list)
     
-    # Get current date to determine last 3 months
-    from datetime import datetime, timedelta
-    current_date = datetime.now()
-    three_months_ago = current_date - timedelta(days=90)
+    # Periods starting after this day fall within the last 3 months; ISO dates
+    # compare correctly as strings, so no per-folder date parsing is needed
+    three_months_ago_str = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
     
     # Check subsystems directory for recent activity
     subsystems_path = os.path.join(STATS_ROOT, "subsystems")
-    if not os.path.exists(subsystems_path):
-        return badges
-    
     subsystem_activity = {}  # subsystem -> {dev_slug: total_commits}
     
-    for subsystem_name in os.listdir(subsystems_path):
-        subsystem_path = os.path.join(subsystems_path, subsystem_name)
-        if not os.path.isdir(subsystem_path):
-            continue
-        
-        subsystem_activity[subsystem_name] = {}
+    for subsystem_name, period_dirs in list_subsystem_summary_folders().items():
+        dev_activity = subsystem_activity[subsystem_name] = defaultdict(int)
+        subsystem_prefix = subsystems_path + os.sep + subsystem_name + os.sep
         
         # Look for monthly summary files from last 3 months
-        for period_dir in os.listdir(subsystem_path):
-            period_path = os.path.join(subsystem_path, period_dir)
-            if not os.path.isdir(period_path):
+        for period_dir in period_dirs:
+            # Parse date range from directory name
+            period_match = PERIOD_FOLDER_RE.fullmatch(period_dir)
+            if not period_match:
                 continue
+            year_from, month_day_from, year_to, month_day_to = period_match.groups()
             
             # Skip yearly summaries for maintainer analysis
-            if "_2025-12-31" in period_dir:
-                continue
-            
-            # Parse date range from directory name
-            try:
-                date_parts = period_dir.split("_")
-                if len(date_parts) != 2:
-                    continue
-                
-                from_date_str = date_parts[0]
-                period_date = datetime.strptime(from_date_str, "%Y-%m-%d")
-                
-                # Only consider periods within last 3 months
-                if period_date < three_months_ago:
-                    continue
-                
-            except (ValueError, IndexError):
+            if month_day_from == "01-01" and month_day_to == "12-31" and year_from == year_to:
                 continue
             
-            summary_file = os.path.join(period_path, "summary.json")
-            if not os.path.exists(summary_file):
+            # Only consider periods within last 3 months
+            if f"{year_from}-{month_day_from}" <= three_months_ago_str:
                 continue
             
+            summary_file = subsystem_prefix + period_dir + SUMMARY_FILE_SUFFIX
             try:
-                summary_data = load_json(summary_file)
+                summary_data = load_json_cached(summary_file)
                 
                 # Aggregate commits from all repositories for this subsystem/period
                 repositories = summary_data.get("repositories", {})
@@ -539,12 +939,10 @@ def analyze_maintainer_badges() -> Dict[str, List[Dict[str, Any]]]:
                     for dev_slug, dev_data in developers.items():
                         commits = dev_data.get("commits", 0)
                         if commits > 0:
-                            if dev_slug not in subsystem_activity[subsystem_name]:
-                                subsystem_activity[subsystem_name][dev_slug] = 0
-                            subsystem_activity[subsystem_name][dev_slug] += commits
+                            dev_activity[dev_slug] += commits
             
             except Exception as e:
-                print(f"Error processing summary file {summary_file}: {e}")
+                app.logger.warning("Error processing summary file %s: %s", summary_file, e)
                 continue
     
     # Determine top maintainer for each subsystem
@@ -553,14 +951,10 @@ def analyze_maintainer_badges() -> Dict[str, List[Dict[str, Any]]]:
             continue
         
         # Find developer with most commits
-        top_dev_slug = max(dev_commits.keys(), key=lambda slug: dev_commits[slug])
-        top_commits = dev_commits[top_dev_slug]
+        top_dev_slug, top_commits = max(dev_commits.items(), key=itemgetter(1))
         
         # Only award badge if developer has meaningful activity (at least 3 commits in 3 months)
         if top_commits >= 3:
-            if top_dev_slug not in badges:
-                badges[top_dev_slug] = []
-            
             badges[top_dev_slug].append({
                 "type": "maintainer",
                 "badge_type": "top_maintainer",
@@ -571,7 +965,7 @@ def analyze_maintainer_badges() -> Dict[str, List[Dict[str, Any]]]:
                 "period": "3 months"
             })
     
-    return badges
+    return dict(badges)
 
 
 def analyze_most_productive_badge() -> Optional[Tuple[str, Dict[str, Any]]]:
@@ -580,70 +974,50 @@ def analyze_most_productive_badge() -> Optional[Tuple[str, Dict[str, Any]]]:
     Returns a tuple of (developer_slug, badge_dict) for the most productive developer, or None.
     """
     # Get current date to determine the year for analysis  
-    from datetime import datetime
     current_date = datetime.now()
     current_year = current_date.year
     
     # Check subsystems directory for yearly data
     subsystems_path = os.path.join(STATS_ROOT, "subsystems")
-    if not os.path.exists(subsystems_path):
-        return None
-    
-    developer_totals = {}  # dev_slug -> total_lines_added
+    yearly_folder = f"{current_year:04d}-01-01_{current_year:04d}-12-31"
+    developer_totals = defaultdict(int)  # dev_slug -> total_lines_added
     
-    for subsystem_name in os.listdir(subsystems_path):
-        subsystem_path = os.path.join(subsystems_path, subsystem_name)
-        if not os.path.isdir(subsystem_path):
-            continue
-        
+    for subsystem_name, period_dirs in list_subsystem_summary_folders().items():
         # Look for yearly summary for current year
-        yearly_folder = f"{current_year:04d}-01-01_{current_year:04d}-12-31"
-        yearly_dir = os.path.join(subsystem_path, yearly_folder)
-        
-        if not os.path.exists(yearly_dir):
-            continue
-            
-        summary_file = os.path.join(yearly_dir, "summary.json")
-        if not os.path.exists(summary_file):
+        if yearly_folder not in period_dirs:
             continue
         
+        summary_file = os.path.join(subsystems_path, subsystem_name, yearly_folder, "summary.json")
         try:
-            summary_data = load_json(summary_file)
+            summary_data = load_json_cached(summary_file)
             
             # Aggregate lines added from all developers in this subsystem
             developers = summary_data.get("developers", {})
             for dev_slug, dev_data in developers.items():
                 lines_added = dev_data.get("lines_added", 0)
                 if lines_added > 0:
-                    if dev_slug not in developer_totals:
-                        developer_totals[dev_slug] = {
-                            "lines_added": 0,
-                            "display_name": dev_data.get("display_name", dev_slug)
-                        }
-                    developer_totals[dev_slug]["lines_added"] += lines_added
+                    developer_totals[dev_slug] += lines_added
         
         except Exception as e:
-            print(f"Error processing yearly summary file {summary_file}: {e}")
+            app.logger.warning("Error processing yearly summary file %s: %s", summary_file, e)
             continue
     
     if not developer_totals:
         return None
     
     # Find the developer with the most total lines added
-    most_productive_slug = max(developer_totals.keys(), 
-                              key=lambda slug: developer_totals[slug]["lines_added"])
-    most_productive_data = developer_totals[most_productive_slug]
+    most_productive_slug, most_productive_lines = max(developer_totals.items(), key=itemgetter(1))
     
     # Only award if developer has meaningful activity (at least 1000 lines added)
-    if most_productive_data["lines_added"] < 1000:
+    if most_productive_lines < 1000:
         return None
     
     badge = {
         "type": "productivity",
         "badge_type": "most_productive",
         "title": "🚀 Most Productive Developer",
-        "subtitle": f"{most_productive_data['lines_added']:,} lines added ({current_year})",
-        "lines_added": most_productive_data["lines_added"],
+        "subtitle": f"{most_productive_lines:,} lines added ({current_year})",
+        "lines_added": most_productive_lines,
         "year": current_year,
         "description": f"Sum of all lines added across all subsystems during {current_year}. Calculated by aggregating lines_added from all monthly commits for each developer."
     }
@@ -651,104 +1025,6 @@ def analyze_most_productive_badge() -> Optional[Tuple[str, Dict[str, Any]]]:
     return (most_productive_slug, badge)
 
 
-def analyze_ownership_percentage_badges() -> Dict[str, List[Dict[str, Any]]]:
-    """
-    Analyze ownership percentages to create badges for developers who own >10% of a subsystem.
-    """
-    badges = {}
-    
-    try:
-        # Check blame files in the repos structure for ownership percentages
-        repos_path = os.path.join(STATS_ROOT, "repos")
-        if not os.path.exists(repos_path):
-            return badges
-        
-        # Also load services config to understand which services are in which repos
-        services_config = load_services_config()
-        
-        for org_name in os.listdir(repos_path):
-            org_path = os.path.join(repos_path, org_name)
-            if not os.path.isdir(org_path):
-                continue
-                
-            for repo_name in os.listdir(org_path):
-                repo_path = os.path.join(org_path, repo_name)
-                if not os.path.isdir(repo_path):
-                    continue
-                    
-                blame_file = os.path.join(repo_path, "blame", "blame.json")
-                if not os.path.exists(blame_file):
-                    continue
-                
-                try:
-                    blame_data = load_json(blame_file)
-                    repo_full_name = f"{org_name}/{repo_name}"
-                    
-                    # Check individual developers in the blame data
-                    developers = blame_data.get("developers", {})
-                    total_lines = blame_data.get("total_lines", 0)
-                    
-                    if total_lines > 0:  # Prevent division by zero
-                        for dev_slug, dev_data in developers.items():
-                            dev_lines = dev_data.get("lines", 0)
-                            ownership_share = dev_lines / total_lines
-                            
-                            # Only create badge if developer owns >10% of the subsystem
-                            if ownership_share > 0.10:  # More than 10%
-                                if dev_slug not in badges:
-                                    badges[dev_slug] = []
-                                
-                                badges[dev_slug].append({
-                                    "type": "ownership_percentage",
-                                    "badge_type": "significant_owner",
-                                    "title": f"Significant Owner: {repo_name}",
-                                    "subtitle": f"{ownership_share*100:.1f}% ownership ({dev_lines:,} lines)",
-                                    "subsystem": repo_name,
-                                    "repo_path": repo_full_name,
-                                    "lines": dev_lines,
-                                    "share": ownership_share
-                                })
-                    
-                    # Check per-service ownership percentages as well  
-                    services = blame_data.get("services", {})
-                    for service_name, service_data in services.items():
-                        service_developers = service_data.get("developers", {})
-                        service_total_lines = service_data.get("total_lines", 0)
-                        
-                        if service_total_lines > 0:  # Prevent division by zero
-                            for dev_slug, dev_data in service_developers.items():
-                                dev_lines = dev_data.get("lines", 0)
-                                ownership_share = dev_lines / service_total_lines
-                                
-                                # Only create badge if developer owns >10% of the service
-                                if ownership_share > 0.10:  # More than 10%
-                                    if dev_slug not in badges:
-                                        badges[dev_slug] = []
-                                    
-                                    # Avoid duplicating if service name same as repo name
-                                    if service_name != repo_name:
-                                        badges[dev_slug].append({
-                                            "type": "ownership_percentage", 
-                                            "badge_type": "significant_service_owner",
-                                            "title": f"Significant Owner: {service_name}",
-                                            "subtitle": f"{ownership_share*100:.1f}% ownership ({dev_lines:,} lines)",
-                                            "subsystem": service_name,
-                                            "repo_path": repo_full_name,
-                                            "lines": dev_lines,
-                                            "share": ownership_share
-                                        })
-                
-                except Exception as e:
-                    print(f"Error processing blame file {blame_file} for ownership percentages: {e}")
-                    continue
-        
-        return badges
-        
-    except Exception as e:
-        print(f"Error in analyze_ownership_percentage_badges: {e}")
-        return {}
-
-
 def find_user_summary(user_slug: str, from_date: str, to_date: str) -> str:
     """
     Locate monthly user summary, supporting both legacy and new layouts:
@@ -854,7 +1130,7 @@ def api_users():
         try:
             any_month = months[0]
             path = find_user_summary(slug, any_month["from"], any_month["to"])
-            data = load_json(path)
+            data = load_json_cached(path)
             display_name = data.get("author_name") or slug
         except Exception:
             pass
@@ -866,32 +1142,42 @@ def api_users():
                 "months": months,
             }
         )
-    return jsonify({"users": users})
+    return conditional_jsonify({"users": users})
 
 
 @app.route("/api/users/<user_slug>/badges")
 def api_user_badges(user_slug: str):
     """Get badges for a specific user based on blame/ownership analysis."""
     try:
-        print(f"Getting badges for user: {user_slug}")
         all_badges = analyze_developer_badges()
         user_badges = all_badges.get(user_slug, [])
-        print(f"Found {len(user_badges)} badges for user {user_slug}")
+        # Lazy %-arguments: nothing is formatted unless debug logging is on
+        app.logger.debug("Found %d badges for user %s", len(user_badges), user_slug)
         
-        return jsonify({"badges": user_badges})
+        return conditional_jsonify({"badges": [badge_for_response(badge) for badge in user_badges]})
     except Exception as e:
-        print(f"Error analyzing badges for user {user_slug}: {str(e)}")
+        app.logger.exception("Error analyzing badges for user %s", user_slug)
         return jsonify({"badges": [], "error": str(e)})
 
 
 @app.route("/api/developers/total-ownership")
 def api_developers_total_ownership():
     """Get total lines owned by each developer across all subsystems."""
+    global _total_ownership_cache
     try:
-        from collections import defaultdict
+        # Reuse the last result while the blame files and aliases are unchanged
+        alias_file = os.path.join(BASE_DIR, "configuration", "alias.json")
+        try:
+            alias_st = os.stat(alias_file)
+            alias_key = (alias_st.st_mtime_ns, alias_st.st_size)
+        except OSError:
+            alias_key = None
+        fingerprint = (STATS_ROOT, alias_key, _blame_files_fingerprint())
+        cached = _total_ownership_cache
+        if cached is not None and cached[0] == fingerprint:
+            return conditional_jsonify({"developers": cached[1]})
         
         # Load aliases to merge developers
-        alias_file = os.path.join(BASE_DIR, "configuration", "alias.json")
         alias_map = {}
         if os.path.exists(alias_file):
             try:
@@ -899,79 +1185,69 @@ def api_developers_total_ownership():
             except:
                 pass
         
-        # Helper function to get canonical slug
-        def get_canonical_slug(slug):
-            """Apply aliases to get canonical developer slug."""
-            for canonical, aliases in alias_map.items():
-                if isinstance(aliases, list) and slug in aliases:
-                    return canonical
-                elif isinstance(aliases, str) and slug == aliases:
-                    return canonical
-            return slug
+        # Build reverse map once: aliased_slug -> canonical_slug
+        # (setdefault keeps the first canonical name listing an alias)
+        aliased_to_canonical = {}
+        for canonical, aliases in alias_map.items():
+            if isinstance(aliases, list):
+                for alias in aliases:
+                    aliased_to_canonical.setdefault(alias, canonical)
+            elif isinstance(aliases, str):
+                aliased_to_canonical.setdefault(aliases, canonical)
         
-        developer_lines = defaultdict(lambda: {"lines": 0, "subsystems": [], "display_name": ""})
+        developer_lines = defaultdict(lambda: {"lines": 0, "subsystems": set(), "display_name": ""})
         
         # Walk through all blame files
         # Track repos we've already processed to avoid double-counting (standalone vs monorepo)
-        repos_path = os.path.join(STATS_ROOT, "repos")
         processed_repos = set()
         
-        for root, dirs, files in os.walk(repos_path):
-            if "blame.json" in files:
-                blame_file = os.path.join(root, "blame.json")
-                try:
-                    blame_data = load_json(blame_file)
-                    repo_full_name = blame_data.get("repo", "")
-                    repo_name = repo_full_name.split("/")[-1]
-                    
-                    # Skip if we've already processed this repo name (avoid standalone + monorepo duplicates)
-                    if repo_name in processed_repos:
-                        continue
-                    
-                    processed_repos.add(repo_name)
-                    
-                    # Check if this repo has services - if so, use service-level data to avoid double counting
-                    services = blame_data.get("services", {})
-                    
-                    if services:
-                        # Process service-level developers (more granular)
-                        for service_name, service_data in services.items():
-                            service_developers = service_data.get("developers", {})
-                            for dev_slug, dev_data in service_developers.items():
-                                # Apply alias mapping
-                                canonical_slug = get_canonical_slug(dev_slug)
-                                
-                                if isinstance(dev_data, dict):
-                                    lines = dev_data.get("lines", 0)
-                                    display_name = dev_data.get("display_name", dev_slug)
-                                else:
-                                    lines = dev_data if isinstance(dev_data, int) else 0
-                                    display_name = dev_slug
-                                
-                                if lines > 0:
-                                    developer_lines[canonical_slug]["lines"] += lines
-                                    if service_name not in developer_lines[canonical_slug]["subsystems"]:
-                                        developer_lines[canonical_slug]["subsystems"].append(service_name)
-                                    if not developer_lines[canonical_slug]["display_name"]:
-                                        developer_lines[canonical_slug]["display_name"] = display_name
-                    else:
-                        # No services, process main repo developers
-                        developers = blame_data.get("developers", {})
-                        for dev_slug, dev_data in developers.items():
+        for _, _, blame_file, blame_data in _scan_repos_blame():
+            try:
+                repo_full_name = blame_data.get("repo", "")
+                repo_name = repo_full_name.split("/")[-1]
+                
+                # Skip if we've already processed this repo name (avoid standalone + monorepo duplicates)
+                if repo_name in processed_repos:
+                    continue
+                
+                processed_repos.add(repo_name)
+                
+                # Check if this repo has services - if so, use service-level data to avoid double counting
+                services = blame_data.get("services", {})
+                
+                if services:
+                    # Process service-level developers (more granular)
+                    for service_name, service_data in services.items():
+                        service_developers = service_data.get("developers", {})
+                        for dev_slug, dev_data in service_developers.items():
                             # Apply alias mapping
-                            canonical_slug = get_canonical_slug(dev_slug)
+                            canonical_slug = aliased_to_canonical.get(dev_slug, dev_slug)
                             
                             lines = dev_data.get("lines", 0)
                             if lines > 0:
-                                developer_lines[canonical_slug]["lines"] += lines
-                                if repo_name not in developer_lines[canonical_slug]["subsystems"]:
-                                    developer_lines[canonical_slug]["subsystems"].append(repo_name)
-                                if not developer_lines[canonical_slug]["display_name"]:
-                                    developer_lines[canonical_slug]["display_name"] = dev_data.get("display_name", dev_slug)
-                
-                except Exception as e:
-                    print(f"Error processing blame file {blame_file}: {e}")
-                    continue
+                                entry = developer_lines[canonical_slug]
+                                entry["lines"] += lines
+                                entry["subsystems"].add(service_name)
+                                if not entry["display_name"]:
+                                    entry["display_name"] = dev_data.get("display_name", dev_slug)
+                else:
+                    # No services, process main repo developers
+                    developers = blame_data.get("developers", {})
+                    for dev_slug, dev_data in developers.items():
+                        # Apply alias mapping
+                        canonical_slug = aliased_to_canonical.get(dev_slug, dev_slug)
+                        
+                        lines = dev_data.get("lines", 0)
+                        if lines > 0:
+                            entry = developer_lines[canonical_slug]
+                            entry["lines"] += lines
+                            entry["subsystems"].add(repo_name)
+                            if not entry["display_name"]:
+                                entry["display_name"] = dev_data.get("display_name", dev_slug)
+            
+            except Exception as e:
+                app.logger.warning("Error processing blame file %s: %s", blame_file, e)
+                continue
         
         # Convert to list format
         result = []
@@ -980,19 +1256,18 @@ def api_developers_total_ownership():
                 "slug": dev_slug,
                 "display_name": data["display_name"],
                 "total_lines": data["lines"],
-                "subsystem_count": len(set(data["subsystems"])),
-                "subsystems": list(set(data["subsystems"]))
+                "subsystem_count": len(data["subsystems"]),
+                "subsystems": list(data["subsystems"])
             })
         
         # Sort by total lines (descending)
         result.sort(key=lambda x: x["total_lines"], reverse=True)
         
-        return jsonify({"developers": result})
+        _total_ownership_cache = (fingerprint, result)
+        return conditional_jsonify({"developers": result})
         
     except Exception as e:
-        print(f"Error calculating total ownership: {e}")
-        import traceback
-        traceback.print_exc()
+        app.logger.exception("Error calculating total ownership")
         return jsonify({"developers": [], "error": str(e)})
 
 
@@ -1000,9 +1275,6 @@ def api_developers_total_ownership():
 def api_user_ownership_timeline(user_slug: str):
     """Get ownership timeline for subsystems where this user is a top maintainer."""
     try:
-        from datetime import datetime, timedelta
-        from collections import defaultdict
-        
         # First, find which subsystems this user is a top maintainer of
         all_badges = analyze_developer_badges()
         user_badges = all_badges.get(user_slug, [])
@@ -1016,77 +1288,80 @@ def api_user_ownership_timeline(user_slug: str):
         # Also check subsystems where user appears in top maintainers (by recent commits)
         subsystems_path = os.path.join(STATS_ROOT, "subsystems")
         if os.path.exists(subsystems_path):
-            three_months_ago = datetime.now() - timedelta(days=90)
-            for subsystem_name in os.listdir(subsystems_path):
-                subsystem_path = os.path.join(subsystems_path, subsystem_name)
-                if not os.path.isdir(subsystem_path):
-                    continue
-                
-                # Check recent activity
-                has_recent_commits = False
-                for period_dir in os.listdir(subsystem_path):
-                    if not os.path.isdir(os.path.join(subsystem_path, period_dir)):
-                        continue
-                    if "_12-31" in period_dir:  # Skip yearly
+            # Period folders start with their ISO from-date, which compares correctly as a string
+            three_months_ago_str = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
+            with os.scandir(subsystems_path) as subsystem_entries:
+                for subsystem_entry in subsystem_entries:
+                    if not subsystem_entry.is_dir():
                         continue
+                    subsystem_name = subsystem_entry.name
+                    subsystem_path = subsystem_entry.path
                     
-                    try:
-                        from_date_str = period_dir.split("_")[0]
-                        period_date = datetime.strptime(from_date_str, "%Y-%m-%d")
-                        if period_date < three_months_ago:
-                            continue
-                        
-                        summary_file = os.path.join(subsystem_path, period_dir, "summary.json")
-                        if os.path.exists(summary_file):
-                            summary_data = load_json(summary_file)
-                            for repo_data in summary_data.get("repositories", {}).values():
-                                if user_slug in repo_data.get("developers", {}):
-                                    maintainer_subsystems.add(subsystem_name)
-                                    has_recent_commits = True
+                    # Check recent activity
+                    has_recent_commits = False
+                    with os.scandir(subsystem_path) as period_entries:
+                        for period_entry in period_entries:
+                            if not period_entry.is_dir():
+                                continue
+                            period_dir = period_entry.name
+                            
+                            if "_12-31" in period_dir:  # Skip yearly
+                                continue
+                            
+                            try:
+                                if not PERIOD_FOLDER_RE.fullmatch(period_dir):
+                                    continue
+                                if period_dir[:10] <= three_months_ago_str:
+                                    continue
+                                
+                                summary_file = os.path.join(subsystem_path, period_dir, "summary.json")
+                                if os.path.exists(summary_file):
+                                    summary_data = load_json(summary_file)
+                                    for repo_data in summary_data.get("repositories", {}).values():
+                                        if user_slug in repo_data.get("developers", {}):
+                                            maintainer_subsystems.add(subsystem_name)
+                                            has_recent_commits = True
+                                            break
+                                if has_recent_commits:
                                     break
-                        if has_recent_commits:
-                            break
-                    except:
-                        continue
+                            except:
+                                continue
         
         if not maintainer_subsystems:
             return jsonify({"timelines": {}})
         
+        # Load the blame files once; every subsystem below is matched against them
+        blame_entries = []
+        for _, _, _, blame_data in _scan_repos_blame():
+            blame_entries.append((blame_data.get("repo", "").lower(), blame_data))
+        
         # For each subsystem, calculate the ownership timeline
         result = {}
         
         for subsystem_name in maintainer_subsystems:
             try:
                 # Get current ownership from blame
-                repos_path = os.path.join(STATS_ROOT, "repos")
                 current_ownership_lines = 0
                 total_current_lines = 0
+                subsystem_lower = subsystem_name.lower()
                 
-                for root, dirs, files in os.walk(repos_path):
-                    if "blame.json" in files:
-                        blame_file = os.path.join(root, "blame.json")
-                        blame_data = load_json(blame_file)
-                        
-                        # Check repo match
-                        if subsystem_name.lower() in blame_data.get("repo", "").lower():
-                            developers = blame_data.get("developers", {})
-                            total_current_lines = blame_data.get("total_lines", 0)
-                            dev_data = developers.get(user_slug, {})
-                            current_ownership_lines = dev_data.get("lines", 0) if isinstance(dev_data, dict) else 0
-                            break
-                        
-                        # Check service match
-                        services = blame_data.get("services", {})
-                        if subsystem_name in services:
-                            service_data = services[subsystem_name]
-                            developers = service_data.get("developers", {})
-                            total_current_lines = service_data.get("total_lines", 0)
-                            dev_data = developers.get(user_slug, {})
-                            if isinstance(dev_data, dict):
-                                current_ownership_lines = dev_data.get("lines", 0)
-                            else:
-                                current_ownership_lines = dev_data if dev_data else 0
-                            break
+                for repo_lower, blame_data in blame_entries:
+                    # Check repo match
+                    if subsystem_lower in repo_lower:
+                        developers = blame_data.get("developers", {})
+                        total_current_lines = blame_data.get("total_lines", 0)
+                        dev_data = developers.get(user_slug, {})
+                        current_ownership_lines = dev_data.get("lines", 0)
+                        break
+                    
+                    # Check service match
+                    services = blame_data.get("services", {})
+                    if subsystem_name in services:
+                        service_data = services[subsystem_name]
+                        developers = service_data.get("developers", {})
+                        total_current_lines = service_data.get("total_lines", 0)
+                        current_ownership_lines = developers.get(user_slug, {}).get("lines", 0)
+                        break
                 
                 if total_current_lines == 0:
                     continue
@@ -1097,15 +1372,18 @@ def api_user_ownership_timeline(user_slug: str):
                     continue
                 
                 monthly_net_changes = defaultdict(lambda: defaultdict(int))
+                # Net change of all developers per month, summed while reading
+                monthly_total_changes = defaultdict(int)
                 
                 for period_dir in os.listdir(subsystem_path):
                     if period_dir == 'languages.json' or '_12-31' in period_dir:
                         continue
                     
+                    if not PERIOD_FOLDER_RE.fullmatch(period_dir):
+                        continue
+                    
                     try:
-                        from_date_str = period_dir.split('_')[0]
-                        period_date = datetime.strptime(from_date_str, "%Y-%m-%d")
-                        month_label = period_date.strftime("%Y-%m")
+                        month_label = period_dir[:7]
                         
                         summary_file = os.path.join(subsystem_path, period_dir, "summary.json")
                         if not os.path.exists(summary_file):
@@ -1118,27 +1396,30 @@ def api_user_ownership_timeline(user_slug: str):
                                 lines_deleted = dev_data.get("lines_deleted", 0)
                                 net_lines = lines_added - lines_deleted
                                 monthly_net_changes[dev_slug][month_label] += net_lines
+                                monthly_total_changes[month_label] += net_lines
                     except:
                         continue
                 
                 # Calculate backward timeline
-                all_months = sorted(set(month for dev_data in monthly_net_changes.values() for month in dev_data.keys()))
+                all_months = sorted(monthly_total_changes)
                 if not all_months:
                     continue
                 
                 percentages = []
                 dev_lines = current_ownership_lines
                 total_lines = total_current_lines
+                user_changes = monthly_net_changes.get(user_slug, {})
                 
                 for month in reversed(all_months):
                     percentage = (dev_lines / total_lines * 100) if total_lines > 0 else 0
-                    percentages.insert(0, round(percentage, 1))
+                    percentages.append(round(percentage, 1))
                     
-                    dev_lines -= monthly_net_changes[user_slug].get(month, 0)
-                    total_lines -= sum(monthly_net_changes[dev].get(month, 0) for dev in monthly_net_changes.keys())
+                    dev_lines -= user_changes.get(month, 0)
+                    total_lines -= monthly_total_changes[month]
                     
                     dev_lines = max(0, dev_lines)
                     total_lines = max(1, total_lines)
+                percentages.reverse()
                 
                 result[subsystem_name] = {
                     "months": all_months,
@@ -1147,15 +1428,13 @@ def api_user_ownership_timeline(user_slug: str):
                 }
                 
             except Exception as e:
-                print(f"Error calculating timeline for {subsystem_name}: {e}")
+                app.logger.warning("Error calculating timeline for %s: %s", subsystem_name, e)
                 continue
         
-        return jsonify({"timelines": result})
+        return conditional_jsonify({"timelines": result})
         
     except Exception as e:
-        print(f"Error generating ownership timeline for user {user_slug}: {e}")
-        import traceback
-        traceback.print_exc()
+        app.logger.exception("Error generating ownership timeline for user %s", user_slug)
         return jsonify({"timelines": {}, "error": str(e)})
 
 
@@ -1196,17 +1475,25 @@ def api_subsystems():
             }
         )
     
-    return jsonify({"subsystems": subsystems})
+    return conditional_jsonify({"subsystems": subsystems})
 
 
-def load_services_config() -> Dict[str, Dict[str, list]]:
-    """Load services configuration from JSON."""
-    services_path = "configuration/services.json"
-    if not os.path.isfile(services_path):
-        return {}
+def _config_file_key(path: str) -> Optional[Tuple]:
+    """(path, mtime, size) of a configuration file; None if it is not a regular file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not os.path.isfile(path):
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
 
+
+@lru_cache(maxsize=8)
+def _read_config_dict(key: Tuple) -> Dict[str, Any]:
+    """Parse the JSON object in key's file; {} if it is unreadable or not an object."""
     try:
-        with open(services_path, "r", encoding="utf-8") as f:
+        with open(key[0], "r", encoding="utf-8") as f:
             data = json.load(f)
         
         if not isinstance(data, dict):
@@ -1217,34 +1504,57 @@ def load_services_config() -> Dict[str, Dict[str, list]]:
         return {}
 
 
+def load_services_config() -> Dict[str, Dict[str, list]]:
+    """
+    Load services configuration from JSON.
+    The result is reused until the file changes; treat it as read-only.
+    """
+    key = _config_file_key("configuration/services.json")
+    if key is None:
+        return {}
+    return _read_config_dict(key)
+
+
 def load_team_subsystem_responsibilities() -> Dict[str, List[str]]:
-    """Load team-subsystem responsibilities from JSON."""
-    responsibilities_path = os.path.join(BASE_DIR, "configuration/team_subsystem_responsibilities.json")
-    if not os.path.isfile(responsibilities_path):
+    """
+    Load team-subsystem responsibilities from JSON.
+    The result is reused until the file changes; treat it as read-only.
+    """
+    key = _config_file_key(os.path.join(BASE_DIR, "configuration/team_subsystem_responsibilities.json"))
+    if key is None:
         return {}
+    return _read_config_dict(key)
 
-    try:
-        with open(responsibilities_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        if not isinstance(data, dict):
-            return {}
-        
-        return data
-    except (json.JSONDecodeError, IOError):
+
+def load_teams_config() -> Dict[str, Dict[str, Any]]:
+    """
+    Load the teams configuration from JSON.
+    The result is reused until the file changes; treat it as read-only.
+    """
+    key = _config_file_key(os.path.join(BASE_DIR, "configuration/teams.json"))
+    if key is None:
         return {}
+    return _read_config_dict(key)
+
+
+@lru_cache(maxsize=4)
+def _subsystem_teams_index(key: Tuple) -> Dict[str, Tuple[str, ...]]:
+    """Reverse of the responsibilities file in key: subsystem -> responsible team ids."""
+    index = defaultdict(list)
+    for team_id, subsystems in _read_config_dict(key).items():
+        if not isinstance(subsystems, list):
+            continue
+        for subsystem_name in dict.fromkeys(name for name in subsystems if isinstance(name, str)):
+            index[subsystem_name].append(team_id)
+    return {subsystem_name: tuple(team_ids) for subsystem_name, team_ids in index.items()}
 
 
 def get_subsystem_responsible_teams(subsystem_name: str) -> List[str]:
     """Get list of teams responsible for a given subsystem."""
-    responsibilities = load_team_subsystem_responsibilities()
-    responsible_teams = []
-    
-    for team_id, subsystems in responsibilities.items():
-        if subsystem_name in subsystems:
-            responsible_teams.append(team_id)
-    
-    return responsible_teams
+    key = _config_file_key(os.path.join(BASE_DIR, "configuration/team_subsystem_responsibilities.json"))
+    if key is None:
+        return []
+    return list(_subsystem_teams_index(key).get(subsystem_name, ()))
 
 
 def get_team_responsible_subsystems(team_id: str) -> List[str]:
@@ -1253,6 +1563,44 @@ def get_team_responsible_subsystems(team_id: str) -> List[str]:
     return responsibilities.get(team_id, [])
 
 
+# Top-level "total_commits" of a subsystem summary as written by service.py (indent=2);
+# nested objects are indented deeper, so this cannot match a per-repo or per-developer key
+SUMMARY_TOTAL_COMMITS_RE = re.compile(rb'\n  "total_commits": (-?[0-9]+)[,\n]')
+
+
+def read_summary_total_commits(summary_file: str) -> int:
+    """Read only total_commits from a subsystem summary.json, without decoding the rest."""
+    with open(summary_file, "rb") as f:
+        content = f.read()
+    match = SUMMARY_TOTAL_COMMITS_RE.search(content)
+    if match:
+        return int(match.group(1))
+    # Not in the expected layout (e.g. written compactly): parse the whole file
+    summary_data = parse_json(content)
+    return summary_data.get("total_commits", 0)
+
+
+@lru_cache(maxsize=4096)
+def _summary_developer_changes(summary_file: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, int, int], ...]:
+    summary_data = load_json(summary_file)
+    changes = []
+    for repo_data in summary_data.get("repositories", {}).values():
+        for dev_slug, dev_data in repo_data.get("developers", {}).items():
+            net_lines = dev_data.get("lines_added", 0) - dev_data.get("lines_deleted", 0)
+            changes.append((dev_slug, dev_data.get("commits", 0), net_lines))
+    return tuple(changes)
+
+
+def summary_developer_changes(summary_file: str) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    (dev_slug, commits, net_lines) for every repository/developer entry of a subsystem
+    summary.json. Only these numbers are kept, per file version, instead of the whole
+    parsed summary.
+    """
+    st = os.stat(summary_file)
+    return _summary_developer_changes(summary_file, st.st_mtime_ns, st.st_size)
+
+
 def detect_dead_subsystems(threshold_months: int = 3) -> Dict[str, Dict[str, Any]]:
     """
     Detect subsystems with no recent activity.
@@ -1263,8 +1611,9 @@ def detect_dead_subsystems(threshold_months: int = 3) -> Dict[str, Dict[str, Any
         "last_activity_date": str or None,
         "months_since_activity": int or None
     }
+    The result is reused until the subsystem stats or the date change; treat it as read-only.
     """
-    from datetime import datetime, timedelta
+    global _dead_subsystems_cache
     
     current_date = datetime.now()
     threshold_date = current_date - timedelta(days=30 * threshold_months)
@@ -1275,16 +1624,22 @@ def detect_dead_subsystems(threshold_months: int = 3) -> Dict[str, Dict[str, Any
     if not os.path.exists(subsystems_root):
         return subsystem_status
     
-    for subsystem_name in os.listdir(subsystems_root):
-        subsystem_dir = os.path.join(subsystems_root, subsystem_name)
-        if not os.path.isdir(subsystem_dir):
-            continue
+    # Activity dates are whole days, so the status only moves with the date
+    fingerprint = (subsystems_root, threshold_months, current_date.strftime("%Y-%m-%d"), _stats_snapshot_key(subsystems_root))
+    cached = _dead_subsystems_cache
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    # The cached scandir snapshot only lists period folders that have a summary.json
+    for subsystem_name, period_dirs in list_subsystem_summary_folders().items():
+        subsystem_prefix = subsystems_root + os.sep + subsystem_name + os.sep
         
-        # Find the most recent activity by checking all period directories
+        # Find the most recent activity from the period directory names first
         # Only look at monthly data, not yearly summaries
         latest_activity_date = None
+        monthly_periods = []
         
-        for period_dir in os.listdir(subsystem_dir):
+        for period_dir in period_dirs:
             if "_" not in period_dir:
                 continue
                 
@@ -1292,30 +1647,31 @@ def detect_dead_subsystems(threshold_months: int = 3) -> Dict[str, Dict[str, Any
                 date_from, date_to = period_dir.split("_", 1)
                 
                 # Skip yearly summaries (check if it spans a full year)
-                from_date_obj = datetime.strptime(date_from, "%Y-%m-%d")
-                to_date_obj = datetime.strptime(date_to, "%Y-%m-%d")
-                
-                # Skip if this is a yearly summary (spans more than 35 days)
-                days_span = (to_date_obj - from_date_obj).days
-                if days_span > 35:
-                    continue
-                
-                period_path = os.path.join(subsystem_dir, period_dir)
-                summary_file = os.path.join(period_path, "summary.json")
-                
-                if os.path.exists(summary_file):
-                    # Check if this period has any commits
-                    with open(summary_file, "r", encoding="utf-8") as f:
-                        summary_data = json.load(f)
-                    
-                    total_commits = summary_data.get("total_commits", 0)
-                    if total_commits > 0:
-                        # Use the end date of this period
-                        if latest_activity_date is None or to_date_obj > latest_activity_date:
-                            latest_activity_date = to_date_obj
-                            
+                from_date_obj = datetime.fromisoformat(date_from)
+                to_date_obj = datetime.fromisoformat(date_to)
+            except ValueError:
+                continue
+            
+            # Skip if this is a yearly summary (spans more than 35 days)
+            days_span = (to_date_obj - from_date_obj).days
+            if days_span > 35:
+                continue
+            monthly_periods.append((to_date_obj, period_dir))
+        
+        # Newest period first: the first one with commits is the latest activity,
+        # so older summaries never need to be read
+        monthly_periods.sort(reverse=True)
+        for to_date_obj, period_dir in monthly_periods:
+            try:
+                # Check if this period has any commits
+                summary_file = subsystem_prefix + period_dir + SUMMARY_FILE_SUFFIX
+                total_commits = read_summary_total_commits(summary_file)
             except (ValueError, json.JSONDecodeError, IOError):
                 continue
+            if total_commits > 0:
+                # Use the end date of this period
+                latest_activity_date = to_date_obj
+                break
         
         # Determine if subsystem is dead
         is_dead = False
@@ -1337,6 +1693,7 @@ def detect_dead_subsystems(threshold_months: int = 3) -> Dict[str, Dict[str, Any
             "months_since_activity": months_since_activity
         }
     
+    _dead_subsystems_cache = (fingerprint, subsystem_status)
     return subsystem_status
 
 
@@ -1345,9 +1702,9 @@ def api_subsystems_dead_status():
     """Get dead/inactive subsystem status for all subsystems."""
     try:
         dead_status = detect_dead_subsystems()
-        return jsonify({"subsystem_status": dead_status})
+        return conditional_jsonify({"subsystem_status": dead_status})
     except Exception as e:
-        print(f"Error in api_subsystems_dead_status: {str(e)}")
+        app.logger.exception("Error in api_subsystems_dead_status")
         return jsonify({"subsystem_status": {}, "error": str(e)})
 
 
@@ -1401,10 +1758,10 @@ def api_subsystem_year(subsystem_name: str, year: int):
 def api_subsystem_top_maintainers(subsystem_name: str):
     """Get top maintainers for a subsystem based on recent commit activity."""
     try:
-        # Get current date to determine last 3 months
-        from datetime import datetime, timedelta
+        # Get current date to determine last 3 months; period folders start with their
+        # ISO from-date, which compares correctly as a string
         current_date = datetime.now()
-        three_months_ago = current_date - timedelta(days=90)
+        three_months_ago_str = (current_date - timedelta(days=90)).strftime("%Y-%m-%d")
         
         subsystem_path = os.path.join(STATS_ROOT, "subsystems", subsystem_name)
         if not os.path.exists(subsystem_path):
@@ -1413,67 +1770,60 @@ def api_subsystem_top_maintainers(subsystem_name: str):
         maintainer_data = {}  # dev_slug -> {commits, display_name, etc}
         
         # Look for monthly summary files from last 3 months
-        for period_dir in os.listdir(subsystem_path):
-            period_path = os.path.join(subsystem_path, period_dir)
-            if not os.path.isdir(period_path):
-                continue
-            
-            # Skip yearly summaries for maintainer analysis
-            if "_2025-12-31" in period_dir:
-                continue
-            
-            # Parse date range from directory name
-            try:
-                date_parts = period_dir.split("_")
-                if len(date_parts) != 2:
+        with os.scandir(subsystem_path) as period_entries:
+            for period_entry in period_entries:
+                if not period_entry.is_dir():
                     continue
+                period_dir = period_entry.name
+                period_path = period_entry.path
                 
-                from_date_str = date_parts[0]
-                period_date = datetime.strptime(from_date_str, "%Y-%m-%d")
+                # Skip yearly summaries for maintainer analysis
+                if "_2025-12-31" in period_dir:
+                    continue
                 
                 # Only consider periods within last 3 months
-                if period_date < three_months_ago:
+                if not PERIOD_FOLDER_RE.fullmatch(period_dir):
+                    continue
+                if period_dir[:10] <= three_months_ago_str:
                     continue
                 
-            except (ValueError, IndexError):
-                continue
-            
-            summary_file = os.path.join(period_path, "summary.json")
-            if not os.path.exists(summary_file):
-                continue
-            
-            try:
-                summary_data = load_json(summary_file)
+                summary_file = os.path.join(period_path, "summary.json")
+                if not os.path.exists(summary_file):
+                    continue
                 
-                # Aggregate commits from all repositories for this subsystem/period
-                repositories = summary_data.get("repositories", {})
-                for repo_data in repositories.values():
-                    developers = repo_data.get("developers", {})
-                    for dev_slug, dev_data in developers.items():
-                        commits = dev_data.get("commits", 0)
-                        if commits > 0:
-                            if dev_slug not in maintainer_data:
-                                maintainer_data[dev_slug] = {
-                                    "slug": dev_slug,
-                                    "display_name": dev_data.get("display_name", dev_slug),
-                                    "commits": 0,
-                                    "lines_added": 0,
-                                    "lines_deleted": 0,
-                                    "changed_lines": 0
-                                }
-                            maintainer_data[dev_slug]["commits"] += commits
-                            maintainer_data[dev_slug]["lines_added"] += dev_data.get("lines_added", 0)
-                            maintainer_data[dev_slug]["lines_deleted"] += dev_data.get("lines_deleted", 0)
-                            maintainer_data[dev_slug]["changed_lines"] += dev_data.get("changed_lines", 0)
-            
-            except Exception as e:
-                print(f"Error processing summary file {summary_file}: {e}")
-                continue
+                try:
+                    summary_data = load_json(summary_file)
+                    
+                    # Aggregate commits from all repositories for this subsystem/period
+                    repositories = summary_data.get("repositories", {})
+                    for repo_data in repositories.values():
+                        developers = repo_data.get("developers", {})
+                        for dev_slug, dev_data in developers.items():
+                            commits = dev_data.get("commits", 0)
+                            if commits > 0:
+                                entry = maintainer_data.get(dev_slug)
+                                if entry is None:
+                                    entry = maintainer_data[dev_slug] = {
+                                        "slug": dev_slug,
+                                        "display_name": dev_data.get("display_name", dev_slug),
+                                        "commits": 0,
+                                        "lines_added": 0,
+                                        "lines_deleted": 0,
+                                        "changed_lines": 0
+                                    }
+                                entry["commits"] += commits
+                                entry["lines_added"] += dev_data.get("lines_added", 0)
+                                entry["lines_deleted"] += dev_data.get("lines_deleted", 0)
+                                entry["changed_lines"] += dev_data.get("changed_lines", 0)
+                
+                except Exception as e:
+                    app.logger.warning("Error processing summary file %s: %s", summary_file, e)
+                    continue
         
         # Sort by commits and take top 5
-        top_maintainers = sorted(maintainer_data.values(), key=lambda x: x["commits"], reverse=True)[:5]
+        top_maintainers = heapq.nlargest(5, maintainer_data.values(), key=lambda x: x["commits"])
         
-        return jsonify({"maintainers": top_maintainers})
+        return conditional_jsonify({"maintainers": top_maintainers})
         
     except Exception as e:
         abort(500, description=f"Error analyzing top maintainers: {str(e)}")
@@ -1483,131 +1833,82 @@ def api_subsystem_top_maintainers(subsystem_name: str):
 def api_subsystem_maintainer_timeline(subsystem_name: str):
     """Get historical ownership percentage timeline based on current blame data and monthly changes."""
     try:
-        from datetime import datetime
-        from collections import defaultdict
-        
         subsystem_path = os.path.join(STATS_ROOT, "subsystems", subsystem_name)
         if not os.path.exists(subsystem_path):
             return jsonify({"timeline": {}})
         
         # First, get current ownership from blame data
-        repos_path = os.path.join(STATS_ROOT, "repos")
         current_ownership = {}  # {dev_slug: lines_owned}
         total_current_lines = 0
         
         # Look for blame data for this subsystem (could be a repo or a service)
-        for root, dirs, files in os.walk(repos_path):
-            if "blame.json" in files:
-                blame_file = os.path.join(root, "blame.json")
-                try:
-                    blame_data = load_json(blame_file)
-                    
-                    # Check if this is a direct repo match
-                    if subsystem_name.lower() in blame_data.get("repo", "").lower():
-                        developers = blame_data.get("developers", {})
-                        total_current_lines = blame_data.get("total_lines", 0)
-                        for dev_slug, dev_data in developers.items():
-                            current_ownership[dev_slug] = dev_data.get("lines", 0)
-                        break
-                    
-                    # Check if this is a service within a repo
-                    services = blame_data.get("services", {})
-                    if subsystem_name in services:
-                        service_data = services[subsystem_name]
-                        developers = service_data.get("developers", {})
-                        total_current_lines = service_data.get("total_lines", 0)
-                        for dev_slug, dev_data in developers.items():
-                            if isinstance(dev_data, dict):
-                                current_ownership[dev_slug] = dev_data.get("lines", 0)
-                            else:
-                                current_ownership[dev_slug] = dev_data
-                        break
-                except Exception as e:
-                    continue
+        for _, _, blame_file, blame_data in _scan_repos_blame():
+            try:
+                # Check if this is a direct repo match
+                if subsystem_name.lower() in blame_data.get("repo", "").lower():
+                    developers = blame_data.get("developers", {})
+                    total_current_lines = blame_data.get("total_lines", 0)
+                    for dev_slug, dev_data in developers.items():
+                        current_ownership[dev_slug] = dev_data.get("lines", 0)
+                    break
+                
+                # Check if this is a service within a repo
+                services = blame_data.get("services", {})
+                if subsystem_name in services:
+                    service_data = services[subsystem_name]
+                    developers = service_data.get("developers", {})
+                    total_current_lines = service_data.get("total_lines", 0)
+                    for dev_slug, dev_data in developers.items():
+                        current_ownership[dev_slug] = dev_data.get("lines", 0)
+                    break
+            except Exception as e:
+                continue
         
         if not current_ownership or total_current_lines == 0:
             return jsonify({"timeline": {}})
         
-        # Now get monthly net line changes (lines_added - lines_deleted)
+        # Now get monthly net line changes (lines_added - lines_deleted) and, for the
+        # last 3 months, commits per developer, from one pass over the summaries
         # Structure: {dev_slug: {month: net_lines}}
         monthly_net_changes = defaultdict(lambda: defaultdict(int))
+        monthly_total_changes = Counter()
+        recent_activity = Counter()
         
-        # Look for monthly summary files
-        for period_dir in os.listdir(subsystem_path):
-            period_path = os.path.join(subsystem_path, period_dir)
-            if not os.path.isdir(period_path):
+        # Recent activity uses the same 3-month window as the top-maintainers endpoint
+        three_months_ago_str = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
+        
+        for period_dir in list_subsystem_summary_folders().get(subsystem_name, ()):
+            if not PERIOD_FOLDER_RE.fullmatch(period_dir):
                 continue
             
             # Skip yearly summaries
-            if "_2025-12-31" in period_dir or "_2024-12-31" in period_dir:
+            counts_monthly = "_2025-12-31" not in period_dir and "_2024-12-31" not in period_dir
+            counts_recent = "_12-31" not in period_dir and period_dir[:10] > three_months_ago_str
+            if not counts_monthly and not counts_recent:
                 continue
             
-            # Parse date range from directory name
+            summary_file = os.path.join(subsystem_path, period_dir, "summary.json")
             try:
-                date_parts = period_dir.split("_")
-                if len(date_parts) != 2:
-                    continue
-                
-                from_date_str = date_parts[0]
-                period_date = datetime.strptime(from_date_str, "%Y-%m-%d")
-                month_label = period_date.strftime("%Y-%m")
-                
-            except (ValueError, IndexError):
-                continue
-            
-            summary_file = os.path.join(period_path, "summary.json")
-            if not os.path.exists(summary_file):
-                continue
-            
-            try:
-                summary_data = load_json(summary_file)
-                
-                repositories = summary_data.get("repositories", {})
-                for repo_data in repositories.values():
-                    developers = repo_data.get("developers", {})
-                    for dev_slug, dev_data in developers.items():
-                        lines_added = dev_data.get("lines_added", 0)
-                        lines_deleted = dev_data.get("lines_deleted", 0)
-                        net_lines = lines_added - lines_deleted
-                        monthly_net_changes[dev_slug][month_label] += net_lines
-            
+                changes = summary_developer_changes(summary_file)
             except Exception as e:
-                print(f"Error processing summary file {summary_file}: {e}")
-                continue
-        
-        # Get top 5 maintainers by recent activity (last 3 months) - same as top-maintainers endpoint
-        from datetime import timedelta
-        three_months_ago = datetime.now() - timedelta(days=90)
-        recent_activity = defaultdict(int)
-        
-        for period_dir in os.listdir(subsystem_path):
-            if period_dir == 'languages.json' or '_12-31' in period_dir:
+                app.logger.warning("Error processing summary file %s: %s", summary_file, e)
                 continue
             
-            try:
-                from_date_str = period_dir.split('_')[0]
-                period_date = datetime.strptime(from_date_str, "%Y-%m-%d")
-                if period_date < three_months_ago:
-                    continue
-                
-                summary_file = os.path.join(subsystem_path, period_dir, "summary.json")
-                if not os.path.exists(summary_file):
-                    continue
-                
-                summary_data = load_json(summary_file)
-                for repo_data in summary_data.get("repositories", {}).values():
-                    for dev_slug, dev_data in repo_data.get("developers", {}).items():
-                        recent_activity[dev_slug] += dev_data.get("commits", 0)
-            except:
-                continue
+            month_label = period_dir[:7]
+            for dev_slug, commits, net_lines in changes:
+                if counts_monthly:
+                    monthly_net_changes[dev_slug][month_label] += net_lines
+                    monthly_total_changes[month_label] += net_lines
+                if counts_recent:
+                    recent_activity[dev_slug] += commits
         
         # Select top 5 by recent commits
-        top_maintainers = sorted(recent_activity.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_maintainers = recent_activity.most_common(5)
         top_maintainers_slugs = [slug for slug, _ in top_maintainers]
         
         # Build backward timeline
         result = {}
-        all_months = sorted(set(month for dev_data in monthly_net_changes.values() for month in dev_data.keys()))
+        all_months = sorted(monthly_total_changes)
         
         for dev_slug in top_maintainers_slugs:
             percentages = []
@@ -1615,32 +1916,32 @@ def api_subsystem_maintainer_timeline(subsystem_name: str):
             # Start with current ownership
             dev_lines = current_ownership.get(dev_slug, 0)
             total_lines = total_current_lines
+            dev_changes = monthly_net_changes.get(dev_slug, {})
             
             # Work backwards through months (reverse chronological order)
             for month in reversed(all_months):
                 # Calculate ownership at this point in time
                 percentage = (dev_lines / total_lines * 100) if total_lines > 0 else 0
-                percentages.insert(0, round(percentage, 1))  # Insert at beginning since we're going backwards
+                percentages.append(round(percentage, 1))  # Newest first; reversed below
                 
                 # Subtract this month's changes to get previous month's state
-                dev_lines -= monthly_net_changes[dev_slug].get(month, 0)
-                total_lines -= sum(monthly_net_changes[dev].get(month, 0) for dev in monthly_net_changes.keys())
+                dev_lines -= dev_changes.get(month, 0)
+                total_lines -= monthly_total_changes[month]
                 
                 # Don't let values go negative
                 dev_lines = max(0, dev_lines)
                 total_lines = max(1, total_lines)  # Avoid division by zero
+            percentages.reverse()
             
             result[dev_slug] = {
                 "months": all_months,
                 "ownership": percentages
             }
         
-        return jsonify({"timeline": result})
+        return conditional_jsonify({"timeline": result})
         
     except Exception as e:
-        print(f"Error in maintainer timeline: {e}")
-        import traceback
-        traceback.print_exc()
+        app.logger.exception("Error in maintainer timeline")
         abort(500, description=f"Error generating maintainer timeline: {str(e)}")
 
 
@@ -1648,7 +1949,7 @@ def api_subsystem_maintainer_timeline(subsystem_name: str):
 def api_subsystem_significant_ownership(subsystem_name: str):
     """Get developers with >10% ownership of a subsystem."""
     try:
-        significant_owners = []
+        owners_by_slug = {}  # dev_slug -> owner entry with the highest share seen
         
         # Check blame files in the repos structure for ownership percentages
         repos_path = os.path.join(STATS_ROOT, "repos")
@@ -1658,100 +1959,100 @@ def api_subsystem_significant_ownership(subsystem_name: str):
         # Load services config to understand which repo might contain this service
         services_config = load_services_config()
         
-        for org_name in os.listdir(repos_path):
-            org_path = os.path.join(repos_path, org_name)
-            if not os.path.isdir(org_path):
-                continue
-                
-            for repo_name in os.listdir(org_path):
-                repo_path = os.path.join(org_path, repo_name)
-                if not os.path.isdir(repo_path):
-                    continue
-                    
-                blame_file = os.path.join(repo_path, "blame", "blame.json")
-                if not os.path.exists(blame_file):
-                    # Skip repos without blame files
+        with os.scandir(repos_path) as org_entries:
+            for org_entry in org_entries:
+                if not org_entry.is_dir():
                     continue
+                org_name = org_entry.name
+                org_path = org_entry.path
                 
-                try:
-                    blame_data = load_json(blame_file)
-                    repo_full_name = f"{org_name}/{repo_name}"
-                    
-                    # Check if this repo matches our subsystem name
-                    repo_matches = (repo_name == subsystem_name or 
-                                   f"{org_name}/{repo_name}" == subsystem_name)
-                    
-                    # If repo matches, check repo-level developers
-                    if repo_matches:
-                        developers = blame_data.get("developers", {})
-                        total_lines = blame_data.get("total_lines", 0)
+                with os.scandir(org_path) as repo_entries:
+                    for repo_entry in repo_entries:
+                        if not repo_entry.is_dir():
+                            continue
+                        repo_name = repo_entry.name
+                        repo_path = repo_entry.path
                         
-                        for dev_slug, dev_data in developers.items():
-                            dev_lines = dev_data.get("lines", 0)
-                            ownership_share = dev_lines / total_lines if total_lines > 0 else 0
+                        blame_file = os.path.join(repo_path, "blame", "blame.json")
+                        if not os.path.exists(blame_file):
+                            # Skip repos without blame files
+                            continue
+                        
+                        try:
+                            blame_data = load_blame_json_cached(blame_file)
+                            repo_full_name = f"{org_name}/{repo_name}"
                             
-                            # Only include developers with >10% ownership
-                            if ownership_share > 0.10:  # More than 10%
-                                significant_owners.append({
-                                    "slug": dev_slug,
-                                    "display_name": dev_data.get("display_name", dev_slug),
-                                    "lines": dev_lines,
-                                    "share": ownership_share,
-                                    "percentage": round(ownership_share * 100, 1),
-                                    "source": f"repo-{repo_name}"
-                                })
-                    
-                    # Always check per-service ownership percentages
-                    services = blame_data.get("services", {})
-                    for service_name, service_data in services.items():
-                        # Check if this service matches our subsystem
-                        if service_name == subsystem_name:
-                            service_developers = service_data.get("developers", {})
-                            service_total_lines = service_data.get("total_lines", 0)
+                            # Check if this repo matches our subsystem name
+                            repo_matches = (repo_name == subsystem_name or 
+                                           f"{org_name}/{repo_name}" == subsystem_name)
                             
-                            for dev_slug, dev_data in service_developers.items():
-                                dev_lines = dev_data.get("lines", 0)
-                                ownership_share = dev_lines / service_total_lines if service_total_lines > 0 else 0
+                            # If repo matches, check repo-level developers
+                            if repo_matches:
+                                developers = blame_data.get("developers", {})
+                                total_lines = blame_data.get("total_lines", 0)
                                 
-                                # Only include developers with >10% ownership
-                                if ownership_share > 0.10:  # More than 10%
-                                    # Check if we already have this developer from repo-level analysis
-                                    existing = next((o for o in significant_owners if o["slug"] == dev_slug), None)
-                                    if not existing:
-                                        significant_owners.append({
-                                            "slug": dev_slug,
-                                            "display_name": dev_data.get("display_name", dev_slug),
-                                            "lines": dev_lines,
-                                            "share": ownership_share,
-                                            "percentage": round(ownership_share * 100, 1),
-                                            "source": f"service-{service_name}-in-{repo_name}"
-                                        })
-                                    elif ownership_share > existing["share"]:
-                                        # Update if this service has higher ownership
-                                        existing.update({
-                                            "lines": dev_lines,
-                                            "share": ownership_share,
-                                            "percentage": round(ownership_share * 100, 1),
-                                            "source": f"service-{service_name}-in-{repo_name}"
-                                        })
-                
-                except Exception as e:
-                    print(f"Error processing blame file {blame_file} for significant ownership: {e}")
-                    continue
-        
-        # Sort by ownership percentage (descending) and remove duplicates
-        unique_owners = {}
-        for owner in significant_owners:
-            slug = owner["slug"]
-            if slug not in unique_owners or owner["share"] > unique_owners[slug]["share"]:
-                unique_owners[slug] = owner
+                                for dev_slug, dev_data in developers.items():
+                                    dev_lines = dev_data.get("lines", 0)
+                                    ownership_share = dev_lines / total_lines if total_lines > 0 else 0
+                                    
+                                    # Only include developers with >10% ownership
+                                    if ownership_share > 0.10:  # More than 10%
+                                        existing = owners_by_slug.get(dev_slug)
+                                        if not existing or ownership_share > existing["share"]:
+                                            owners_by_slug[dev_slug] = {
+                                                "slug": dev_slug,
+                                                "display_name": dev_data.get("display_name", dev_slug),
+                                                "lines": dev_lines,
+                                                "share": ownership_share,
+                                                "percentage": round(ownership_share * 100, 1),
+                                                "source": f"repo-{repo_name}"
+                                            }
+                            
+                            # Always check per-service ownership percentages
+                            services = blame_data.get("services", {})
+                            for service_name, service_data in services.items():
+                                # Check if this service matches our subsystem
+                                if service_name == subsystem_name:
+                                    service_developers = service_data.get("developers", {})
+                                    service_total_lines = service_data.get("total_lines", 0)
+                                    
+                                    for dev_slug, dev_data in service_developers.items():
+                                        dev_lines = dev_data.get("lines", 0)
+                                        ownership_share = dev_lines / service_total_lines if service_total_lines > 0 else 0
+                                        
+                                        # Only include developers with >10% ownership
+                                        if ownership_share > 0.10:  # More than 10%
+                                            # Check if we already have this developer from repo-level analysis
+                                            existing = owners_by_slug.get(dev_slug)
+                                            if not existing:
+                                                owners_by_slug[dev_slug] = {
+                                                    "slug": dev_slug,
+                                                    "display_name": dev_data.get("display_name", dev_slug),
+                                                    "lines": dev_lines,
+                                                    "share": ownership_share,
+                                                    "percentage": round(ownership_share * 100, 1),
+                                                    "source": f"service-{service_name}-in-{repo_name}"
+                                                }
+                                            elif ownership_share > existing["share"]:
+                                                # Update if this service has higher ownership
+                                                existing.update({
+                                                    "lines": dev_lines,
+                                                    "share": ownership_share,
+                                                    "percentage": round(ownership_share * 100, 1),
+                                                    "source": f"service-{service_name}-in-{repo_name}"
+                                                })
+                        
+                        except Exception as e:
+                            app.logger.warning("Error processing blame file %s for significant ownership: %s", blame_file, e)
+                            continue
         
-        sorted_owners = sorted(unique_owners.values(), key=lambda x: x["share"], reverse=True)
+        # Sort by ownership percentage (descending)
+        sorted_owners = sorted(owners_by_slug.values(), key=lambda x: x["share"], reverse=True)
         
-        return jsonify({"owners": sorted_owners})
+        return conditional_jsonify({"owners": sorted_owners})
         
     except Exception as e:
-        print(f"Error in api_subsystem_significant_ownership: {str(e)}")
+        app.logger.exception("Error in api_subsystem_significant_ownership")
         return jsonify({"owners": [], "error": str(e)})
 
 
@@ -1808,15 +2109,14 @@ def api_subsystem_languages(subsystem_name: str):
             return jsonify({"languages": {}, "totals": {}, "error": "Language statistics not available"})
         
         try:
-            with open(languages_file, "r", encoding="utf-8") as f:
-                language_data = json.load(f)
+            language_data = load_json(languages_file)
             
             return jsonify(language_data)
         except (json.JSONDecodeError, IOError) as e:
             return jsonify({"languages": {}, "totals": {}, "error": f"Error reading language statistics: {str(e)}"})
         
     except Exception as e:
-        print(f"Error in api_subsystem_languages: {str(e)}")
+        app.logger.exception("Error in api_subsystem_languages")
         return jsonify({"languages": {}, "totals": {}, "error": str(e)})
 
 @app.route("/api/subsystems/<subsystem_name>/loc-evolution/<int:year>")
@@ -1828,8 +2128,7 @@ def api_subsystem_loc_evolution(subsystem_name: str, year: int):
         # Serve cached file if present
         cached_file = os.path.join(STATS_ROOT, "subsystems", subsystem_name, "monthly", f"{year:04d}.json")
         if os.path.isfile(cached_file):
-            with open(cached_file, "r", encoding="utf-8") as f:
-                return jsonify(json.load(f))
+            return jsonify(load_json(cached_file))
 
         # Map subsystem to repo and paths from services.json
         services_file = os.path.join(BASE_DIR, "configuration", "services.json")
@@ -1883,7 +2182,7 @@ def api_subsystem_loc_evolution(subsystem_name: str, year: int):
                 else:
                     app.logger.info(f"[loc-evolution] No commits for {subsystem_name} {since}..{until} in repo {repo_key}")
             except Exception as e:
-                app.logger.warning(f"[loc-evolution] rev-list failed for {repo_key}: {e}")
+                app.logger.warning("[loc-evolution] rev-list failed for %s: %s", repo_key, e)
                 rev = None
             if not rev:
                 series.append({"month": f"{year:04d}-{month:02d}", "code_lines": 0, "files": 0})
@@ -1899,7 +2198,7 @@ def api_subsystem_loc_evolution(subsystem_name: str, year: int):
                         series.append({"month": f"{year:04d}-{month:02d}", "code_lines": 0, "files": 0})
                         continue
                 except Exception as e:
-                    app.logger.warning(f"[loc-evolution] ls-tree failed for {repo_key} at {rev}: {e}")
+                    app.logger.warning("[loc-evolution] ls-tree failed for %s at %s: %s", repo_key, rev, e)
                     series.append({"month": f"{year:04d}-{month:02d}", "code_lines": 0, "files": 0})
                     continue
             # Create archive of paths at this commit to temp dir
@@ -1912,7 +2211,7 @@ def api_subsystem_loc_evolution(subsystem_name: str, year: int):
                     archive_cmd.extend([p.rstrip("/") for p in paths if p])
                 ar = subprocess.run(archive_cmd, capture_output=True, text=True, check=False)
                 if ar.returncode != 0 or not ar.stdout:
-                    app.logger.warning(f"[loc-evolution] archive failed for {repo_key} {rev}: rc={ar.returncode}")
+                    app.logger.warning("[loc-evolution] archive failed for %s %s: rc=%s", repo_key, rev, ar.returncode)
                     series.append({"month": f"{year:04d}-{month:02d}", "code_lines": 0, "files": 0})
                     continue
                 with open(tar_path, "wb") as tf:
@@ -1927,7 +2226,7 @@ def api_subsystem_loc_evolution(subsystem_name: str, year: int):
                 ]
                 cl = subprocess.run(cloc_cmd, capture_output=True, text=True, check=False)
                 if cl.returncode != 0:
-                    app.logger.warning(f"[loc-evolution] cloc failed for {subsystem_name} {rev}: rc={cl.returncode}")
+                    app.logger.warning("[loc-evolution] cloc failed for %s %s: rc=%s", subsystem_name, rev, cl.returncode)
                     series.append({"month": f"{year:04d}-{month:02d}", "code_lines": 0, "files": 0})
                     continue
                 cloc_data = json.loads(cl.stdout) if cl.stdout else {}
@@ -1942,7 +2241,7 @@ def api_subsystem_loc_evolution(subsystem_name: str, year: int):
                 app.logger.info(f"[loc-evolution] {subsystem_name} {year}-{month:02d}: code_lines={total_code} files={total_files}")
                 series.append({"month": f"{year:04d}-{month:02d}", "code_lines": total_code, "files": total_files})
             except Exception as e:
-                app.logger.warning(f"[loc-evolution] Exception building snapshot for {subsystem_name} {rev}: {e}")
+                app.logger.warning("[loc-evolution] Exception building snapshot for %s %s: %s", subsystem_name, rev, e)
                 series.append({"month": f"{year:04d}-{month:02d}", "code_lines": 0, "files": 0})
             finally:
                 try:
@@ -1959,113 +2258,129 @@ def api_subsystem_loc_evolution(subsystem_name: str, year: int):
             json.dump(payload, f, indent=2)
         return jsonify(payload)
     except Exception as e:
-        app.logger.warning(f"[loc-evolution] Error computing LOC for {subsystem_name} {year}: {e}")
+        app.logger.warning("[loc-evolution] Error computing LOC for %s %s: %s", subsystem_name, year, e)
         return jsonify({"series": []})
 
 
+def compute_subsystem_size_rankings() -> Dict[str, Any]:
+    """
+    Size rankings for all subsystems based on total lines of code, plus the total
+    git blame lines across all repos. The result is reused until the blame files or
+    the subsystem snapshot change; treat it as read-only.
+    """
+    global _size_rankings_cache
+    subsystems_root = os.path.join(STATS_ROOT, "subsystems")
+    if not os.path.exists(subsystems_root):
+        return {"rankings": {}, "buckets": {"big": [], "medium": [], "small": []}}
+    
+    fingerprint = (STATS_ROOT, _stats_snapshot_key(subsystems_root), _blame_files_fingerprint())
+    cached = _size_rankings_cache
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    # Calculate total git blame lines across all repos
+    # Important: Deduplicate repos that appear both standalone and in monorepos
+    # Track by the final repo name component to avoid double-counting
+    total_git_lines = 0
+    counted_repos = set()
+    
+    for _, _, blame_file, blame_data in _scan_repos_blame():
+        try:
+            repo_full_name = blame_data.get("repo", "")
+            # Get the last component (e.g., "appgate-docker" from "appgate-sdp-int/appgate-docker")
+            repo_name = repo_full_name.split("/")[-1]
+            
+            # Only count each unique repo name once (prefer monorepo version if duplicate)
+            if repo_name not in counted_repos:
+                total_git_lines += blame_data.get("total_lines", 0)
+                counted_repos.add(repo_name)
+        except Exception as e:
+            continue
+    
+    # Collect language statistics for all subsystems
+    subsystem_sizes = []
+    
+    def read_code_lines(subsystem_name):
+        languages_file = os.path.join(subsystems_root, subsystem_name, "languages.json")
+        if not os.path.exists(languages_file):
+            return 0
+        try:
+            return load_json_cached(languages_file).get("totals", {}).get("code_lines", 0)
+        except (ValueError, IOError):
+            return 0
+    
+    subsystem_names = list(list_subsystem_summary_folders())
+    if len(subsystem_names) > 1:
+        # The languages.json files are independent; map() keeps the folder order
+        with ThreadPoolExecutor(max_workers=min(STATS_READ_WORKERS, len(subsystem_names))) as executor:
+            code_lines = list(executor.map(read_code_lines, subsystem_names))
+    else:
+        code_lines = [read_code_lines(subsystem_name) for subsystem_name in subsystem_names]
+    
+    for subsystem_name, total_lines in zip(subsystem_names, code_lines):
+        if total_lines > 0:
+            subsystem_sizes.append({
+                "name": subsystem_name,
+                "total_lines": total_lines
+            })
+    
+    # Sort by total lines (descending)
+    subsystem_sizes.sort(key=lambda x: x["total_lines"], reverse=True)
+    
+    # Calculate total system lines
+    total_system_lines = sum(s["total_lines"] for s in subsystem_sizes)
+    
+    # Create rankings dictionary
+    rankings = {}
+    for i, subsystem in enumerate(subsystem_sizes):
+        rankings[subsystem["name"]] = {
+            "rank": i + 1,
+            "total_lines": subsystem["total_lines"],
+            "total_subsystems": len(subsystem_sizes)
+        }
+    
+    # Divide into 3 equal buckets
+    total_count = len(subsystem_sizes)
+    bucket_size = total_count // 3
+    remainder = total_count % 3
+    
+    # Distribute remainder: big gets +1 if remainder >= 1, medium gets +1 if remainder == 2
+    big_size = bucket_size + (1 if remainder >= 1 else 0)
+    medium_size = bucket_size + (1 if remainder >= 2 else 0)
+    small_size = bucket_size
+    
+    buckets = {
+        "big": [s["name"] for s in subsystem_sizes[:big_size]],
+        "medium": [s["name"] for s in subsystem_sizes[big_size:big_size + medium_size]],
+        "small": [s["name"] for s in subsystem_sizes[big_size + medium_size:]]
+    }
+    
+    # Add bucket info to rankings
+    for subsystem_name in buckets["big"]:
+        rankings[subsystem_name]["size_bucket"] = "big"
+    for subsystem_name in buckets["medium"]:
+        rankings[subsystem_name]["size_bucket"] = "medium"
+    for subsystem_name in buckets["small"]:
+        rankings[subsystem_name]["size_bucket"] = "small"
+    
+    result = {
+        "rankings": rankings,
+        "buckets": buckets,
+        "total_subsystems": total_count,
+        "total_system_lines": total_system_lines,
+        "total_git_lines": total_git_lines
+    }
+    _size_rankings_cache = (fingerprint, result)
+    return result
+
+
 @app.route("/api/subsystems/size-rankings")
 def api_subsystem_size_rankings():
     """Get size rankings for all subsystems based on total lines of code."""
     try:
-        subsystems_root = os.path.join(STATS_ROOT, "subsystems")
-        if not os.path.exists(subsystems_root):
-            return jsonify({"rankings": {}, "buckets": {"big": [], "medium": [], "small": []}})
-        
-        # Calculate total git blame lines across all repos
-        # Important: Deduplicate repos that appear both standalone and in monorepos
-        # Track by the final repo name component to avoid double-counting
-        total_git_lines = 0
-        repos_path = os.path.join(STATS_ROOT, "repos")
-        counted_repos = set()
-        
-        for root, dirs, files in os.walk(repos_path):
-            if "blame.json" in files:
-                blame_file = os.path.join(root, "blame.json")
-                try:
-                    blame_data = load_json(blame_file)
-                    repo_full_name = blame_data.get("repo", "")
-                    # Get the last component (e.g., "appgate-docker" from "appgate-sdp-int/appgate-docker")
-                    repo_name = repo_full_name.split("/")[-1]
-                    
-                    # Only count each unique repo name once (prefer monorepo version if duplicate)
-                    if repo_name not in counted_repos:
-                        total_git_lines += blame_data.get("total_lines", 0)
-                        counted_repos.add(repo_name)
-                except Exception as e:
-                    continue
-        
-        # Collect language statistics for all subsystems
-        subsystem_sizes = []
-        
-        for subsystem_name in os.listdir(subsystems_root):
-            subsystem_dir = os.path.join(subsystems_root, subsystem_name)
-            if not os.path.isdir(subsystem_dir):
-                continue
-                
-            languages_file = os.path.join(subsystem_dir, "languages.json")
-            total_lines = 0
-            if os.path.exists(languages_file):
-                try:
-                    with open(languages_file, "r", encoding="utf-8") as f:
-                        language_data = json.load(f)
-                    total_lines = language_data.get("totals", {}).get("code_lines", 0)
-                except (json.JSONDecodeError, IOError):
-                    total_lines = 0
-            if total_lines > 0:
-                subsystem_sizes.append({
-                    "name": subsystem_name,
-                    "total_lines": total_lines
-                })
-        
-        # Sort by total lines (descending)
-        subsystem_sizes.sort(key=lambda x: x["total_lines"], reverse=True)
-        
-        # Calculate total system lines
-        total_system_lines = sum(s["total_lines"] for s in subsystem_sizes)
-        
-        # Create rankings dictionary
-        rankings = {}
-        for i, subsystem in enumerate(subsystem_sizes):
-            rankings[subsystem["name"]] = {
-                "rank": i + 1,
-                "total_lines": subsystem["total_lines"],
-                "total_subsystems": len(subsystem_sizes)
-            }
-        
-        # Divide into 3 equal buckets
-        total_count = len(subsystem_sizes)
-        bucket_size = total_count // 3
-        remainder = total_count % 3
-        
-        # Distribute remainder: big gets +1 if remainder >= 1, medium gets +1 if remainder == 2
-        big_size = bucket_size + (1 if remainder >= 1 else 0)
-        medium_size = bucket_size + (1 if remainder >= 2 else 0)
-        small_size = bucket_size
-        
-        buckets = {
-            "big": [s["name"] for s in subsystem_sizes[:big_size]],
-            "medium": [s["name"] for s in subsystem_sizes[big_size:big_size + medium_size]],
-            "small": [s["name"] for s in subsystem_sizes[big_size + medium_size:]]
-        }
-        
-        # Add bucket info to rankings
-        for subsystem_name in buckets["big"]:
-            rankings[subsystem_name]["size_bucket"] = "big"
-        for subsystem_name in buckets["medium"]:
-            rankings[subsystem_name]["size_bucket"] = "medium"
-        for subsystem_name in buckets["small"]:
-            rankings[subsystem_name]["size_bucket"] = "small"
-        
-        return jsonify({
-            "rankings": rankings,
-            "buckets": buckets,
-            "total_subsystems": total_count,
-            "total_system_lines": total_system_lines,
-            "total_git_lines": total_git_lines
-        })
-        
+        return conditional_jsonify(compute_subsystem_size_rankings())
     except Exception as e:
-        print(f"Error in api_subsystem_size_rankings: {str(e)}")
+        app.logger.exception("Error in api_subsystem_size_rankings")
         return jsonify({"rankings": {}, "buckets": {"big": [], "medium": [], "small": []}, "error": str(e)})
 
 
@@ -2079,43 +2394,43 @@ def api_subsystem_language_lines():
         
         language_lines = {}
         
-        for subsystem_name in os.listdir(subsystems_root):
-            subsystem_dir = os.path.join(subsystems_root, subsystem_name)
-            if not os.path.isdir(subsystem_dir):
-                continue
-                
-            languages_file = os.path.join(subsystem_dir, "languages.json")
-            if not os.path.exists(languages_file):
-                continue
-                
-            try:
-                with open(languages_file, "r", encoding="utf-8") as f:
-                    language_data = json.load(f)
+        with os.scandir(subsystems_root) as subsystem_entries:
+            for subsystem_entry in subsystem_entries:
+                if not subsystem_entry.is_dir():
+                    continue
+                subsystem_dir = subsystem_entry.path
                 
-                languages = language_data.get("languages", {})
-                for lang, lang_data in languages.items():
-                    code_lines = lang_data.get("code_lines", 0)
-                    if code_lines > 0:
-                        if lang not in language_lines:
-                            language_lines[lang] = 0
-                        language_lines[lang] += code_lines
-                        
-            except (json.JSONDecodeError, IOError):
-                continue
+                languages_file = os.path.join(subsystem_dir, "languages.json")
+                if not os.path.exists(languages_file):
+                    continue
+                    
+                try:
+                    language_data = load_json(languages_file)
+                    
+                    languages = language_data.get("languages", {})
+                    for lang, lang_data in languages.items():
+                        code_lines = lang_data.get("code_lines", 0)
+                        if code_lines > 0:
+                            if lang not in language_lines:
+                                language_lines[lang] = 0
+                            language_lines[lang] += code_lines
+                            
+                except (json.JSONDecodeError, IOError):
+                    continue
         
         total_lines = sum(language_lines.values())
         
         # Sort by lines descending
         sorted_languages = dict(sorted(language_lines.items(), key=lambda x: x[1], reverse=True))
         
-        return jsonify({
+        return conditional_jsonify({
             "languages": sorted_languages,
             "total_lines": total_lines,
             "language_count": len(sorted_languages)
         })
         
     except Exception as e:
-        print(f"Error in api_subsystem_language_lines: {str(e)}")
+        app.logger.exception("Error in api_subsystem_language_lines")
         return jsonify({"languages": {}, "total_lines": 0, "error": str(e)})
 
 
@@ -2123,18 +2438,18 @@ def api_subsystem_language_lines():
 def api_subsystems_overview():
     """Get overview data for all subsystems including size comparison and activity."""
     try:
-        from datetime import datetime, timedelta
-        
         # Get size rankings
-        size_data_response = api_subsystem_size_rankings()
-        size_data = size_data_response.get_json()
+        try:
+            size_data = compute_subsystem_size_rankings()
+        except Exception as e:
+            app.logger.exception("Error in api_subsystem_size_rankings")
+            size_data = {"rankings": {}, "buckets": {"big": [], "medium": [], "small": []}, "error": str(e)}
         
         # Get dead subsystem status
         dead_status = detect_dead_subsystems()
         
         # Get current date for recent activity (last month)
         current_date = datetime.now()
-        current_month_start = current_date.replace(day=1).strftime("%Y-%m-%d")
         
         # Calculate last month
         if current_date.month == 1:
@@ -2144,67 +2459,54 @@ def api_subsystems_overview():
             last_month = current_date.month - 1
             last_year = current_date.year
         
-        last_month_start = f"{last_year:04d}-{last_month:02d}-01"
-        
-        # Find last day of last month
-        import calendar
-        last_day = calendar.monthrange(last_year, last_month)[1]
-        last_month_end = f"{last_year:04d}-{last_month:02d}-{last_day:02d}"
+        last_month_label = f"{last_year:04d}-{last_month:02d}"
         
         # Get activity data for last month
         subsystems_activity = []
         subsystems_root = os.path.join(STATS_ROOT, "subsystems")
         
-        if os.path.exists(subsystems_root):
-            for subsystem_name in os.listdir(subsystems_root):
-                subsystem_dir = os.path.join(subsystems_root, subsystem_name)
-                if not os.path.isdir(subsystem_dir):
-                    continue
-                
-                # Look for last month's data
-                activity_data = {"name": subsystem_name, "commits": 0, "lines_changed": 0, "developers": 0}
-                
-                # Add dead status
-                if subsystem_name in dead_status:
-                    activity_data["is_dead"] = dead_status[subsystem_name]["is_dead"]
-                    activity_data["last_activity_date"] = dead_status[subsystem_name]["last_activity_date"]
-                    activity_data["months_since_activity"] = dead_status[subsystem_name]["months_since_activity"]
-                else:
-                    activity_data["is_dead"] = False
-                    activity_data["last_activity_date"] = None
-                    activity_data["months_since_activity"] = None
-                
-                for period_dir in os.listdir(subsystem_dir):
-                    if period_dir.startswith(last_month_start[:7]):  # Match YYYY-MM
-                        period_path = os.path.join(subsystem_dir, period_dir)
-                        summary_file = os.path.join(period_path, "summary.json")
+        # Only period folders that contain a summary.json, from the cached listing
+        for subsystem_name, period_dirs in list_subsystem_summary_folders().items():
+            # Look for last month's data
+            activity_data = {"name": subsystem_name, "commits": 0, "lines_changed": 0, "developers": 0}
+            
+            # Add dead status
+            if subsystem_name in dead_status:
+                activity_data["is_dead"] = dead_status[subsystem_name]["is_dead"]
+                activity_data["last_activity_date"] = dead_status[subsystem_name]["last_activity_date"]
+                activity_data["months_since_activity"] = dead_status[subsystem_name]["months_since_activity"]
+            else:
+                activity_data["is_dead"] = False
+                activity_data["last_activity_date"] = None
+                activity_data["months_since_activity"] = None
+            
+            for period_dir in period_dirs:
+                if period_dir.startswith(last_month_label):  # Match YYYY-MM
+                    summary_file = os.path.join(subsystems_root, subsystem_name, period_dir, "summary.json")
+                    try:
+                        summary_data = load_json(summary_file)
                         
-                        if os.path.exists(summary_file):
-                            try:
-                                with open(summary_file, "r", encoding="utf-8") as f:
-                                    summary_data = json.load(f)
-                                
-                                activity_data["commits"] = summary_data.get("total_commits", 0)
-                                activity_data["lines_changed"] = summary_data.get("total_changed_lines", 0)
-                                activity_data["developers"] = len(summary_data.get("developers", {}))
-                                break
-                                
-                            except (json.JSONDecodeError, IOError):
-                                continue
-                
-                subsystems_activity.append(activity_data)
+                        activity_data["commits"] = summary_data.get("total_commits", 0)
+                        activity_data["lines_changed"] = summary_data.get("total_changed_lines", 0)
+                        activity_data["developers"] = len(summary_data.get("developers", {}))
+                        break
+                        
+                    except (json.JSONDecodeError, IOError):
+                        continue
+            
+            subsystems_activity.append(activity_data)
         
         # Sort activity data
-        most_active_commits = sorted(subsystems_activity, key=lambda x: x["commits"], reverse=True)[:10]
-        most_active_changes = sorted(subsystems_activity, key=lambda x: x["lines_changed"], reverse=True)[:10]
+        most_active_commits = heapq.nlargest(10, subsystems_activity, key=lambda x: x["commits"])
+        most_active_changes = heapq.nlargest(10, subsystems_activity, key=lambda x: x["lines_changed"])
         
         # Count dead subsystems
         dead_subsystems = [s for s in subsystems_activity if s["is_dead"]]
         
-        return jsonify({
+        return conditional_jsonify({
             "size_data": size_data,
             "activity": {
-                "period": f"{last_year:04d}-{last_month:02d}",
+                "period": last_month_label,
                 "most_commits": most_active_commits,
                 "most_changes": most_active_changes
             },
@@ -2216,7 +2518,7 @@ def api_subsystems_overview():
         })
         
     except Exception as e:
-        print(f"Error in api_subsystems_overview: {str(e)}")
+        app.logger.exception("Error in api_subsystems_overview")
         return jsonify({"error": str(e)})
 
 
@@ -2224,8 +2526,6 @@ def api_subsystems_overview():
 def api_users_overview():
     """Get overview data for all users including activity and statistics."""
     try:
-        from datetime import datetime, timedelta
-        
         # Get current date for recent activity (last month)
         current_date = datetime.now()
         current_year = current_date.year
@@ -2238,87 +2538,80 @@ def api_users_overview():
             last_month = current_date.month - 1
             last_year = current_year
         
-        last_month_start = f"{last_year:04d}-{last_month:02d}-01"
-        
-        # Find last day of last month
-        import calendar
-        last_day = calendar.monthrange(last_year, last_month)[1]
-        last_month_end = f"{last_year:04d}-{last_month:02d}-{last_day:02d}"
-        
         # Get activity data for last month and yearly data
         users_activity = []
         users_yearly = []
         users_root = os.path.join(STATS_ROOT, "users")
         
         if os.path.exists(users_root):
-            for user_slug in os.listdir(users_root):
-                user_dir = os.path.join(users_root, user_slug)
-                if not os.path.isdir(user_dir):
-                    continue
-                
-                user_data = {
-                    "slug": user_slug,
-                    "display_name": user_slug,
-                    "monthly_commits": 0,
-                    "monthly_lines_added": 0,
-                    "monthly_lines_deleted": 0,
-                    "yearly_commits": 0,
-                    "yearly_lines_added": 0,
-                    "yearly_lines_deleted": 0
-                }
-                
-                # Look for last month's data
-                monthly_folder = f"{last_year:04d}-{last_month:02d}"
-                monthly_path = os.path.join(user_dir, monthly_folder, "summary.json")
-                
-                if os.path.exists(monthly_path):
-                    try:
-                        with open(monthly_path, "r", encoding="utf-8") as f:
-                            monthly_data = json.load(f)
-                        
-                        user_data["display_name"] = monthly_data.get("author_name", user_slug)
-                        user_data["monthly_commits"] = monthly_data.get("total_commits", 0)
-                        user_data["monthly_lines_added"] = monthly_data.get("total_lines_added", 0)
-                        user_data["monthly_lines_deleted"] = monthly_data.get("total_lines_deleted", 0)
-                        
-                    except (json.JSONDecodeError, IOError):
-                        pass
-                
-                # Aggregate yearly data from monthly folders
-                yearly_commits = 0
-                yearly_lines_added = 0
-                yearly_lines_deleted = 0
-                
-                for month in range(1, 13):
-                    month_folder = f"{current_year:04d}-{month:02d}"
-                    month_path = os.path.join(user_dir, month_folder, "summary.json")
+            with os.scandir(users_root) as user_entries:
+                for user_entry in user_entries:
+                    if not user_entry.is_dir():
+                        continue
+                    user_slug = user_entry.name
+                    user_dir = user_entry.path
+                    
+                    user_data = {
+                        "slug": user_slug,
+                        "display_name": user_slug,
+                        "monthly_commits": 0,
+                        "monthly_lines_added": 0,
+                        "monthly_lines_deleted": 0,
+                        "yearly_commits": 0,
+                        "yearly_lines_added": 0,
+                        "yearly_lines_deleted": 0
+                    }
+                    
+                    # Look for last month's data
+                    monthly_folder = f"{last_year:04d}-{last_month:02d}"
+                    monthly_path = os.path.join(user_dir, monthly_folder, "summary.json")
                     
-                    if os.path.exists(month_path):
+                    if os.path.exists(monthly_path):
                         try:
-                            with open(month_path, "r", encoding="utf-8") as f:
-                                month_data = json.load(f)
+                            monthly_data = load_json(monthly_path)
                             
-                            user_data["display_name"] = month_data.get("author_name", user_slug)
-                            yearly_commits += month_data.get("total_commits", 0)
-                            yearly_lines_added += month_data.get("total_lines_added", 0)
-                            yearly_lines_deleted += month_data.get("total_lines_deleted", 0)
+                            user_data["display_name"] = monthly_data.get("author_name", user_slug)
+                            user_data["monthly_commits"] = monthly_data.get("total_commits", 0)
+                            user_data["monthly_lines_added"] = monthly_data.get("total_lines_added", 0)
+                            user_data["monthly_lines_deleted"] = monthly_data.get("total_lines_deleted", 0)
                             
                         except (json.JSONDecodeError, IOError):
                             pass
-                
-                user_data["yearly_commits"] = yearly_commits
-                user_data["yearly_lines_added"] = yearly_lines_added
-                user_data["yearly_lines_deleted"] = yearly_lines_deleted
-                
-                if user_data["monthly_commits"] > 0 or user_data["yearly_commits"] > 0:
-                    users_activity.append(user_data)
-                    users_yearly.append(user_data)
+                    
+                    # Aggregate yearly data from monthly folders
+                    yearly_commits = 0
+                    yearly_lines_added = 0
+                    yearly_lines_deleted = 0
+                    
+                    for month in range(1, 13):
+                        month_folder = f"{current_year:04d}-{month:02d}"
+                        month_path = os.path.join(user_dir, month_folder, "summary.json")
+                        
+                        if os.path.exists(month_path):
+                            try:
+                                month_data = load_json(month_path)
+                                
+                                user_data["display_name"] = month_data.get("author_name", user_slug)
+                                yearly_commits += month_data.get("total_commits", 0)
+                                yearly_lines_added += month_data.get("total_lines_added", 0)
+                                yearly_lines_deleted += month_data.get("total_lines_deleted", 0)
+                                
+                            except (json.JSONDecodeError, IOError):
+                                pass
+                    
+                    user_data["yearly_commits"] = yearly_commits
+                    user_data["yearly_lines_added"] = yearly_lines_added
+                    user_data["yearly_lines_deleted"] = yearly_lines_deleted
+                    
+                    if user_data["monthly_commits"] > 0 or user_data["yearly_commits"] > 0:
+                        users_activity.append(user_data)
+                        users_yearly.append(user_data)
         
         # Sort by different metrics
-        most_active_monthly = sorted(users_activity, key=lambda x: x["monthly_commits"], reverse=True)[:10]
-        most_productive_monthly = sorted(users_activity, key=lambda x: x["monthly_lines_added"], reverse=True)[:10]
-        most_active_yearly = sorted(users_yearly, key=lambda x: x["yearly_commits"], reverse=True)[:10]
-        most_productive_yearly = sorted(users_yearly, key=lambda x: x["yearly_lines_added"], reverse=True)[:10]
+        most_active_monthly = heapq.nlargest(10, users_activity, key=lambda x: x["monthly_commits"])
+        most_productive_monthly = heapq.nlargest(10, users_activity, key=lambda x: x["monthly_lines_added"])
+        most_active_yearly = heapq.nlargest(10, users_yearly, key=lambda x: x["yearly_commits"])
+        most_productive_yearly = heapq.nlargest(10, users_yearly, key=lambda x: x["yearly_lines_added"])
         
         # Calculate aggregate statistics from ALL users (not just top 10)
         monthly_active_count = sum(1 for u in users_activity if u["monthly_commits"] > 0)
@@ -2326,7 +2619,7 @@ def api_users_overview():
         total_monthly_commits = sum(u["monthly_commits"] for u in users_activity)
         total_yearly_commits = sum(u["yearly_commits"] for u in users_yearly)
         
-        return jsonify({
+        return conditional_jsonify({
             "activity": {
                 "period": f"{last_year:04d}-{last_month:02d}",
                 "most_active_monthly": most_active_monthly,
@@ -2345,7 +2638,7 @@ def api_users_overview():
         })
         
     except Exception as e:
-        print(f"Error in api_users_overview: {str(e)}")
+        app.logger.exception("Error in api_users_overview")
         return jsonify({"error": str(e)})
 
 
@@ -2375,8 +2668,7 @@ def api_settings_ignore_users():
             content = data["content"]
             
             # Write the file
-            with open(ignore_file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            write_file_atomic(ignore_file_path, content.encode("utf-8"))
             
             return jsonify({"success": True, "message": "Ignore users file updated successfully"})
         except Exception as e:
@@ -2410,13 +2702,12 @@ def api_settings_aliases():
             
             # Validate JSON format
             try:
-                json.loads(content)
+                parse_json(content)
             except json.JSONDecodeError as e:
                 return jsonify({"error": f"Invalid JSON format: {str(e)}"}), 400
             
             # Write the file
-            with open(alias_file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            write_file_atomic(alias_file_path, content.encode("utf-8"))
             
             return jsonify({"success": True, "message": "Aliases file updated successfully"})
         except Exception as e:
@@ -2450,13 +2741,12 @@ def api_settings_teams():
             
             # Validate JSON format
             try:
-                json.loads(content)
+                parse_json(content)
             except json.JSONDecodeError as e:
                 return jsonify({"error": f"Invalid JSON format: {str(e)}"}), 400
             
             # Write the file
-            with open(teams_file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            write_file_atomic(teams_file_path, content.encode("utf-8"))
             
             return jsonify({"success": True, "message": "Teams file updated successfully"})
         except Exception as e:
@@ -2471,24 +2761,13 @@ def api_settings_team_subsystem_responsibilities():
     if request.method == "GET":
         try:
             # Get teams
-            teams_file_path = os.path.join(BASE_DIR, "configuration/teams.json")
-            teams = {}
-            if os.path.exists(teams_file_path):
-                with open(teams_file_path, "r", encoding="utf-8") as f:
-                    teams = json.load(f)
+            teams = load_teams_config()
             
-            # Get all available subsystems
-            subsystems_root = os.path.join(STATS_ROOT, "subsystems")
-            available_subsystems = []
-            if os.path.isdir(subsystems_root):
-                available_subsystems = sorted([name for name in os.listdir(subsystems_root) 
-                                             if os.path.isdir(os.path.join(subsystems_root, name))])
+            # Get all available subsystems (every folder under stats/subsystems)
+            available_subsystems = sorted(list_subsystem_summary_folders())
             
             # Get current responsibilities
-            responsibilities = {}
-            if os.path.exists(responsibilities_file_path):
-                with open(responsibilities_file_path, "r", encoding="utf-8") as f:
-                    responsibilities = json.load(f)
+            responsibilities = load_team_subsystem_responsibilities()
             
             return jsonify({
                 "teams": teams,
@@ -2511,52 +2790,142 @@ def api_settings_team_subsystem_responsibilities():
                 return jsonify({"error": "Responsibilities must be a JSON object"}), 400
             
             # Write the file
-            with open(responsibilities_file_path, "w", encoding="utf-8") as f:
-                json.dump(responsibilities, f, indent=2, ensure_ascii=False)
+            write_json_file(responsibilities_file_path, responsibilities)
             
             return jsonify({"success": True, "message": "Team-subsystem responsibilities updated successfully"})
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
 
+def list_repo_checkouts(repos_root: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    (owner/repo, path) for each git checkout under repos/<owner>/<repo>. The listing
+    is cached per directory snapshot, like the stats listings.
+    """
+    key = _stats_snapshot_key(repos_root)
+    if key is None:
+        return ()
+    return _scan_repo_checkouts(repos_root, key)
+
+
+@lru_cache(maxsize=4)
+def _scan_repo_checkouts(repos_root: str, key: Tuple) -> Tuple[Tuple[str, str], ...]:
+    checkouts = []
+    with os.scandir(repos_root) as org_entries:
+        for org_entry in org_entries:
+            if not org_entry.is_dir():
+                continue
+            with os.scandir(org_entry.path) as repo_entries:
+                for repo_entry in repo_entries:
+                    if repo_entry.is_dir() and os.path.exists(os.path.join(repo_entry.path, ".git")):
+                        checkouts.append((f"{org_entry.name}/{repo_entry.name}", repo_entry.path))
+    return tuple(checkouts)
+
+
+def git_remote_url(repo_path: str) -> str:
+    """
+    URL of the checkout's origin remote, or "Unknown". The answer is reused until
+    the checkout's .git/config changes.
+    """
+    try:
+        st = os.stat(os.path.join(repo_path, ".git", "config"))
+    except OSError:
+        # Not a plain .git directory (e.g. a worktree), so there is no key to cache on
+        return _read_git_remote_url(repo_path)
+    return _cached_git_remote_url(repo_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _cached_git_remote_url(repo_path: str, mtime_ns: int, size: int) -> str:
+    return _read_git_remote_url(repo_path)
+
+
+def _read_git_remote_url(repo_path: str) -> str:
+    try:
+        result = subprocess.run(
+            ["git", "-C", repo_path, "remote", "get-url", "origin"],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except Exception:
+        pass
+    return "Unknown"
+
+
+# git ends its progress lines with a bare carriage return
+OUTPUT_LINE_END_RE = re.compile(r"\r\n|\r|\n")
+
+
+def pump_process_output(process: subprocess.Popen, on_line, timeout: Optional[float] = None) -> bool:
+    """
+    Read a binary-mode process's stdout and stderr pipes on the calling thread,
+    calling on_line(stream_name, line) for every non-empty, stripped line as it
+    arrives. One selector watches both pipes, so no reader thread is needed per
+    stream. Returns True once both pipes are closed, or False if timeout seconds
+    pass first.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    pending = {}
+    decoders = {}
+    with selectors.DefaultSelector() as selector:
+        for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr)):
+            if pipe is None:
+                continue
+            pending[name] = ""
+            decoders[name] = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            selector.register(pipe.fileno(), selectors.EVENT_READ, name)
+        
+        while selector.get_map():
+            wait = None
+            if deadline is not None:
+                wait = deadline - time.monotonic()
+                if wait <= 0:
+                    return False
+            for key, _ in selector.select(wait):
+                name = key.data
+                chunk = os.read(key.fd, 65536)
+                if chunk:
+                    text = pending[name] + decoders[name].decode(chunk)
+                    lines = OUTPUT_LINE_END_RE.split(text)
+                    pending[name] = lines.pop()
+                else:
+                    # EOF: flush whatever is left without a line end
+                    selector.unregister(key.fd)
+                    lines = [pending[name] + decoders[name].decode(b"", final=True)]
+                    pending[name] = ""
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        on_line(name, line)
+    return True
+
+
 @app.route("/api/settings/repositories", methods=["GET", "POST"])
 def api_settings_repositories():
     """Get or update repository configuration."""
     if request.method == "GET":
         try:
-            repos = []
             repos_root = os.path.join(BASE_DIR, "repos")
+            checkouts = list_repo_checkouts(repos_root)
             
-            if os.path.exists(repos_root):
-                for org_dir in os.listdir(repos_root):
-                    org_path = os.path.join(repos_root, org_dir)
-                    if os.path.isdir(org_path):
-                        for repo_dir in os.listdir(org_path):
-                            repo_path = os.path.join(org_path, repo_dir)
-                            if os.path.isdir(repo_path) and os.path.exists(os.path.join(repo_path, ".git")):
-                                repo_name = f"{org_dir}/{repo_dir}"
-                                
-                                # Try to get remote URL
-                                remote_url = "Unknown"
-                                try:
-                                    import subprocess
-                                    result = subprocess.run(
-                                        ["git", "remote", "get-url", "origin"],
-                                        cwd=repo_path,
-                                        capture_output=True,
-                                        text=True
-                                    )
-                                    if result.returncode == 0:
-                                        remote_url = result.stdout.strip()
-                                except:
-                                    pass
-                                
-                                repos.append({
-                                    "name": repo_name,
-                                    "path": repo_path,
-                                    "url": remote_url,
-                                    "exists": True
-                                })
+            if len(checkouts) > 1:
+                # One git process per repo; map() keeps the listing order
+                with ThreadPoolExecutor(max_workers=min(GIT_QUERY_WORKERS, len(checkouts))) as executor:
+                    remote_urls = list(executor.map(git_remote_url, [repo_path for _, repo_path in checkouts]))
+            else:
+                remote_urls = [git_remote_url(repo_path) for _, repo_path in checkouts]
+            
+            repos = [
+                {
+                    "name": repo_name,
+                    "path": repo_path,
+                    "url": remote_url,
+                    "exists": True
+                }
+                for (repo_name, repo_path), remote_url in zip(checkouts, remote_urls)
+            ]
             
             return jsonify({"repositories": repos})
         except Exception as e:
@@ -2656,8 +3025,7 @@ def api_settings_repositories():
                                     del services_config[repo_name]
                                     
                                     # Write back the updated configuration
-                                    with open(services_file, "w", encoding="utf-8") as f:
-                                        json.dump(services_config, f, indent=2)
+                                    write_json_file(services_file, services_config)
                                     print(f"✅ Services configuration updated")
                             except (json.JSONDecodeError, IOError) as e:
                                 print(f"⚠️ Warning: Could not update services.json: {e}")
@@ -2742,53 +3110,28 @@ def api_settings_repositories():
                             
                             print(f"🚀 Starting git clone: git clone --progress {repo_url} {repo_path}")
                             
-                            # Use a different approach - capture both streams separately
+                            # Capture both streams; they are read below on this thread
                             process = subprocess.Popen(
                                 ["git", "clone", "--progress", repo_url, repo_path],
                                 stdout=subprocess.PIPE,
                                 stderr=subprocess.PIPE,
-                                text=True,
-                                env=env,
-                                bufsize=1
+                                env=env
                             )
                             
-                            def read_stderr():
-                                """Read git progress from stderr"""
-                                line_count = 0
-                                while True:
-                                    line = process.stderr.readline()
-                                    if not line:
-                                        break
-                                    clean_line = line.strip()
-                                    if clean_line:
-                                        line_count += 1
-                                        print(f"🎯 Git stderr #{line_count}: {clean_line}")
-                                        op["progress_queue"].put(clean_line)
+                            line_counts = Counter()
                             
-                            def read_stdout():
-                                """Read git output from stdout"""
-                                line_count = 0
-                                while True:
-                                    line = process.stdout.readline()
-                                    if not line:
-                                        break
-                                    clean_line = line.strip()
-                                    if clean_line:
-                                        line_count += 1
-                                        print(f"📄 Git stdout #{line_count}: {clean_line}")
-                                        op["progress_queue"].put(clean_line)
+                            def forward_line(stream_name, clean_line):
+                                """Pass git output (progress is on stderr) to the progress queue"""
+                                line_counts[stream_name] += 1
+                                marker = "🎯" if stream_name == "stderr" else "📄"
+                                print(f"{marker} Git {stream_name} #{line_counts[stream_name]}: {clean_line}")
+                                op["progress_queue"].put(clean_line)
                             
-                            # Start reading threads
-                            stderr_thread = threading.Thread(target=read_stderr)
-                            stdout_thread = threading.Thread(target=read_stdout)
-                            stderr_thread.start()
-                            stdout_thread.start()
-                            
-                            # Wait for process completion with timeout (40 hours max for enterprise-scale repositories)
-                            try:
-                                return_code = process.wait(timeout=144000)  # 40 hours timeout
+                            # Read output until git closes its pipes, with a timeout (40 hours max for enterprise-scale repositories)
+                            if pump_process_output(process, forward_line, timeout=144000):  # 40 hours timeout
+                                return_code = process.wait()
                                 print(f"✅ Git process completed with return code: {return_code}")
-                            except subprocess.TimeoutExpired:
+                            else:
                                 print("❌ Git clone process timed out after 40 hours")
                                 process.terminate()
                                 try:
@@ -2800,9 +3143,8 @@ def api_settings_repositories():
                                 op["error"] = "Clone operation timed out after 40 hours"
                                 op["progress_queue"].put("❌ Clone timed out after 40 hours")
                             
-                            # Wait for reading threads to finish
-                            stderr_thread.join(timeout=5)
-                            stdout_thread.join(timeout=5)
+                            # The new checkout shows up in the repository listing right away
+                            _scan_repo_checkouts.cache_clear()
                             
                             if return_code == 0:
                                 op["status"] = "completed"
@@ -2899,8 +3241,7 @@ def api_settings_capacity_config():
             os.makedirs(os.path.dirname(config_file), exist_ok=True)
             
             # Save the configuration
-            with open(config_file, "w") as f:
-                json.dump(data, f, indent=2)
+            write_json_file(config_file, data)
             
             return jsonify({"success": True, "message": "Capacity configuration updated successfully"})
         except Exception as e:
@@ -3050,35 +3391,20 @@ def api_test_git_clone():
                 process = subprocess.Popen(
                     ["git", "clone", "--progress", "https://github.com/octocat/Hello-World.git", repo_path],
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
+                    stderr=subprocess.PIPE
                 )
                 
                 # Read both streams
-                def read_stream(stream, name):
-                    line_count = 0
-                    while True:
-                        line = stream.readline()
-                        if not line:
-                            break
-                        clean_line = line.strip()
-                        if clean_line:
-                            line_count += 1
-                            print(f"🧪 Git {name} #{line_count}: {clean_line}")
-                            op["progress_queue"].put(f"[{name}] {clean_line}")
-                
-                import threading
-                stdout_thread = threading.Thread(target=read_stream, args=(process.stdout, "stdout"))
-                stderr_thread = threading.Thread(target=read_stream, args=(process.stderr, "stderr"))
+                line_counts = Counter()
                 
-                stdout_thread.start()
-                stderr_thread.start()
+                def forward_line(name, clean_line):
+                    line_counts[name] += 1
+                    print(f"🧪 Git {name} #{line_counts[name]}: {clean_line}")
+                    op["progress_queue"].put(f"[{name}] {clean_line}")
                 
+                pump_process_output(process, forward_line)
                 return_code = process.wait()
                 
-                stdout_thread.join(timeout=10)
-                stderr_thread.join(timeout=10)
-                
                 print(f"🧪 Git test completed with return code: {return_code}")
                 
                 if return_code == 0:
@@ -3140,7 +3466,7 @@ def api_settings_subsystems():
             
             # Validate JSON format
             try:
-                parsed = json.loads(content)
+                parsed = parse_json(content)
                 # Validate structure
                 if not isinstance(parsed, dict):
                     raise ValueError("Root must be an object")
@@ -3161,8 +3487,7 @@ def api_settings_subsystems():
                 return jsonify({"error": f"Invalid subsystems format: {str(e)}"}), 400
             
             # Write the file
-            with open(services_file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            write_file_atomic(services_file_path, content.encode("utf-8"))
             
             return jsonify({"success": True, "message": "Subsystems configuration updated successfully"})
         except Exception as e:
@@ -3267,8 +3592,7 @@ def api_update_run_analysis():
         force_update = data.get("force_update", False)
         
         # Clear the progress queue
-        while not update_progress_queue.empty():
-            update_progress_queue.get()
+        update_progress_queue.clear()
         
         # Start the unified update process in a separate thread
         thread = threading.Thread(target=run_full_update_async, args=(force_update,))
@@ -3292,11 +3616,7 @@ def api_update_reset():
     update_process_active = False
     
     # Clear any remaining messages in the queue
-    while not update_progress_queue.empty():
-        try:
-            update_progress_queue.get_nowait()
-        except queue.Empty:
-            break
+    update_progress_queue.clear()
     
     return jsonify({"success": True, "message": "Update process state reset"})
 
@@ -3308,7 +3628,7 @@ def api_update_status():
     
     return jsonify({
         "is_running": update_process_active,
-        "queue_size": update_progress_queue.qsize()
+        "queue_size": len(update_progress_queue)
     })
 
 
@@ -3316,6 +3636,7 @@ def api_update_status():
 def api_update_logs():
     """Get the update log file content."""
     try:
+        flush_update_log()
         if os.path.exists(UPDATE_LOG_FILE):
             with open(UPDATE_LOG_FILE, 'r', encoding='utf-8') as f:
                 content = f.read()
@@ -3338,6 +3659,7 @@ def api_update_logs():
 def api_update_logs_download():
     """Download the update log file."""
     try:
+        flush_update_log()
         if os.path.exists(UPDATE_LOG_FILE):
             return send_from_directory(BASE_DIR, "update_logs.txt", as_attachment=True)
         else:
@@ -3346,19 +3668,47 @@ def api_update_logs_download():
         return str(e), 500
 
 
+# How long the SSE stream lets progress messages accumulate before sending them as one event
+UPDATE_PROGRESS_BATCH_SECONDS = 0.05
+
+
+def drain_update_progress_queue() -> List[Dict[str, Any]]:
+    """Pop every queued update progress message, oldest first."""
+    batch = []
+    while True:
+        try:
+            batch.append(update_progress_queue.popleft())
+        except IndexError:
+            return batch
+
+
 @app.route("/api/update/progress")
 def api_update_progress():
-    """Server-sent events endpoint for update progress."""
+    """
+    Server-sent events endpoint for update progress.
+    Progress messages are sent in batches as a JSON array per event; heartbeat and
+    completion messages are sent as single objects.
+    """
     def generate():
         global update_process_active
         while update_process_active:
-            try:
-                # Get message from queue with timeout
-                message = update_progress_queue.get(timeout=1)
-                yield f"data: {json.dumps(message)}\n\n"
-            except queue.Empty:
-                # Send heartbeat
-                yield f"data: {json.dumps({'type': 'heartbeat'})}\n\n"
+            if not update_progress_queue:
+                # Re-check after clearing the event so a message appended in between is not missed
+                update_progress_event.clear()
+                if not update_progress_queue and not update_progress_event.wait(timeout=1):
+                    # Send heartbeat
+                    yield f"data: {json.dumps({'type': 'heartbeat'})}\n\n"
+                    continue
+            # Let a burst of messages arrive so it goes out as a single event
+            time.sleep(UPDATE_PROGRESS_BATCH_SECONDS)
+            batch = drain_update_progress_queue()
+            if batch:
+                yield f"data: {json.dumps(batch)}\n\n"
+        
+        # Flush anything logged just before the update finished
+        batch = drain_update_progress_queue()
+        if batch:
+            yield f"data: {json.dumps(batch)}\n\n"
         
         # Send final completion message
         yield f"data: {json.dumps({'type': 'complete'})}\n\n"
@@ -3381,8 +3731,6 @@ def run_full_update_async(force_update=False):
     
     try:
         import subprocess
-        from datetime import datetime
-        import calendar
         
         # Initial setup
         start_timestamp = datetime.now()
@@ -3655,12 +4003,7 @@ def run_full_update_async(force_update=False):
             
             for month in range(1, current_month + 1):
                 month_start_time = datetime.now()
-                date_from = f"{current_year}-{month:02d}-01"
-                
-                # Calculate last day of month
-                import calendar
-                last_day = calendar.monthrange(current_year, month)[1]
-                date_to = f"{current_year}-{month:02d}-{last_day:02d}"
+                date_from, date_to = month_bounds(current_year, month)
                 
                 month_progress_start = monthly_progress_start + (month - 1) * monthly_progress_per_month
                 month_progress_end = monthly_progress_start + month * monthly_progress_per_month
@@ -3846,6 +4189,8 @@ def run_full_update_async(force_update=False):
         })
     finally:
         update_process_active = False
+        flush_update_log()
+        clear_stats_listing_cache()
 
 def run_git_pull_all(force_update=False):
     """Run git pull on all repositories and report progress."""
@@ -4042,7 +4387,7 @@ def api_teams():
             "periods": team_periods
         })
     
-    return jsonify({"teams": teams})
+    return conditional_jsonify({"teams": teams})
 
 
 @app.route("/api/teams/<team_id>/month/<from_date>/<to_date>")
@@ -4074,28 +4419,27 @@ def api_team_month(team_id: str, from_date: str, to_date: str = None):
         
         if os.path.exists(team_file):
             try:
-                with open(team_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Convert to expected format
-                    return jsonify({
-                        "type": "team",
-                        "team_id": team_id,
-                        "team_name": team_name,
-                        "description": team.get("description", ""),
-                        "members": data.get("members", []),
-                        "responsible_subsystems": data.get("responsible_subsystems", []),
-                        "responsible_subsystem_details": data.get("responsible_subsystem_details", {}),
-                        "total_responsible_lines": data.get("total_responsible_lines", 0),
-                        "total_commits": data.get("commits", 0),
-                        "total_additions": data.get("lines_added", 0),
-                        "total_deletions": data.get("lines_deleted", 0),
-                        "languages": data.get("languages", {}),
-                        "subsystems": data.get("subsystems", {}),
-                        "per_date": data.get("per_date", {}),
-                        "member_contributions": data.get("member_contributions", {})
-                    })
+                data = load_json(team_file)
+                # Convert to expected format
+                return jsonify({
+                    "type": "team",
+                    "team_id": team_id,
+                    "team_name": team_name,
+                    "description": team.get("description", ""),
+                    "members": data.get("members", []),
+                    "responsible_subsystems": data.get("responsible_subsystems", []),
+                    "responsible_subsystem_details": data.get("responsible_subsystem_details", {}),
+                    "total_responsible_lines": data.get("total_responsible_lines", 0),
+                    "total_commits": data.get("commits", 0),
+                    "total_additions": data.get("lines_added", 0),
+                    "total_deletions": data.get("lines_deleted", 0),
+                    "languages": data.get("languages", {}),
+                    "subsystems": data.get("subsystems", {}),
+                    "per_date": data.get("per_date", {}),
+                    "member_contributions": data.get("member_contributions", {})
+                })
             except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading team file {team_file}: {e}")
+                app.logger.warning("Error loading team file %s: %s", team_file, e)
     
     # Fall back to old aggregation method if file doesn't exist
     members = team.get("members", [])
@@ -4137,19 +4481,18 @@ def api_team_month(team_id: str, from_date: str, to_date: str = None):
                 # Load the latest language stats for this subsystem
                 subsystem_lang_path = os.path.join(STATS_ROOT, "subsystems", subsystem_name, "languages.json")
                 if os.path.exists(subsystem_lang_path):
-                    with open(subsystem_lang_path, "r", encoding="utf-8") as f:
-                        lang_data = json.load(f)
-                        subsystem_lines = 0
-                        # Sum up all language code lines
-                        for lang_name, lang_info in lang_data.get("languages", {}).items():
-                            if isinstance(lang_info, dict):
-                                subsystem_lines += lang_info.get("code_lines", 0)
-                        
-                        responsible_subsystem_details[subsystem_name] = {
-                            "name": subsystem_name,
-                            "lines": subsystem_lines
-                        }
-                        total_responsible_lines += subsystem_lines
+                    lang_data = load_json(subsystem_lang_path)
+                    subsystem_lines = 0
+                    # Sum up all language code lines
+                    for lang_name, lang_info in lang_data.get("languages", {}).items():
+                        if isinstance(lang_info, dict):
+                            subsystem_lines += lang_info.get("code_lines", 0)
+                    
+                    responsible_subsystem_details[subsystem_name] = {
+                        "name": subsystem_name,
+                        "lines": subsystem_lines
+                    }
+                    total_responsible_lines += subsystem_lines
             except (json.JSONDecodeError, IOError, KeyError):
                 # If we can't load language data, still include the subsystem with 0 lines
                 responsible_subsystem_details[subsystem_name] = {
@@ -4244,27 +4587,26 @@ def api_team_month(team_id: str, from_date: str, to_date: str = None):
             # Load the latest language stats for this subsystem
             subsystem_lang_path = os.path.join(STATS_ROOT, "subsystems", subsystem_name, "languages.json")
             if os.path.exists(subsystem_lang_path):
-                with open(subsystem_lang_path, "r", encoding="utf-8") as f:
-                    lang_data = json.load(f)
-                    # Get total code lines from the totals section
-                    subsystem_lines = lang_data.get("totals", {}).get("code_lines", 0)
-                    
-                    print(f"DEBUG: {subsystem_name} has {subsystem_lines} lines from {subsystem_lang_path}")
-                    
-                    responsible_subsystem_details[subsystem_name] = {
-                        "name": subsystem_name,
-                        "lines": subsystem_lines
-                    }
-                    total_responsible_lines += subsystem_lines
+                lang_data = load_json(subsystem_lang_path)
+                # Get total code lines from the totals section
+                subsystem_lines = lang_data.get("totals", {}).get("code_lines", 0)
+                
+                app.logger.debug("%s has %s lines from %s", subsystem_name, subsystem_lines, subsystem_lang_path)
+                
+                responsible_subsystem_details[subsystem_name] = {
+                    "name": subsystem_name,
+                    "lines": subsystem_lines
+                }
+                total_responsible_lines += subsystem_lines
             else:
-                print(f"DEBUG: No languages.json found for {subsystem_name} at {subsystem_lang_path}")
+                app.logger.debug("No languages.json found for %s at %s", subsystem_name, subsystem_lang_path)
                 # If languages.json doesn't exist, include with 0 lines
                 responsible_subsystem_details[subsystem_name] = {
                     "name": subsystem_name,
                     "lines": 0
                 }
         except (json.JSONDecodeError, IOError, KeyError) as e:
-            print(f"DEBUG: Error loading {subsystem_name}: {e}")
+            app.logger.debug("Error loading %s: %s", subsystem_name, e)
             # If we can't load language data, still include the subsystem with 0 lines
             responsible_subsystem_details[subsystem_name] = {
                 "name": subsystem_name,
@@ -4378,8 +4720,7 @@ def build_team_per_date(members: list, year: int):
                 summary_path = os.path.join(user_dir, month_folder, "summary.json")
                 if not os.path.isfile(summary_path):
                     continue
-                with open(summary_path, "r", encoding="utf-8") as f:
-                    monthly = json.load(f)
+                monthly = load_json(summary_path)
                 for date_str, day in (monthly.get("per_date", {}) or {}).items():
                     entry = aggregated.setdefault(date_str, {"commits": 0, "additions": 0, "deletions": 0, "net_lines": 0})
                     entry["commits"] += day.get("commits", 0)
@@ -4415,136 +4756,133 @@ def api_team_year(team_id: str, year: int):
     
     if os.path.exists(team_file):
         try:
-            with open(team_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                
-                # Calculate capacity analysis based on responsible subsystems ownership
-                # Recompute responsible_subsystem_details from current responsibilities + languages.json
-                responsibilities_file = os.path.join(BASE_DIR, "configuration", "team_subsystem_responsibilities.json")
+            data = load_json(team_file)
+            
+            # Calculate capacity analysis based on responsible subsystems ownership
+            # Recompute responsible_subsystem_details from current responsibilities + languages.json
+            responsibilities_file = os.path.join(BASE_DIR, "configuration", "team_subsystem_responsibilities.json")
+            team_responsibilities = []
+            try:
+                with open(responsibilities_file, "r", encoding="utf-8") as rf:
+                    resp_map = json.load(rf)
+                    team_responsibilities = resp_map.get(team_id, [])
+            except Exception:
                 team_responsibilities = []
-                try:
-                    with open(responsibilities_file, "r", encoding="utf-8") as rf:
-                        resp_map = json.load(rf)
-                        team_responsibilities = resp_map.get(team_id, [])
-                except Exception:
-                    team_responsibilities = []
-                recomputed_details = {}
-                total_responsible_lines = 0
-                # Load services configuration to identify nested subsystems in repos
+            recomputed_details = {}
+            total_responsible_lines = 0
+            # Load services configuration to identify nested subsystems in repos
+            services_config = {}
+            services_file = os.path.join(BASE_DIR, "configuration", "services.json")
+            try:
+                with open(services_file, "r", encoding="utf-8") as sf:
+                    services_config = json.load(sf)
+            except Exception:
                 services_config = {}
-                services_file = os.path.join(BASE_DIR, "configuration", "services.json")
-                try:
-                    with open(services_file, "r", encoding="utf-8") as sf:
-                        services_config = json.load(sf)
-                except Exception:
-                    services_config = {}
+            
+            for subsystem_name in team_responsibilities:
+                # Base: language stats for subsystem (may be a repo or a specific service)
+                lang_path = os.path.join(STATS_ROOT, "subsystems", subsystem_name, "languages.json")
+                subsystem_languages = {}
+                subsystem_lines = 0
+                if os.path.isfile(lang_path):
+                    try:
+                        lang_data = load_json(lang_path)
+                        for lang_name, lang_info in (lang_data.get("languages", {}) or {}).items():
+                            code_lines = lang_info.get("code_lines", 0)
+                            subsystem_languages[lang_name] = code_lines
+                            subsystem_lines += code_lines
+                    except Exception:
+                        pass
                 
-                for subsystem_name in team_responsibilities:
-                    # Base: language stats for subsystem (may be a repo or a specific service)
-                    lang_path = os.path.join(STATS_ROOT, "subsystems", subsystem_name, "languages.json")
-                    subsystem_languages = {}
-                    subsystem_lines = 0
-                    if os.path.isfile(lang_path):
-                        try:
-                            with open(lang_path, "r", encoding="utf-8") as lf:
-                                lang_data = json.load(lf)
-                                for lang_name, lang_info in (lang_data.get("languages", {}) or {}).items():
-                                    code_lines = lang_info.get("code_lines", 0)
-                                    subsystem_languages[lang_name] = code_lines
-                                    subsystem_lines += code_lines
-                        except Exception:
-                            pass
-                    
-                    # If subsystem_name is a repository (top-level), subtract lines of its child services
-                    # services_config is { org/repo: { service_name: [paths...] } }
-                    # Match by repo basename
-                    matching_repo_key = None
-                    for repo_key in services_config.keys():
-                        if repo_key.split('/')[-1] == subsystem_name:
-                            matching_repo_key = repo_key
-                            break
-                    if matching_repo_key:
-                        app.logger.info(f"[teams-year] Repo match for subsystem '{subsystem_name}': {matching_repo_key}")
-                        # Sum lines of all child services under this repo
-                        child_services_total = 0
-                        for service_name in services_config.get(matching_repo_key, {}).keys():
-                            child_lang_path = os.path.join(STATS_ROOT, "subsystems", service_name, "languages.json")
-                            if os.path.isfile(child_lang_path):
-                                try:
-                                    with open(child_lang_path, "r", encoding="utf-8") as clf:
-                                        child_lang_data = json.load(clf)
-                                        for _, child_lang_info in (child_lang_data.get("languages", {}) or {}).items():
-                                            child_services_total += child_lang_info.get("code_lines", 0)
-                                except Exception as e:
-                                    app.logger.warning(f"[teams-year] Failed reading child service '{service_name}' languages: {e}")
-                        app.logger.info(f"[teams-year] Child services total for '{matching_repo_key}': {child_services_total}")
-                        # If repo languages.json is missing, run cloc on repo to get totals
-                        if subsystem_lines == 0:
+                # If subsystem_name is a repository (top-level), subtract lines of its child services
+                # services_config is { org/repo: { service_name: [paths...] } }
+                # Match by repo basename
+                matching_repo_key = None
+                for repo_key in services_config.keys():
+                    if repo_key.split('/')[-1] == subsystem_name:
+                        matching_repo_key = repo_key
+                        break
+                if matching_repo_key:
+                    app.logger.info(f"[teams-year] Repo match for subsystem '{subsystem_name}': {matching_repo_key}")
+                    # Sum lines of all child services under this repo
+                    child_services_total = 0
+                    for service_name in services_config.get(matching_repo_key, {}).keys():
+                        child_lang_path = os.path.join(STATS_ROOT, "subsystems", service_name, "languages.json")
+                        if os.path.isfile(child_lang_path):
                             try:
-                                repo_rel = matching_repo_key
-                                repo_path = os.path.join(BASE_DIR, "repos", repo_rel)
-                                app.logger.info(f"[teams-year] Running cloc for repo '{repo_rel}' at '{repo_path}'")
-                                # Run cloc
-                                result = subprocess.run(["cloc", "--json", repo_path, "--exclude-dir=.git,node_modules,.venv,__pycache__,vendor,target,build,dist"], capture_output=True, text=True, check=False)
-                                if result.returncode != 0:
-                                    app.logger.warning(f"[teams-year] cloc failed for '{repo_rel}': rc={result.returncode} stderr={result.stderr}")
-                                cloc_data = json.loads(result.stdout) if result.stdout else {}
-                                total_code = 0
-                                for lang_name, lang_info in cloc_data.items():
-                                    if isinstance(lang_info, dict) and "code" in lang_info:
-                                        total_code += lang_info.get("code", 0)
-                                subsystem_lines = total_code
-                                app.logger.info(f"[teams-year] cloc total code for '{repo_rel}': {subsystem_lines}")
+                                child_lang_data = load_json(child_lang_path)
+                                for _, child_lang_info in (child_lang_data.get("languages", {}) or {}).items():
+                                    child_services_total += child_lang_info.get("code_lines", 0)
                             except Exception as e:
-                                app.logger.warning(f"[teams-year] Exception running cloc for '{repo_rel}': {e}")
-                        # Subtract child services lines from repo total (cannot be negative)
-                        before_subtract = subsystem_lines
-                        subsystem_lines = max(0, subsystem_lines - child_services_total)
-                        app.logger.info(f"[teams-year] Repo remainder for '{matching_repo_key}': {before_subtract} - {child_services_total} = {subsystem_lines}")
-                        subsystem_languages = {"Remaining": subsystem_lines}
-                    
-                    recomputed_details[subsystem_name] = {
-                        "name": subsystem_name,
-                        "lines": subsystem_lines,
-                        "languages": subsystem_languages
-                    }
-                    total_responsible_lines += subsystem_lines
-                # Aggregate language lines from recomputed details
-                languages = {}
-                for subsystem_name, details in recomputed_details.items():
-                    for lang, lines in details.get("languages", {}).items():
-                        languages[lang] = languages.get(lang, 0) + lines
-                team_size = len(data.get("members", []))
-                capacity_analysis = calculate_team_capacity(languages, team_size)
-                
-                # Normalize subsystem keys for frontend (expects 'additions'/'deletions')
-                subsystems = data.get("subsystems", {})
-                for sub_name, stats in subsystems.items():
-                    if "additions" not in stats and "lines_added" in stats:
-                        stats["additions"] = stats.get("lines_added", 0)
-                    if "deletions" not in stats and "lines_deleted" in stats:
-                        stats["deletions"] = stats.get("lines_deleted", 0)
-                # Convert to expected format
-                return jsonify({
-                    "type": "team",
-                    "team_id": team_id,
-                    "team_name": team_name,
-                    "description": team.get("description", ""),
-                    "members": data.get("members", []),
-                    "responsible_subsystems": team_responsibilities,
-                    "responsible_subsystem_details": recomputed_details,
-                    "total_responsible_lines": total_responsible_lines,
-                    "total_commits": data.get("commits", 0),
-                    "total_additions": data.get("lines_added", 0),
-                    "total_deletions": data.get("lines_deleted", 0),
-                    "languages": languages,
-                    "subsystems": subsystems,
-                    "per_date": build_team_per_date(team.get("members", []), year),
-                    "member_contributions": data.get("member_contributions", {}),
-                    "capacity_analysis": capacity_analysis
-                })
+                                app.logger.warning("[teams-year] Failed reading child service '%s' languages: %s", service_name, e)
+                    app.logger.info(f"[teams-year] Child services total for '{matching_repo_key}': {child_services_total}")
+                    # If repo languages.json is missing, run cloc on repo to get totals
+                    if subsystem_lines == 0:
+                        try:
+                            repo_rel = matching_repo_key
+                            repo_path = os.path.join(BASE_DIR, "repos", repo_rel)
+                            app.logger.info(f"[teams-year] Running cloc for repo '{repo_rel}' at '{repo_path}'")
+                            # Run cloc
+                            result = subprocess.run(["cloc", "--json", repo_path, "--exclude-dir=.git,node_modules,.venv,__pycache__,vendor,target,build,dist"], capture_output=True, text=True, check=False)
+                            if result.returncode != 0:
+                                app.logger.warning("[teams-year] cloc failed for '%s': rc=%s stderr=%s", repo_rel, result.returncode, result.stderr)
+                            cloc_data = json.loads(result.stdout) if result.stdout else {}
+                            total_code = 0
+                            for lang_name, lang_info in cloc_data.items():
+                                if isinstance(lang_info, dict) and "code" in lang_info:
+                                    total_code += lang_info.get("code", 0)
+                            subsystem_lines = total_code
+                            app.logger.info(f"[teams-year] cloc total code for '{repo_rel}': {subsystem_lines}")
+                        except Exception as e:
+                            app.logger.warning("[teams-year] Exception running cloc for '%s': %s", repo_rel, e)
+                    # Subtract child services lines from repo total (cannot be negative)
+                    before_subtract = subsystem_lines
+                    subsystem_lines = max(0, subsystem_lines - child_services_total)
+                    app.logger.info(f"[teams-year] Repo remainder for '{matching_repo_key}': {before_subtract} - {child_services_total} = {subsystem_lines}")
+                    subsystem_languages = {"Remaining": subsystem_lines}
+                
+                recomputed_details[subsystem_name] = {
+                    "name": subsystem_name,
+                    "lines": subsystem_lines,
+                    "languages": subsystem_languages
+                }
+                total_responsible_lines += subsystem_lines
+            # Aggregate language lines from recomputed details
+            languages = {}
+            for subsystem_name, details in recomputed_details.items():
+                for lang, lines in details.get("languages", {}).items():
+                    languages[lang] = languages.get(lang, 0) + lines
+            team_size = len(data.get("members", []))
+            capacity_analysis = calculate_team_capacity(languages, team_size)
+            
+            # Normalize subsystem keys for frontend (expects 'additions'/'deletions')
+            subsystems = data.get("subsystems", {})
+            for sub_name, stats in subsystems.items():
+                if "additions" not in stats and "lines_added" in stats:
+                    stats["additions"] = stats.get("lines_added", 0)
+                if "deletions" not in stats and "lines_deleted" in stats:
+                    stats["deletions"] = stats.get("lines_deleted", 0)
+            # Convert to expected format
+            return jsonify({
+                "type": "team",
+                "team_id": team_id,
+                "team_name": team_name,
+                "description": team.get("description", ""),
+                "members": data.get("members", []),
+                "responsible_subsystems": team_responsibilities,
+                "responsible_subsystem_details": recomputed_details,
+                "total_responsible_lines": total_responsible_lines,
+                "total_commits": data.get("commits", 0),
+                "total_additions": data.get("lines_added", 0),
+                "total_deletions": data.get("lines_deleted", 0),
+                "languages": languages,
+                "subsystems": subsystems,
+                "per_date": build_team_per_date(team.get("members", []), year),
+                "member_contributions": data.get("member_contributions", {}),
+                "capacity_analysis": capacity_analysis
+            })
         except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading team file {team_file}: {e}")
+            app.logger.warning("Error loading team file %s: %s", team_file, e)
     
     # Fall back to old aggregation method
     from_date = f"{year:04d}-01-01"
@@ -4692,14 +5030,13 @@ def api_teams_overview():
                 # Load the latest language stats for this subsystem
                 subsystem_lang_path = os.path.join(STATS_ROOT, "subsystems", subsystem_name, "languages.json")
                 if os.path.exists(subsystem_lang_path):
-                    with open(subsystem_lang_path, "r", encoding="utf-8") as f:
-                        lang_data = json.load(f)
-                        # Sum up all language code lines
-                        for lang_name, lang_info in lang_data.get("languages", {}).items():
-                            if isinstance(lang_info, dict):
-                                # Try code_lines first (cloc format), then fall back to lines
-                                lines = lang_info.get("code_lines", lang_info.get("lines", 0))
-                                team_stats["responsible_lines_of_code"] += lines
+                    lang_data = load_json(subsystem_lang_path)
+                    # Sum up all language code lines
+                    for lang_name, lang_info in lang_data.get("languages", {}).items():
+                        if isinstance(lang_info, dict):
+                            # Try code_lines first (cloc format), then fall back to lines
+                            lines = lang_info.get("code_lines", lang_info.get("lines", 0))
+                            team_stats["responsible_lines_of_code"] += lines
             except (json.JSONDecodeError, IOError, KeyError):
                 # If we can't load language data, skip this subsystem
                 pass
@@ -4707,7 +5044,7 @@ def api_teams_overview():
     # Sort teams by total commits (descending) for ranking
     teams_analytics.sort(key=lambda x: x["total_commits"], reverse=True)
     
-    return jsonify({"teams": teams_analytics, "period": period_label})
+    return conditional_jsonify({"teams": teams_analytics, "period": period_label})
 
 
 def aggregate_user_data_for_period(user_slug, from_date, to_date):
@@ -4741,7 +5078,7 @@ def aggregate_user_data_for_period(user_slug, from_date, to_date):
             try:
                 return load_json(summary_path)
             except Exception as e:
-                print(f"Error loading yearly summary for {user_slug}: {e}")
+                app.logger.warning("Error loading yearly summary for %s: %s", user_slug, e)
                 # Fall back to aggregation
     
     # Otherwise, aggregate from overlapping periods, but prioritize monthly summaries over yearly
@@ -4787,7 +5124,7 @@ def aggregate_user_data_for_period(user_slug, from_date, to_date):
                             aggregated_data["per_date"][date_str] = date_data
                     
                 except Exception as e:
-                    print(f"Error loading period data for {user_slug} in period {period['folder']}: {e}")
+                    app.logger.warning("Error loading period data for %s in period %s: %s", user_slug, period['folder'], e)
                     continue
     
     return aggregated_data
@@ -4798,7 +5135,6 @@ def api_settings_available_users():
     """Get list of available users for team member selection and ignore list management.
     Includes both active users (with recent commits) and inactive users (with ownership/blame).
     Returns only canonical users (filters out aliased identities)."""
-    from collections import defaultdict
     
     # Load aliases to filter out non-canonical users
     alias_file = os.path.join(BASE_DIR, "configuration", "alias.json")
@@ -4849,42 +5185,37 @@ def api_settings_available_users():
             }
     
     # Also get inactive users from blame files (historical contributors)
-    repos_path = os.path.join(STATS_ROOT, "repos")
-    for root, dirs, files in os.walk(repos_path):
-        if "blame.json" in files:
-            blame_file = os.path.join(root, "blame.json")
-            try:
-                blame_data = load_json(blame_file)
-                
-                # Check repo-level developers
-                developers = blame_data.get("developers", {})
-                for dev_slug, dev_data in developers.items():
+    for _, _, blame_file, blame_data in _scan_repos_blame():
+        try:
+            # Check repo-level developers
+            developers = blame_data.get("developers", {})
+            for dev_slug, dev_data in developers.items():
+                canonical_slug = aliased_to_canonical.get(dev_slug, dev_slug)
+                
+                if canonical_slug not in users_dict:
+                    display_name = dev_data.get("display_name", canonical_slug)
+                    users_dict[canonical_slug] = {
+                        "slug": canonical_slug,
+                        "display_name": display_name,
+                        "active": False
+                    }
+            
+            # Check service-level developers
+            services = blame_data.get("services", {})
+            for service_data in services.values():
+                service_developers = service_data.get("developers", {})
+                for dev_slug, dev_data in service_developers.items():
                     canonical_slug = aliased_to_canonical.get(dev_slug, dev_slug)
                     
                     if canonical_slug not in users_dict:
-                        display_name = dev_data.get("display_name", canonical_slug) if isinstance(dev_data, dict) else canonical_slug
+                        display_name = dev_data.get("display_name", canonical_slug)
                         users_dict[canonical_slug] = {
                             "slug": canonical_slug,
                             "display_name": display_name,
                             "active": False
                         }
-                
-                # Check service-level developers
-                services = blame_data.get("services", {})
-                for service_data in services.values():
-                    service_developers = service_data.get("developers", {})
-                    for dev_slug, dev_data in service_developers.items():
-                        canonical_slug = aliased_to_canonical.get(dev_slug, dev_slug)
-                        
-                        if canonical_slug not in users_dict:
-                            display_name = dev_data.get("display_name", canonical_slug) if isinstance(dev_data, dict) else canonical_slug
-                            users_dict[canonical_slug] = {
-                                "slug": canonical_slug,
-                                "display_name": display_name,
-                                "active": False
-                            }
-            except Exception as e:
-                continue
+        except Exception as e:
+            continue
     
     # Convert to list
     users = list(users_dict.values())
@@ -4920,8 +5251,7 @@ def get_user_monthly_stats(user_slug: str, year: int) -> List[Dict[str, Any]]:
         try:
             summary_path = os.path.join(STATS_ROOT, "users", user_slug, period["folder"], "summary.json")
             if os.path.exists(summary_path):
-                with open(summary_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = load_json(summary_path)
                     
                 monthly_stats.append({
                     "month": period["label"],  # YYYY-MM format
@@ -4966,8 +5296,7 @@ def get_user_last_month_stats(user_slug: str) -> Dict[str, Any]:
             try:
                 summary_path = os.path.join(STATS_ROOT, "users", user_slug, period["folder"], "summary.json")
                 if os.path.exists(summary_path):
-                    with open(summary_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    data = load_json(summary_path)
                         
                     return {
                         "month": period["label"],
@@ -5037,8 +5366,7 @@ def get_team_last_month_stats(team_id: str) -> Dict[str, Any]:
                 try:
                     summary_path = os.path.join(STATS_ROOT, "users", member_slug, period["folder"], "summary.json")
                     if os.path.exists(summary_path):
-                        with open(summary_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
+                        data = load_json(summary_path)
                         
                         total_lines_added += data.get("total_lines_added", 0)
                         total_lines_deleted += data.get("total_lines_deleted", 0)
@@ -5115,7 +5443,7 @@ def api_user_monthly_stats(user_slug: str, year: int):
         stats = get_user_monthly_stats(user_slug, year)
         return jsonify({"monthly_stats": stats})
     except Exception as e:
-        app.logger.error(f"Error getting user monthly stats: {e}")
+        app.logger.error("Error getting user monthly stats: %s", e)
         abort(500, description="Failed to get monthly statistics")
 
 
@@ -5126,7 +5454,7 @@ def api_team_monthly_stats(team_id: str, year: int):
         stats = get_team_monthly_stats(team_id, year)
         return jsonify({"monthly_stats": stats})
     except Exception as e:
-        app.logger.error(f"Error getting team monthly stats: {e}")
+        app.logger.error("Error getting team monthly stats: %s", e)
         abort(500, description="Failed to get monthly statistics")
 
 
@@ -5137,7 +5465,7 @@ def api_user_last_month_stats(user_slug: str):
         stats = get_user_last_month_stats(user_slug)
         return jsonify({"last_month_stats": stats})
     except Exception as e:
-        app.logger.error(f"Error getting user last month stats: {e}")
+        app.logger.error("Error getting user last month stats: %s", e)
         abort(500, description="Failed to get last month statistics")
 
 
@@ -5148,7 +5476,7 @@ def api_team_last_month_stats(team_id: str):
         stats = get_team_last_month_stats(team_id)
         return jsonify({"last_month_stats": stats})
     except Exception as e:
-        app.logger.error(f"Error getting team last month stats: {e}")
+        app.logger.error("Error getting team last month stats: %s", e)
         abort(500, description="Failed to get last month statistics")
 
 
@@ -5224,8 +5552,7 @@ def get_user_daily_stats(user_slug: str, year: int, month: int) -> List[Dict[str
                 summary_path = os.path.join(user_dir, monthly_folder, "summary.json")
                 
                 if os.path.exists(summary_path):
-                    with open(summary_path, "r", encoding="utf-8") as f:
-                        summary_data = json.load(f)
+                    summary_data = load_json(summary_path)
                     
                     per_date_data = summary_data.get("per_date", {})
                     
@@ -5273,7 +5600,7 @@ def get_team_daily_stats(team_id: str, year: int, month: int) -> List[Dict[str,
         with open(teams_file_path, "r", encoding="utf-8") as f:
             teams = json.load(f)
     except (json.JSONDecodeError, IOError) as e:
-        print(f"Error reading teams file: {e}")
+        app.logger.warning("Error reading teams file: %s", e)
         return []
     
     if team_id not in teams:
@@ -5319,7 +5646,7 @@ def api_user_daily_stats(user_slug: str, year: int, month: int):
         return jsonify({"daily_stats": stats})
     except Exception as e:
         import traceback
-        app.logger.error(f"Error getting user daily stats for {user_slug} {year}-{month}: {e}")
+        app.logger.error("Error getting user daily stats for %s %s-%s: %s", user_slug, year, month, e)
         app.logger.error(traceback.format_exc())
         abort(500, description=f"Failed to get daily statistics: {str(e)}")
 
@@ -5348,7 +5675,7 @@ def api_user_daily_stats_year(user_slug: str, year: int):
         return jsonify({"daily_stats": result})
     except Exception as e:
         import traceback
-        app.logger.error(f"Error getting yearly daily stats for {user_slug} {year}: {e}")
+        app.logger.error("Error getting yearly daily stats for %s %s: %s", user_slug, year, e)
         app.logger.error(traceback.format_exc())
         abort(500, description=f"Failed to get yearly daily statistics: {str(e)}")
 
@@ -5360,7 +5687,7 @@ def api_team_daily_stats(team_id: str, year: int, month: int):
         stats = get_team_daily_stats(team_id, year, month)
         return jsonify({"daily_stats": stats})
     except Exception as e:
-        app.logger.error(f"Error getting team daily stats: {e}")
+        app.logger.error("Error getting team daily stats: %s", e)
         abort(500, description="Failed to get daily statistics")
 
 
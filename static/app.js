@@ -9044,71 +9044,75 @@ async function runUpdate() {
       
       eventSource.onmessage = function(event) {
         try {
-          const data = JSON.parse(event.data);
+          // Progress messages arrive batched as an array
+          const payload = JSON.parse(event.data);
+          const messages = Array.isArray(payload) ? payload : [payload];
           
-          switch (data.type) {
-            case 'info':
-              addUpdateLogMessage(data.message, "info");
-              // Update progress if provided
-              if (data.progress !== undefined) {
-                updateState.progress = data.progress;
-                updateProgressUI();
-              }
-              break;
-            case 'warning':
-              addUpdateLogMessage(data.message, "warning");
-              if (data.progress !== undefined) {
-                updateState.progress = data.progress;
-                updateProgressUI();
-              }
-              break;
-            case 'success':
-              addUpdateLogMessage(data.message, "success");
-              if (data.progress !== undefined) {
-                updateState.progress = data.progress;
-                updateProgressUI();
-              }
-              break;
-            case 'error':
-              addUpdateLogMessage(data.message, "error");
-              if (data.progress !== undefined) {
-                updateState.progress = data.progress;
+          for (const data of messages) {
+            switch (data.type) {
+              case 'info':
+                addUpdateLogMessage(data.message, "info");
+                // Update progress if provided
+                if (data.progress !== undefined) {
+                  updateState.progress = data.progress;
+                  updateProgressUI();
+                }
+                break;
+              case 'warning':
+                addUpdateLogMessage(data.message, "warning");
+                if (data.progress !== undefined) {
+                  updateState.progress = data.progress;
+                  updateProgressUI();
+                }
+                break;
+              case 'success':
+                addUpdateLogMessage(data.message, "success");
+                if (data.progress !== undefined) {
+                  updateState.progress = data.progress;
+                  updateProgressUI();
+                }
+                break;
+              case 'error':
+                addUpdateLogMessage(data.message, "error");
+                if (data.progress !== undefined) {
+                  updateState.progress = data.progress;
+                  updateProgressUI();
+                }
+                eventSource.close();
+                reject(new Error(data.message));
+                return;
+              case 'complete':
+                eventSource.close();
+                updateState.progress = 100;
                 updateProgressUI();
-              }
-              eventSource.close();
-              reject(new Error(data.message));
-              return;
-            case 'complete':
-              eventSource.close();
-              updateState.progress = 100;
-              updateProgressUI();
-              addUpdateLogMessage("🎉 Update process completed successfully!", "success");
-              
-              // Show completion actions
-              const actions = $("update-actions");
-              actions.style.display = "flex";
+                addUpdateLogMessage("🎉 Update process completed successfully!", "success");
               
-              // Set up action handlers
-              $("update-close").onclick = () => {
-                closeUpdateModal();
-              };
+                // Show completion actions
+                const actions = $("update-actions");
+                actions.style.display = "flex";
               
-              $("refresh-page").onclick = () => {
-                window.location.reload();
-              };
+                // Set up action handlers
+                $("update-close").onclick = () => {
+                  closeUpdateModal();
+                };
               
-              // Add download logs handler
-              if ($("download-update-logs")) {
-                $("download-update-logs").onclick = () => {
-                  window.open('/api/update/logs/download', '_blank');
+                $("refresh-page").onclick = () => {
+                  window.location.reload();
                 };
-              }
               
-              resolve({ success: true });
-              break;
-            case 'heartbeat':
-              // Ignore heartbeat messages
-              break;
+                // Add download logs handler
+                if ($("download-update-logs")) {
+                  $("download-update-logs").onclick = () => {
+                    window.open('/api/update/logs/download', '_blank');
+                  };
+                }
+              
+                resolve({ success: true });
+                break;
+              case 'heartbeat':
+                // Ignore heartbeat messages
+                break;
+            }
           }
         } catch (e) {
           console.error("Error parsing SSE message:", e);
@@ -9220,25 +9224,29 @@ async function runAnalysisScript() {
       
       eventSource.onmessage = function(event) {
         try {
-          const data = JSON.parse(event.data);
+          // Progress messages arrive batched as an array
+          const payload = JSON.parse(event.data);
+          const messages = Array.isArray(payload) ? payload : [payload];
           
-          switch (data.type) {
-            case 'info':
-              addUpdateLogMessage(data.message, "info");
-              break;
-            case 'success':
-              addUpdateLogMessage(data.message, "success");
-              break;
-            case 'error':
-              addUpdateLogMessage(data.message, "error");
-              break;
-            case 'complete':
-              eventSource.close();
-              resolve({ success: true });
-              break;
-            case 'heartbeat':
-              // Ignore heartbeat messages
-              break;
+          for (const data of messages) {
+            switch (data.type) {
+              case 'info':
+                addUpdateLogMessage(data.message, "info");
+                break;
+              case 'success':
+                addUpdateLogMessage(data.message, "success");
+                break;
+              case 'error':
+                addUpdateLogMessage(data.message, "error");
+                break;
+              case 'complete':
+                eventSource.close();
+                resolve({ success: true });
+                break;
+              case 'heartbeat':
+                // Ignore heartbeat messages
+                break;
+            }
           }
         } catch (e) {
           console.error("Error parsing SSE message:", e);